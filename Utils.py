@@ -1,10 +1,33 @@
 import tkinter as tk
 import os
+import itertools
+import sqlite3
+import threading
 import cv2
+import numpy as np
+from collections import OrderedDict
 from tkinter import filedialog, ttk
 from PIL import Image, ImageTk
 from save_txt import YOLOBBoxSaver
 from model_predict import YOLODetector
+from image_cache import get_image_cache
+from viewport import Viewport
+from spatial_index import GridIndex
+from annotation_store import AnnotationStore
+from image_pyramid import get_pyramid_cache
+from tile_source import get_tile_source
+from input_scheduler import MotionScheduler
+from bbox_overlay import visible_box_mask, render_box_overlay
+from image_prefetch import ImagePrefetcher
+from windowing import HIGH_DEPTH_MODES, get_window_lut_cache, default_window
+from label_index import LabelIndex, label_path_for, parse_yolo_label
+from annotation_writer import AnnotationWriter
+from edit_journal import EditJournal
+from project_db import ProjectDatabase, STATUS_LABELED, STATUS_REVIEWED
+from directory_scanner import IMAGE_EXTENSIONS, PathList, DirectoryScanner
+from image_manifest import ImageManifest, is_cache_path
+from video_source import VIDEO_EXTENSIONS, is_video, parse_frame_path, get_video_source
+from frame_sampler import SAMPLE_MODES, FrameSampler
 from tkinter import simpledialog, messagebox
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
@@ -64,24 +87,8 @@ class ImageViewer:
         self.canvas = tk.Canvas(self.main_frame, highlightthickness=0)
         self.canvas.pack(expand=True, fill='both')
         
-        # bbox 관련 변수
-        self.start_x = None
-        self.start_y = None
-        self.current_bbox = None
-        self.image_bboxes = {}  # 이미지 경로를 키로 사용하여 bbox 저장
-        self.selected_bbox = None
-        self.selected_bbox_id = None
-        self.drag_start_x = None
-        self.drag_start_y = None
-
-        # YOLO 학습용 BBOX
-        self.yolo_bboxes = {}
-        
-        # 이미지 관련 변수
-        self.images = []
-        self.current_index = 0
-        self.current_image_tk = None
-        self.image_position = (0, 0)  # 이미지의 좌상단 위치
+        # 편집/렌더링 상태
+        self.initialize_state()
         
         # 키 이벤트 바인딩
         # self.root.bind('<n>', self.next_image)
@@ -93,16 +100,35 @@ class ImageViewer:
         self.root.bind('<s>', self.select_mode)  
         self.root.bind('<d>', self.draw_mode)  
         self.root.bind('<a>', self.auto_detect)  
+        self.root.bind('<w>', self.reset_window)  # 윈도우/레벨 초기화
+        self.root.bind('<r>', self.toggle_review_status)  # 검수 완료 표시 (프로젝트 DB)
+        self.root.bind('<g>', self.go_to_image)  # 번호로 이미지/프레임 이동
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)  # 종료 시 저장 큐 비우기
 
         # 마우스 이벤트 바인딩
         self.canvas.bind('<ButtonPress-1>', self.on_mouse_down)
         self.canvas.bind('<B1-Motion>', self.on_mouse_drag)
         self.canvas.bind('<ButtonRelease-1>', self.on_mouse_up)
+        self.canvas.bind('<Motion>', self.on_pointer_move)
         
         # 시작 버튼
         self.start_btn = ttk.Button(self.menu_frame, text="이미지 선택", 
                                   command=self.load_images)
         self.start_btn.pack(side='left', padx=5)
+        self.folder_btn = ttk.Button(self.menu_frame, text="폴더 선택",
+                                     command=self.load_folder)
+        self.folder_btn.pack(side='left', padx=5)
+        self.sample_btn = ttk.Button(self.menu_frame, text="프레임 추출",
+                                     command=self.sample_video_frames)
+        self.sample_btn.pack(side='left', padx=5)
+
+        # 프로젝트 DB 열기 / YOLO 라벨 내보내기
+        self.project_btn = ttk.Button(self.menu_frame, text="프로젝트 DB",
+                                      command=self.open_project_db)
+        self.project_btn.pack(side='left', padx=5)
+        self.export_btn = ttk.Button(self.menu_frame, text="YOLO 내보내기",
+                                     command=self.export_project_yolo)
+        self.export_btn.pack(side='left', padx=5)
     
         # 이미지 확대/축소 관련 변수 추가
         self.scale = 1.0
@@ -156,6 +182,11 @@ class ImageViewer:
         self.canvas.bind('<B2-Motion>', self.pan)
         self.canvas.bind('<ButtonRelease-2>', self.end_pan)
 
+        # 윈도우/레벨 (16비트, DICOM)
+        self.canvas.bind('<Button-3>', self.start_window_drag)
+        self.canvas.bind('<B3-Motion>', self.window_drag)
+        self.canvas.bind('<ButtonRelease-3>', self.end_window_drag)
+
         # 자동 검출 버튼
         self.detect_btn = ttk.Button(self.button_frame, text="자동 검출", 
                                     command=self.auto_detect)
@@ -181,6 +212,137 @@ class ImageViewer:
         }
 
 
+    def initialize_state(self):
+        """
+        위젯과 무관한 편집/렌더링 상태 초기화
+
+        ImageViewer와 ModernUIApp(ImageViewer.__init__을 건너뜀)이 함께 호출하므로
+        새 상태는 여기에만 추가함
+        """
+        # bbox 관련 변수
+        self.start_x = None
+        self.start_y = None
+        self.current_bbox = None
+        self.annotations = {}  # 이미지 경로 -> AnnotationStore (원본 픽셀 좌표, YOLO 포맷은 변환해서 사용)
+        self.selected_bbox_key = None  # 선택된 bbox의 id
+        self.bbox_key_counter = itertools.count()  # bbox 고유 id 생성기
+        self.spatial_indexes = {}  # 이미지 경로 -> GridIndex (bbox 클릭 판정용)
+        self.selected_bbox = None
+        self.selected_bbox_id = None
+        self.drag_start_x = None
+        self.drag_start_y = None
+
+        # 리사이즈 관련
+        self.resize_handles = []  # 선택된 bbox의 조절점 (한 번 만들어 두고 위치만 이동)
+        self.handle_size = 6
+        self.resizing = False
+        self.resize_handle = None
+        self.resize_corner = None
+
+        # 드래그 중 bbox 원본 좌표 갱신 간격 (마우스를 놓으면 바로 반영)
+        self.bbox_update_interval = 50  # ms
+        self.bbox_update_id = None
+        self.pending_bbox_update = None
+
+        # 드래그/패닝 이동 이벤트 합치기 (초당 motion_rate번까지만 처리)
+        self.motion_rate = 60
+        self.drag_scheduler = MotionScheduler(self.root, self.process_mouse_drag, self.motion_rate)
+        self.pan_scheduler = MotionScheduler(self.root, self.process_pan, self.motion_rate)
+
+        # bbox가 많을 때 LOD 모드 (오버레이 이미지 한 장 + 커서 근처만 캔버스 항목)
+        self.lod_box_threshold = 300  # 화면에 보이는 bbox가 이보다 많으면 LOD 모드
+        self.lod_interactive_radius = 60  # 캔버스 항목으로 만들 커서 주변 반경 (px)
+        self.lod_max_interactive = 50
+        self.lod_active = False
+        self.overlay_item = None
+        self.overlay_image_tk = None
+        self.overlay_excluded_key = None  # 오버레이에서 제외한 (선택된) bbox id
+        self.lod_summary_item = None
+        self.pointer_position = None
+        self.hover_scheduler = MotionScheduler(self.root, self.process_pointer_move, self.motion_rate)
+
+        # 16비트/DICOM 윈도우/레벨 (오른쪽 버튼 드래그로 조절, LUT는 설정별로 캐시)
+        self.window_levels = {}  # 이미지 경로 -> (center, width)
+        self.window_lut_cache = get_window_lut_cache()
+        self.window_drag_start = None
+        self.window_scheduler = MotionScheduler(self.root, self.process_window_drag, self.motion_rate)
+
+        # 디코딩된 이미지 캐시 (프로세스 전역 공유)
+        self.image_cache = get_image_cache()
+
+        # 기존 YOLO 라벨(.txt) 백그라운드 읽기
+        self.label_index = LabelIndex(self.image_cache)
+        self.labels_loaded = set()  # 라벨 파일을 이미 반영한 이미지 경로
+        self.label_poll_interval = 50  # 읽은 라벨을 Tk 스레드에서 반영하는 간격 (ms)
+        self.label_poll_id = None
+
+        # 라벨 파일 백그라운드 저장 (같은 파일은 마지막 내용만 저장)
+        self.annotation_writer = AnnotationWriter()
+        self.save_poll_interval = 100  # 저장 결과를 상태바에 반영하는 간격 (ms)
+        self.save_poll_id = None
+
+        # 저장 전 편집 내역 저널 (비정상 종료 시 복구, 이미지 폴더의 .bbox_cache/journal)
+        self.edit_journal = None
+        self.journal_checkpoint_interval = 1000  # 체크포인트 사이 최대 편집 기록 수
+
+        # 선택적 SQLite 프로젝트 DB (열려 있으면 라벨을 .txt 대신 DB에서 읽고 저장)
+        self.project_db = None
+
+        # 폴더 열기 (하위 폴더까지 백그라운드에서 읽으며 이미지 목록을 늘려 감)
+        self.directory_scanner = DirectoryScanner(IMAGE_EXTENSIONS + VIDEO_EXTENSIONS)
+        self.scan_poll_interval = 50  # 찾은 이미지를 목록에 반영하는 간격 (ms)
+        self.scan_poll_id = None
+
+        # 데이터셋 폴더의 이미지 헤더 매니페스트 (.bbox_cache/manifest.sqlite)
+        self.manifest = None
+
+        # 동영상 프레임 소스 (프레임 경로 "video.mp4#000012"를 이미지처럼 사용)
+        self.video_source = get_video_source()
+        self.pending_videos = []  # 프레임 인덱스를 만드는 중인 동영상 (만들어지면 목록 뒤에 추가)
+        self.video_poll_interval = 100  # ms
+        self.video_poll_id = None
+
+        # 동영상 프레임 추출 설정 (장면 변화/N 프레임/시간 간격)
+        self.frame_sample_mode = 'scene'
+        self.frame_sample_every_n = 30
+        self.frame_sample_interval = 1.0  # 초
+        self.frame_sample_threshold = 0.15
+        self.frame_sampler = None  # 실행 중인 FrameSampler
+
+        # 이미지 관련 변수
+        self.images = PathList()
+        self.current_index = 0
+        self.current_image_tk = None
+        self.image_position = (0, 0)  # 이미지의 좌상단 위치
+
+        # 이미지별 배치 정보 (이미지 경로 -> Viewport)
+        self.viewports = {}
+
+        # 캔버스 항목 (show_current_image에서 지우지 않고 재사용)
+        self.image_item = None
+        self.displayed_image = None
+        self.bbox_items = {}  # bbox id -> (사각형 id, 라벨 id)
+        self.selected_bbox_outline = None
+
+        # 확대 시 화면에 보이는 영역만 잘라서 그리기
+        self.crop_rendering = True
+        self.cropped_render = False
+
+        # 큰 이미지용 다중 해상도 피라미드 (디스크 캐시)
+        self.pyramid_cache = get_pyramid_cache()
+        self.tile_source = get_tile_source()  # 초대형 이미지 확대 시 보이는 타일만 읽음
+
+        # 확대/축소, 패닝 중 단계적 렌더링 (빠른 미리보기 -> 고화질)
+        self.preview_resample = Image.Resampling.BILINEAR
+        self.hq_render_delay = 150  # 입력이 멈춘 뒤 고화질로 그리기까지 대기 시간 (ms)
+        self.preview_render_id = None
+        self.hq_render_id = None
+
+        # 앞뒤 이미지 미리 읽기 (prefetch_count: 앞뒤로 준비할 이미지 수)
+        self.prefetch_count = 2
+        self.prefetcher = ImagePrefetcher(max_workers=2)
+        self.photo_cache = OrderedDict()  # (경로, 너비, 높이, 리샘플링) -> PhotoImage
+
     def change_mode(self, event=None):
         self.mode = self.mode_var.get()
         if self.mode == "select":
@@ -193,19 +355,22 @@ class ImageViewer:
 
     def deselect_bbox(self):
         if self.selected_bbox_id:
-            # 선택된 bbox의 빨간색으로 변경
-            self.canvas.itemconfig(self.selected_bbox_id, outline='red', width=1)
-            # 조절점 삭제
-            self.delete_resize_handles()
+            # 선택된 bbox를 원래 색상으로 되돌림
+            self.canvas.itemconfig(self.selected_bbox_id,
+                                   outline=self.selected_bbox_outline or 'red', width=1)
+            # 조절점 숨기기
+            self.hide_resize_handles()
             self.selected_bbox = None
             self.selected_bbox_id = None
+            self.selected_bbox_outline = None
+            self.selected_bbox_key = None
+            self.refresh_bbox_overlay()
 
-    def create_resize_handles(self, bbox_coords):
-        """bbox의 꼭짓점에 조절점 생성"""
+    def handle_coords(self, bbox_coords):
+        """bbox 꼭짓점별 조절점 사각형 좌표 [(pos, (x1, y1, x2, y2)), ...]"""
         x1, y1, x2, y2 = bbox_coords
-        handle_size = 6
-        self.resize_handles = []
-        
+        half = self.handle_size / 2
+
         # 꼭짓점 위치 계산
         corners = [
             (x1, y1, 'nw'),  # 좌상단
@@ -213,143 +378,427 @@ class ImageViewer:
             (x1, y2, 'sw'),  # 좌하단
             (x2, y2, 'se')   # 우하단
         ]
-        
-        for x, y, pos in corners:
+        return [(pos, (x - half, y - half, x + half, y + half)) for x, y, pos in corners]
+
+    def create_resize_handles(self, bbox_coords):
+        """
+        bbox의 꼭짓점에 조절점 표시
+
+        조절점 캔버스 항목은 한 번만 생성하고, 이후에는 위치만 옮겨서 다시 보이게 함
+        """
+        if self.resize_handles:
+            self.move_resize_handles(bbox_coords)
+            for handle in self.resize_handles:
+                self.canvas.itemconfig(handle, state='normal')
+                self.canvas.tag_raise(handle)
+            return
+
+        for pos, coords in self.handle_coords(bbox_coords):
             handle = self.canvas.create_rectangle(
-                x - handle_size/2, y - handle_size/2,
-                x + handle_size/2, y + handle_size/2,
+                *coords,
                 fill='white', outline='blue',
                 tags=f'handle_{pos}'
             )
             self.resize_handles.append(handle)
 
-    def delete_resize_handles(self):
-        """조절점 삭제"""
-        if hasattr(self, 'resize_handles'):
-            for handle in self.resize_handles:
-                self.canvas.delete(handle)
-            self.resize_handles = []
+    def move_resize_handles(self, bbox_coords):
+        """기존 조절점의 위치만 갱신 (드래그 중 새 항목을 만들지 않음)"""
+        for handle, (_, coords) in zip(self.resize_handles, self.handle_coords(bbox_coords)):
+            self.canvas.coords(handle, *coords)
+
+    def hide_resize_handles(self):
+        """조절점 숨기기 (다음 선택 때 다시 사용)"""
+        for handle in self.resize_handles:
+            self.canvas.itemconfig(handle, state='hidden')
+
+    def schedule_bbox_update(self, canvas_coords, clip=False):
+        """
+        드래그 중인 bbox의 원본 좌표 갱신 예약
+
+        캔버스 항목은 매 이벤트마다 옮기고, 좌표 변환 및 저장소/공간 인덱스 갱신은
+        bbox_update_interval 간격으로 마지막 위치만 한 번 반영함
+        """
+        self.pending_bbox_update = (self.selected_bbox_key, tuple(canvas_coords), clip)
+        if self.bbox_update_id is None:
+            self.bbox_update_id = self.root.after(self.bbox_update_interval, self.flush_bbox_update)
+
+    def set_motion_rate(self, rate):
+        """드래그/패닝 이벤트 처리 속도 (초당 횟수) 변경"""
+        self.motion_rate = rate
+        self.drag_scheduler.rate = rate
+        self.pan_scheduler.rate = rate
+        self.hover_scheduler.rate = rate
+        self.window_scheduler.rate = rate
+
+    def flush_bbox_update(self):
+        """예약된 bbox 좌표 갱신을 바로 반영 (마우스를 놓을 때 호출)"""
+        if self.bbox_update_id is not None:
+            self.root.after_cancel(self.bbox_update_id)
+            self.bbox_update_id = None
+        if self.pending_bbox_update is None:
+            return
+
+        bbox_key, canvas_coords, clip = self.pending_bbox_update
+        self.pending_bbox_update = None
+
+        # 캔버스 좌표를 원본 이미지 좌표로 변환 (크기 조절은 이미지 경계 안으로 조정)
+        viewport = self.get_viewport()
+        image_coords = viewport.canvas_to_image(canvas_coords)
+        if clip:
+            image_coords = viewport.clip_to_image(image_coords)
+        x1, y1, x2, y2 = image_coords.tolist()
+        self.update_bbox(bbox_key, x1, y1, x2, y2)
 
     def delete_selected_bbox(self, event=None):
-        if self.selected_bbox and self.selected_bbox_id:
-            current_image = self.images[self.current_index]
-            if current_image in self.image_bboxes:
-                # 현재 선택된 bbox의 캔버스 좌표
-                coords = self.canvas.coords(self.selected_bbox_id)
+        if self.selected_bbox and self.selected_bbox_id and self.selected_bbox_key is not None:
+            # 선택된 bbox를 id로 바로 삭제 (bbox 데이터와 캔버스 항목)
+            self.remove_bbox(self.selected_bbox_key)
+            self.remove_bbox_item(self.selected_bbox_key)
 
-                # 이미지 크기와 스케일 정보
-                image = Image.open(current_image)
-                orig_width, orig_height = image.size
+            self.hide_resize_handles()
+            self.selected_bbox = None
+            self.selected_bbox_id = None
+            self.selected_bbox_outline = None
+            self.selected_bbox_key = None
+
+    def new_bbox_key(self):
+        """새 bbox에 부여할 고유 id 생성"""
+        return next(self.bbox_key_counter)
+
+    def get_annotations(self, image_path=None, orig_size=None):
+        """이미지별 bbox 저장소(AnnotationStore) 반환, 없으면 생성"""
+        if image_path is None:
+            image_path = self.images[self.current_index]
+        annotations = self.annotations.get(image_path)
+        if annotations is None:
+            if orig_size is None:
+                orig_size = self.get_viewport(image_path).orig_size
+            annotations = AnnotationStore(orig_size)
+            self.annotations[image_path] = annotations
+        return annotations
+
+    def add_bbox(self, class_id, x1, y1, x2, y2, image_path=None, orig_size=None):
+        """
+        bbox 추가 (원본 좌표로 저장, YOLO 포맷은 저장소에서 변환)
 
-                if self.fullscreen:
-                    screen_width = self.root.winfo_screenwidth() 
-                    screen_height = self.root.winfo_screenheight()
-                else:
-                    screen_width = self.root.winfo_width()
-                    screen_height = self.root.winfo_height() - self.menu_frame.winfo_height()
-
-                scale_x = screen_width / orig_width
-                scale_y = screen_height / orig_height
-                scale_factor = min(scale_x, scale_y) * self.scale
-                x_offset = self.image_position[0]
-                y_offset = self.image_position[1]
-
-                # 캔버스 좌표를 원본 이미지 좌표로 변환
-                x1 = (coords[0] - x_offset) / scale_factor
-                y1 = (coords[1] - y_offset) / scale_factor 
-                x2 = (coords[2] - x_offset) / scale_factor
-                y2 = (coords[3] - y_offset) / scale_factor
-
-                # 저장된 bbox 목록에서 가장 가까운 것을 찾아 삭제
-                closest_index = None
-                min_diff = float('inf')
-
-                for i, bbox in enumerate(self.image_bboxes[current_image]):
-                    # class_id를 제외한 좌표 비교
-                    diff = abs(bbox[1] - x1) + abs(bbox[2] - y1) + \
-                            abs(bbox[3] - x2) + abs(bbox[4] - y2)
-                    if diff < min_diff:
-                        min_diff = diff
-                        closest_index = i
-
-                # 가장 가까운 bbox 삭제
-                if closest_index is not None:
-                    del self.image_bboxes[current_image][closest_index]
-                    # yolo_bboxes도 함께 삭제
-                    if current_image in self.yolo_bboxes:
-                        del self.yolo_bboxes[current_image][closest_index]
-
-                # 캔버스에서 bbox 삭제
-                self.canvas.delete(self.selected_bbox_id)
-                self.delete_resize_handles()
-                self.selected_bbox = None
-                self.selected_bbox_id = None
+        Returns:
+            int: 추가된 bbox의 id
+        """
+        if image_path is None:
+            image_path = self.images[self.current_index]
+
+        bbox_key = self.new_bbox_key()
+        annotations = self.get_annotations(image_path, orig_size)
+        journal = self.get_edit_journal(image_path, annotations)
+        annotations.add(bbox_key, class_id, (x1, y1, x2, y2))
+        if journal is not None:
+            journal.record_add(image_path, annotations.image_size, bbox_key, class_id, (x1, y1, x2, y2))
+        self.get_spatial_index(image_path, annotations.image_size).insert(bbox_key, (x1, y1, x2, y2))
+        return bbox_key
+
+    def update_bbox(self, bbox_key, x1, y1, x2, y2, image_path=None):
+        """이동/크기 조절된 bbox의 원본 좌표 갱신"""
+        if image_path is None:
+            image_path = self.images[self.current_index]
+        annotations = self.annotations.get(image_path)
+        if annotations is None or bbox_key not in annotations:
+            return
+
+        journal = self.get_edit_journal(image_path, annotations)
+        annotations.update(bbox_key, (x1, y1, x2, y2))
+        self.get_spatial_index(image_path).update(bbox_key, (x1, y1, x2, y2))
+        if journal is not None:
+            journal.record_update(image_path, bbox_key, (x1, y1, x2, y2))
+
+    def remove_bbox(self, bbox_key, image_path=None):
+        """bbox 삭제"""
+        if image_path is None:
+            image_path = self.images[self.current_index]
+        if image_path in self.annotations:
+            journal = self.get_edit_journal(image_path, self.annotations[image_path])
+            self.annotations[image_path].remove(bbox_key)
+            if journal is not None:
+                journal.record_remove(image_path, bbox_key)
+        if image_path in self.spatial_indexes:
+            self.spatial_indexes[image_path].remove(bbox_key)
+
+    def get_edit_journal(self, image_path, annotations):
+        """
+        편집을 기록할 저널 반환 (저널이 없으면 None)
+
+        이미지를 처음 편집하는 경우 라벨 파일에서 읽은 bbox도 복구되도록
+        편집 전 bbox 전체를 먼저 기록함
+        """
+        journal = self.edit_journal
+        if journal is not None and not journal.is_tracking(image_path):
+            journal.record_image(image_path, annotations.image_size, annotations.items())
+        return journal
+
+    def get_spatial_index(self, image_path=None, orig_size=None):
+        """이미지별 bbox 공간 인덱스 반환 (없으면 저장된 bbox로 생성)"""
+        if image_path is None:
+            image_path = self.images[self.current_index]
+        spatial_index = self.spatial_indexes.get(image_path)
+        if spatial_index is None:
+            if orig_size is None:
+                orig_size = self.get_viewport(image_path).orig_size
+            spatial_index = GridIndex.for_image(orig_size)
+            if image_path in self.annotations:
+                for bbox_key, bbox in self.annotations[image_path].items():
+                    spatial_index.insert(bbox_key, bbox[1:])
+            self.spatial_indexes[image_path] = spatial_index
+        return spatial_index
 
     def find_closest_bbox(self, x, y):
-        """가장 가까운 bbox와 그 index를 찾아 반환"""
+        """클릭 위치를 포함하는 bbox 중 가장 작은 것의 캔버스 좌표, 캔버스 항목 id, bbox id 반환"""
         if not self.images or self.current_index >= len(self.images):
             return None, None, None
 
         current_image = self.images[self.current_index]
-        if current_image not in self.image_bboxes:
+        if not self.annotations.get(current_image):
             return None, None, None
 
-        # 현재 스케일 및 오프셋 계산
-        image = Image.open(current_image)
-        orig_width, orig_height = image.size
-        
-        if self.fullscreen:
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-        else:
-            screen_width = self.root.winfo_width()
-            screen_height = self.root.winfo_height() - self.menu_frame.winfo_height()
-        
-        scale_x = screen_width / orig_width
-        scale_y = screen_height / orig_height
-        base_scale = min(scale_x, scale_y)
-        scale_factor = base_scale * self.scale
-        x_offset = self.image_position[0]
-        y_offset = self.image_position[1]
-
-        # 클릭한 위치의 캔버스 좌표를 원본 이미지 좌표로 변환
-        clicked_x = (x - x_offset) / scale_factor
-        clicked_y = (y - y_offset) / scale_factor
-
-        closest_bbox = None
-        closest_bbox_id = None
-        closest_index = None
-
-        # 저장된 bbox들과 비교
-        for i, bbox_data in enumerate(self.image_bboxes[current_image]):
-            _, x1, y1, x2, y2 = bbox_data
-            
-            # bbox의 캔버스 좌표 계산
-            canvas_x1 = x_offset + (x1 * scale_factor)
-            canvas_y1 = y_offset + (y1 * scale_factor)
-            canvas_x2 = x_offset + (x2 * scale_factor)
-            canvas_y2 = y_offset + (y2 * scale_factor)
-
-            # 클릭 위치가 bbox 내부에 있는지 확인
-            if (canvas_x1 <= x <= canvas_x2 and canvas_y1 <= y <= canvas_y2):
-                # 캔버스의 해당 bbox 찾기
-                for bbox_id in self.canvas.find_all():
-                    if self.canvas.type(bbox_id) == "rectangle":
-                        coords = self.canvas.coords(bbox_id)
-                        if coords and abs(coords[0] - canvas_x1) < 1 and \
-                                abs(coords[1] - canvas_y1) < 1 and \
-                                abs(coords[2] - canvas_x2) < 1 and \
-                                abs(coords[3] - canvas_y2) < 1:
-                            return coords, bbox_id, i
+        # 클릭 위치를 원본 이미지 좌표로 변환 후 공간 인덱스로 조회
+        image_x, image_y = self.get_viewport().canvas_to_image([x, y]).tolist()
+        for bbox_key in self.get_spatial_index(current_image).query_point(image_x, image_y):
+            # bbox id로 캔버스 항목을 바로 찾음 (LOD 모드에서 항목이 없으면 생성)
+            if bbox_key not in self.bbox_items:
+                self.add_bbox_item(bbox_key)
+            bbox_id = self.bbox_items[bbox_key][0]
+            return self.canvas.coords(bbox_id), bbox_id, bbox_key
 
         return None, None, None
 
     def clear_bboxes(self):
         if self.images and self.current_index < len(self.images):
             current_image = self.images[self.current_index]
-            if current_image in self.image_bboxes:
-                self.image_bboxes[current_image] = []
-            self.show_current_image()  # 이미지 다시 그리기
+            if current_image in self.annotations:
+                journal = self.get_edit_journal(current_image, self.annotations[current_image])
+                self.annotations[current_image].clear()
+                if journal is not None:
+                    journal.record_clear(current_image)
+            if current_image in self.spatial_indexes:
+                self.spatial_indexes[current_image].clear()
+            self.deselect_bbox()
+            self.rebuild_bbox_items()  # bbox 항목만 다시 그리기
+
+    def create_bbox_item(self, bbox, canvas_coords):
+        """bbox 하나의 사각형과 라벨을 캔버스에 생성하고 (사각형 id, 라벨 id) 반환"""
+        scaled_x1, scaled_y1, scaled_x2, scaled_y2 = canvas_coords
+        class_id = bbox[0]
+        color = self.get_bbox_color(class_id)
+        label_text = self.class_names[class_id]
+
+        rect_id = self.canvas.create_rectangle(
+            scaled_x1, scaled_y1, scaled_x2, scaled_y2,
+            outline=color, width=1, tags='bbox'
+        )
+        text_id = self.canvas.create_text(
+            scaled_x1, scaled_y1 - 5,
+            text=label_text,
+            fill=color,
+            anchor='sw',
+            font=('Arial', 8),
+            tags='bbox_label'
+        )
+        return rect_id, text_id
+
+    def rebuild_bbox_items(self):
+        """현재 이미지의 bbox 캔버스 항목을 모두 다시 생성 (이미지 변경, 전체 삭제, 자동 검출 시)"""
+        self.canvas.delete('bbox', 'bbox_label')
+        self.bbox_items = {}
+        if self.selected_bbox_id:
+            self.flush_bbox_update()
+            self.hide_resize_handles()
+            self.selected_bbox = None
+            self.selected_bbox_id = None
+            self.selected_bbox_outline = None
+            self.selected_bbox_key = None
+
+        annotations = None
+        if self.images and self.current_index < len(self.images):
+            annotations = self.annotations.get(self.images[self.current_index])
+        if not annotations:
+            self.set_lod_active(False)
+            return
+
+        # 저장소 배열 전체를 한 번에 캔버스 좌표로 변환
+        canvas_boxes = self.get_viewport().image_to_canvas(annotations.pixel_boxes)
+        if self.set_lod_active(self.needs_lod(canvas_boxes)):
+            # bbox가 많으면 오버레이 이미지 한 장으로 그리고 커서 근처만 캔버스 항목으로 생성
+            self.render_bbox_overlay(annotations, canvas_boxes)
+            self.update_interactive_items()
+            return
+
+        class_ids = annotations.class_ids.tolist()
+        for bbox_key, class_id, canvas_coords in zip(annotations.keys(), class_ids, canvas_boxes.tolist()):
+            self.bbox_items[bbox_key] = self.create_bbox_item((class_id,), canvas_coords)
+
+    def update_bbox_items(self):
+        """확대/축소, 패닝 후 기존 bbox 캔버스 항목의 위치만 갱신"""
+        annotations = self.annotations.get(self.images[self.current_index])
+        bbox_keys = annotations.keys() if annotations else []
+        if not bbox_keys:
+            if self.bbox_items or self.lod_active:
+                self.rebuild_bbox_items()
+            return
+
+        canvas_boxes = self.get_viewport().image_to_canvas(annotations.pixel_boxes)
+        if self.needs_lod(canvas_boxes) != self.lod_active:
+            self.rebuild_bbox_items()
+            return
+
+        if self.lod_active:
+            # 오버레이는 새 배치로 다시 그리고, 남아 있는 캔버스 항목만 위치 갱신
+            self.render_bbox_overlay(annotations, canvas_boxes)
+            for bbox_key in list(self.bbox_items):
+                if bbox_key not in annotations:
+                    self.remove_bbox_item(bbox_key)
+                    continue
+                x1, y1, x2, y2 = canvas_boxes[annotations.row(bbox_key)].tolist()
+                rect_id, text_id = self.bbox_items[bbox_key]
+                self.canvas.coords(rect_id, x1, y1, x2, y2)
+                self.canvas.coords(text_id, x1, y1 - 5)
+            self.update_interactive_items()
+        else:
+            if len(bbox_keys) != len(self.bbox_items) or not self.bbox_items.keys() >= set(bbox_keys):
+                self.rebuild_bbox_items()
+                return
+            for bbox_key, (x1, y1, x2, y2) in zip(bbox_keys, canvas_boxes.tolist()):
+                rect_id, text_id = self.bbox_items[bbox_key]
+                self.canvas.coords(rect_id, x1, y1, x2, y2)
+                self.canvas.coords(text_id, x1, y1 - 5)
+
+        # 선택된 bbox의 조절점도 새 위치로 이동
+        if self.selected_bbox_id:
+            self.selected_bbox = tuple(self.canvas.coords(self.selected_bbox_id))
+            self.move_resize_handles(self.selected_bbox)
+
+    def needs_lod(self, canvas_boxes):
+        """화면에 보이는 bbox 수가 기준을 넘으면 LOD(오버레이) 모드 사용"""
+        if len(canvas_boxes) <= self.lod_box_threshold:
+            return False
+        visible = visible_box_mask(canvas_boxes, self.get_canvas_size())
+        return int(visible.sum()) > self.lod_box_threshold
+
+    def set_lod_active(self, active):
+        """LOD 모드 전환 (해제 시 오버레이와 요약 라벨 숨김)"""
+        self.lod_active = active
+        if not active:
+            if self.overlay_item is not None:
+                self.canvas.itemconfig(self.overlay_item, state='hidden')
+            if self.lod_summary_item is not None:
+                self.canvas.itemconfig(self.lod_summary_item, state='hidden')
+            self.overlay_image_tk = None
+            self.overlay_excluded_key = None
+        return active
+
+    def render_bbox_overlay(self, annotations, canvas_boxes):
+        """
+        화면에 보이는 bbox를 RGBA 오버레이 이미지 한 장으로 그림
+
+        선택된 bbox는 캔버스 항목으로 따로 그리므로 오버레이에서 제외하고,
+        개별 라벨 대신 클래스별 개수 요약 라벨 하나만 표시
+        """
+        canvas_size = self.get_canvas_size()
+        mask = visible_box_mask(canvas_boxes, canvas_size)
+        if self.selected_bbox_key in annotations:
+            mask[annotations.row(self.selected_bbox_key)] = False
+
+        class_ids = annotations.class_ids[mask].tolist()
+        colors = {class_id: self.get_bbox_color(class_id) for class_id in set(class_ids)}
+        overlay = render_box_overlay(canvas_boxes[mask], [colors[class_id] for class_id in class_ids],
+                                     canvas_size)
+        self.overlay_image_tk = ImageTk.PhotoImage(overlay)
+        self.overlay_excluded_key = self.selected_bbox_key
+
+        origin_x, origin_y = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        if self.overlay_item is None:
+            self.overlay_item = self.canvas.create_image(origin_x, origin_y, anchor='nw', tags='bbox_overlay')
+        self.canvas.coords(self.overlay_item, origin_x, origin_y)
+        self.canvas.itemconfig(self.overlay_item, image=self.overlay_image_tk, state='normal')
+        if self.image_item is not None:
+            self.canvas.tag_raise(self.overlay_item, self.image_item)
+
+        # 클래스별 개수 요약 라벨
+        counts = {}
+        for class_id in class_ids:
+            counts[class_id] = counts.get(class_id, 0) + 1
+        summary = ", ".join(f"{self.class_names[class_id]}: {count}"
+                            for class_id, count in sorted(counts.items()))
+        summary_text = f"bbox {len(class_ids)}개 ({summary})"
+        if self.lod_summary_item is None:
+            self.lod_summary_item = self.canvas.create_text(
+                origin_x + 10, origin_y + 10, anchor='nw',
+                fill='white', font=('Arial', 9), tags='bbox_summary'
+            )
+        self.canvas.coords(self.lod_summary_item, origin_x + 10, origin_y + 10)
+        self.canvas.itemconfig(self.lod_summary_item, text=summary_text, state='normal')
+        self.canvas.tag_raise(self.lod_summary_item)
+
+    def refresh_bbox_overlay(self):
+        """선택이 바뀌어 오버레이에서 제외할 bbox가 달라졌으면 다시 그림"""
+        if not self.lod_active or self.overlay_excluded_key == self.selected_bbox_key:
+            return
+        annotations = self.annotations.get(self.images[self.current_index])
+        if annotations:
+            canvas_boxes = self.get_viewport().image_to_canvas(annotations.pixel_boxes)
+            self.render_bbox_overlay(annotations, canvas_boxes)
+
+    def update_interactive_items(self):
+        """LOD 모드에서 커서 근처와 선택된 bbox만 캔버스 항목으로 유지"""
+        if not self.lod_active:
+            return
+        current_image = self.images[self.current_index]
+        annotations = self.annotations.get(current_image)
+        if not annotations:
+            return
+
+        wanted = set()
+        if self.pointer_position is not None:
+            # 커서 주변 영역을 원본 좌표로 변환해서 공간 인덱스로 조회
+            x, y = self.pointer_position
+            radius = self.lod_interactive_radius
+            query_box = self.get_viewport().canvas_to_image(
+                [x - radius, y - radius, x + radius, y + radius]).tolist()
+            nearby = self.get_spatial_index(current_image).query_rect(query_box)
+            wanted.update(nearby[:self.lod_max_interactive])
+        if self.selected_bbox_key in annotations:
+            wanted.add(self.selected_bbox_key)
+
+        for bbox_key in list(self.bbox_items):
+            if bbox_key not in wanted:
+                self.remove_bbox_item(bbox_key)
+        for bbox_key in wanted:
+            if bbox_key not in self.bbox_items:
+                self.add_bbox_item(bbox_key)
+
+    def on_pointer_move(self, event):
+        """커서 이동 (LOD 모드에서만 커서 근처 bbox 항목 갱신)"""
+        if self.lod_active:
+            self.hover_scheduler.submit(event)
+
+    def process_pointer_move(self, event):
+        self.pointer_position = (self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        self.update_interactive_items()
+
+    def add_bbox_item(self, bbox_key):
+        """새로 추가된 bbox 하나만 캔버스에 생성"""
+        bbox = self.annotations[self.images[self.current_index]].get(bbox_key)
+        canvas_coords = self.get_viewport().image_to_canvas(bbox[1:]).tolist()
+        self.bbox_items[bbox_key] = self.create_bbox_item(bbox, canvas_coords)
+
+    def update_bbox_label(self, bbox_key, canvas_coords):
+        """이동/크기 조절된 bbox의 라벨 위치만 갱신"""
+        if bbox_key in self.bbox_items:
+            _, text_id = self.bbox_items[bbox_key]
+            self.canvas.coords(text_id, canvas_coords[0], canvas_coords[1] - 5)
+
+    def remove_bbox_item(self, bbox_key):
+        """삭제된 bbox 하나의 캔버스 항목만 제거"""
+        items = self.bbox_items.pop(bbox_key, None)
+        if items is not None:
+            self.canvas.delete(*items)
     
     def on_mouse_down(self, event):
         self.start_x = self.canvas.canvasx(event.x)
@@ -371,7 +820,7 @@ class ImageViewer:
         elif self.mode == "select":
             # 조절점 클릭 확인
             clicked_handle = self.canvas.find_closest(self.start_x, self.start_y)
-            if hasattr(self, 'resize_handles') and clicked_handle[0] in self.resize_handles:
+            if self.selected_bbox_id and clicked_handle and clicked_handle[0] in self.resize_handles:
                 self.resizing = True
                 self.resize_handle = clicked_handle[0]
                 tags = self.canvas.gettags(clicked_handle[0])
@@ -379,21 +828,27 @@ class ImageViewer:
                 return
 
             # bbox 선택
-            bbox, bbox_id, self.bbox_index = self.find_closest_bbox(self.start_x, self.start_y)
+            bbox, bbox_id, bbox_key = self.find_closest_bbox(self.start_x, self.start_y)
             if bbox:
                 if self.selected_bbox_id:
                     self.deselect_bbox()
+                self.selected_bbox_key = bbox_key
                 self.selected_bbox = bbox
                 self.selected_bbox_id = bbox_id
+                self.selected_bbox_outline = self.canvas.itemcget(bbox_id, 'outline')
                 self.canvas.itemconfig(bbox_id, outline='yellow', width=2)
                 self.create_resize_handles(bbox)
+                self.refresh_bbox_overlay()
                 self.drag_start_x = self.start_x
                 self.drag_start_y = self.start_y
             else:
                 self.deselect_bbox()
-                self.show_current_image()
     
     def on_mouse_drag(self, event):
+        """B1-Motion 이벤트는 합쳐서 주기마다 마지막 위치만 처리"""
+        self.drag_scheduler.submit(event)
+
+    def process_mouse_drag(self, event):
         cur_x = self.canvas.canvasx(event.x)
         cur_y = self.canvas.canvasy(event.y)
         
@@ -418,97 +873,15 @@ class ImageViewer:
                     bbox_coords[2] = cur_x
                     bbox_coords[3] = cur_y
                 
-                # bbox 업데이트
+                # bbox 및 라벨 업데이트
                 self.canvas.coords(self.selected_bbox_id, *bbox_coords)
+                self.update_bbox_label(self.selected_bbox_key, bbox_coords)
 
-                # 조절점 위치 업데이트
-                self.delete_resize_handles()
-                self.create_resize_handles(bbox_coords)
-                
-                # 이미지 크기와 스케일 정보
-                image = Image.open(self.images[self.current_index])
-                orig_width, orig_height = image.size
-                
-                if self.fullscreen:
-                    screen_width = self.root.winfo_screenwidth()
-                    screen_height = self.root.winfo_screenheight()
-                else:
-                    screen_width = self.root.winfo_width()
-                    screen_height = self.root.winfo_height() - self.menu_frame.winfo_height()
-                
-                scale_x = screen_width / orig_width
-                scale_y = screen_height / orig_height
-                scale_factor = min(scale_x, scale_y) * self.scale
-                x_offset = self.image_position[0]
-                y_offset = self.image_position[1]
-
-                # 캔버스 좌표를 원본 이미지 좌표로 변환
-                x1 = (bbox_coords[0] - x_offset) / scale_factor
-                y1 = (bbox_coords[1] - y_offset) / scale_factor
-                x2 = (bbox_coords[2] - x_offset) / scale_factor
-                y2 = (bbox_coords[3] - y_offset) / scale_factor
-
-                # 이미지 경계를 벗어난 bbox 조정
-                x1 = max(0, min(x1, orig_width))
-                y1 = max(0, min(y1, orig_height))
-                x2 = max(0, min(x2, orig_width))
-                y2 = max(0, min(y2, orig_height))
-
-                # 이미지 bboxes 목록 업데이트
-                current_image = self.images[self.current_index]
-                if current_image in self.image_bboxes:
-                    # 현재 선택된 bbox의 인덱스 찾기
-                    selected_idx = None
-                    min_diff = float('inf')
-                    
-                    for i, bbox in enumerate(self.image_bboxes[current_image]):
-                        # 저장된 bbox와 현재 선택된 bbox의 차이 계산
-                        diff = abs(bbox[1] - x1) + abs(bbox[2] - y1) + \
-                            abs(bbox[3] - x2) + abs(bbox[4] - y2)
-                        if diff < min_diff:
-                            min_diff = diff
-                            selected_idx = i
-                    
-                    if self.bbox_index is not None:
-                        # image_bboxes 업데이트
-                        class_id = self.image_bboxes[current_image][self.bbox_index][0]
-                        self.image_bboxes[current_image][self.bbox_index] = (
-                            class_id, x1, y1, x2, y2
-                        )
-                        
-                        # YOLO 포맷으로 변환
-                        x_center = ((x1 + x2) / 2) / orig_width
-                        y_center = ((y1 + y2) / 2) / orig_height
-                        width = abs(x2 - x1) / orig_width
-                        height = abs(y2 - y1) / orig_height
-                        
-                        # yolo_bboxes 업데이트
-                        self.yolo_bboxes[current_image][self.bbox_index] = (
-                            class_id,
-                            x_center, y_center,
-                            width, height
-                        )
-
-                    elif selected_idx is not None:
-                        # image_bboxes 업데이트
-                        class_id = self.image_bboxes[current_image][selected_idx][0]
-                        self.image_bboxes[current_image][selected_idx] = (
-                            class_id, x1, y1, x2, y2
-                        )
-                        
-                        # YOLO 포맷으로 변환
-                        x_center = ((x1 + x2) / 2) / orig_width
-                        y_center = ((y1 + y2) / 2) / orig_height
-                        width = abs(x2 - x1) / orig_width
-                        height = abs(y2 - y1) / orig_height
-                        
-                        # yolo_bboxes 업데이트
-                        self.yolo_bboxes[current_image][selected_idx] = (
-                            class_id,
-                            x_center, y_center,
-                            width, height
-                        )
-                
+                # 조절점은 새로 만들지 않고 위치만 이동
+                self.move_resize_handles(bbox_coords)
+
+                # 원본 좌표 갱신은 일정 간격으로 모아서 반영
+                self.schedule_bbox_update(bbox_coords, clip=True)
                 self.selected_bbox = tuple(bbox_coords)
 
             elif self.selected_bbox_id:  # bbox 이동
@@ -523,91 +896,18 @@ class ImageViewer:
                 self.drag_start_x = cur_x
                 self.drag_start_y = cur_y
                 
-                # 현재 캔버스 좌표
+                # 현재 캔버스 좌표 (라벨도 함께 이동)
                 new_coords = self.canvas.coords(self.selected_bbox_id)
+                self.update_bbox_label(self.selected_bbox_key, new_coords)
                 
-                # 이미지 크기와 스케일 정보
-                image = Image.open(self.images[self.current_index])
-                orig_width, orig_height = image.size
-                
-                if self.fullscreen:
-                    screen_width = self.root.winfo_screenwidth()
-                    screen_height = self.root.winfo_screenheight()
-                else:
-                    screen_width = self.root.winfo_width()
-                    screen_height = self.root.winfo_height() - self.menu_frame.winfo_height()
-                
-                scale_x = screen_width / orig_width
-                scale_y = screen_height / orig_height
-                scale_factor = min(scale_x, scale_y) * self.scale
-                x_offset = self.image_position[0]
-                y_offset = self.image_position[1]
-
-                # 캔버스 좌표를 원본 이미지 좌표로 변환
-                x1 = (new_coords[0] - x_offset) / scale_factor
-                y1 = (new_coords[1] - y_offset) / scale_factor
-                x2 = (new_coords[2] - x_offset) / scale_factor
-                y2 = (new_coords[3] - y_offset) / scale_factor
-
-                # 이미지 bboxes 목록 업데이트
-                current_image = self.images[self.current_index]
-                if current_image in self.image_bboxes:
-                    # 현재 선택된 bbox의 인덱스 찾기
-                    selected_idx = None
-                    min_diff = float('inf')
-                    
-                    for i, bbox in enumerate(self.image_bboxes[current_image]):
-                        # 저장된 bbox와 현재 선택된 bbox의 차이 계산
-                        diff = abs(bbox[1] - (x1 + dx/scale_factor)) + \
-                            abs(bbox[2] - (y1 + dy/scale_factor)) + \
-                            abs(bbox[3] - (x2 + dx/scale_factor)) + \
-                            abs(bbox[4] - (y2 + dy/scale_factor))
-                        if diff < min_diff:
-                            min_diff = diff
-                            selected_idx = i
-
-                    if self.bbox_index is not None:
-                        # image_bboxes 업데이트
-                        class_id = self.image_bboxes[current_image][self.bbox_index][0]
-                        self.image_bboxes[current_image][self.bbox_index] = (
-                            class_id, x1, y1, x2, y2
-                        )
-                        
-                        # YOLO 포맷으로 변환
-                        x_center = ((x1 + x2) / 2) / orig_width
-                        y_center = ((y1 + y2) / 2) / orig_height
-                        width = abs(x2 - x1) / orig_width
-                        height = abs(y2 - y1) / orig_height
-                        
-                        # yolo_bboxes 업데이트
-                        self.yolo_bboxes[current_image][self.bbox_index] = (
-                            class_id,
-                            x_center, y_center,
-                            width, height
-                        )                        
-                    elif selected_idx is not None:
-                        # image_bboxes 업데이트
-                        class_id = self.image_bboxes[current_image][selected_idx][0]
-                        self.image_bboxes[current_image][selected_idx] = (
-                            class_id, x1, y1, x2, y2
-                        )
-                        
-                        # YOLO 포맷으로 변환
-                        x_center = ((x1 + x2) / 2) / orig_width
-                        y_center = ((y1 + y2) / 2) / orig_height
-                        width = abs(x2 - x1) / orig_width
-                        height = abs(y2 - y1) / orig_height
-                        
-                        # yolo_bboxes 업데이트
-                        self.yolo_bboxes[current_image][selected_idx] = (
-                            class_id,
-                            x_center, y_center,
-                            width, height
-                        )
-                
+                # 원본 좌표 갱신은 일정 간격으로 모아서 반영
+                self.schedule_bbox_update(new_coords)
                 self.selected_bbox = tuple(new_coords)
 
     def on_mouse_up(self, event):
+        # 아직 처리되지 않은 마지막 드래그 위치 반영
+        self.drag_scheduler.flush()
+
         if self.mode == "draw" and self.current_bbox:
             cur_x = self.canvas.canvasx(event.x)
             cur_y = self.canvas.canvasy(event.y)
@@ -615,70 +915,23 @@ class ImageViewer:
             # 최소 크기 확인
             if abs(cur_x - self.start_x) > 5 and abs(cur_y - self.start_y) > 5:
                 if self.images and self.current_index < len(self.images):
-                    current_image = self.images[self.current_index]
-                    if current_image not in self.image_bboxes:
-                        self.image_bboxes[current_image] = []
-
-                    if current_image not in self.yolo_bboxes:
-                        self.yolo_bboxes[current_image] = []      
-
                     # 이전 선택 해제
                     if self.selected_bbox_id:
                         self.deselect_bbox()
 
-                    # 이미지 크기와 스케일 정보
-                    image = Image.open(current_image)
-                    orig_width, orig_height = image.size
-                    
-                    if self.fullscreen:
-                        screen_width = self.root.winfo_screenwidth()
-                        screen_height = self.root.winfo_screenheight()
-                    else:
-                        screen_width = self.root.winfo_width()
-                        screen_height = self.root.winfo_height() - self.menu_frame.winfo_height()
-                    
-                    scale_x = screen_width / orig_width
-                    scale_y = screen_height / orig_height
-                    scale_factor = min(scale_x, scale_y) * self.scale
-                    x_offset = self.image_position[0]
-                    y_offset = self.image_position[1]
-
-                    # 캔버스 좌표를 원본 이미지 좌표로 변환
-                    x1 = (min(self.start_x, cur_x) - x_offset) / scale_factor
-                    y1 = (min(self.start_y, cur_y) - y_offset) / scale_factor
-                    x2 = (max(self.start_x, cur_x) - x_offset) / scale_factor
-                    y2 = (max(self.start_y, cur_y) - y_offset) / scale_factor
-
-                    # 이미지 경계를 벗어난 bbox 조정
-                    x1 = max(0, min(x1, orig_width))
-                    y1 = max(0, min(y1, orig_height))
-                    x2 = max(0, min(x2, orig_width))
-                    y2 = max(0, min(y2, orig_height))
+                    # 캔버스 좌표를 원본 이미지 좌표로 변환 (이미지 경계 안으로 조정)
+                    viewport = self.get_viewport()
+                    x1, y1, x2, y2 = viewport.clip_to_image(viewport.canvas_to_image([
+                        min(self.start_x, cur_x), min(self.start_y, cur_y),
+                        max(self.start_x, cur_x), max(self.start_y, cur_y)
+                    ])).tolist()
 
                     class_name = self.class_var.get()
                     class_id = self.class_name_to_idx.get(class_name, 0)  # 없으면 0을 기본값으로 사용
 
-                    # bbox 추가
-                    self.image_bboxes[current_image].append((
-                        class_id,  # class_id
-                        x1, y1, x2, y2
-                    ))
-                    
-                    # YOLO 포맷으로 변환
-                    x_center = ((x1 + x2) / 2) / orig_width
-                    y_center = ((y1 + y2) / 2) / orig_height
-                    width = abs(x2 - x1) / orig_width
-                    height = abs(y2 - y1) / orig_height
-                    
-                    # YOLO 포맷 bbox 추가
-                    self.yolo_bboxes[current_image].append((
-                        class_id,
-                        x_center, y_center,
-                        width, height
-                    ))
-
-                    # bbox 인덱스 설정
-                    self.bbox_index = len(self.image_bboxes[current_image]) - 1
+                    # bbox 추가 (원본 좌표와 YOLO 포맷을 같은 id로 저장) 후 캔버스에 생성
+                    self.selected_bbox_key = self.add_bbox(class_id, x1, y1, x2, y2)
+                    self.add_bbox_item(self.selected_bbox_key)
                     
                     # 현재 선택된 bbox 좌표 저장
                     self.selected_bbox = (
@@ -688,15 +941,14 @@ class ImageViewer:
                         max(self.start_y, cur_y)
                     )
 
-            else:
-                # 최소 크기보다 작은 경우 bbox 삭제
-                self.canvas.delete(self.current_bbox)
-
-            self.show_current_image()                
+            # 그리던 임시 사각형 삭제 (최소 크기보다 작은 경우 bbox도 추가되지 않음)
+            self.canvas.delete(self.current_bbox)
             self.current_bbox = None
             self.drag_data = {"x": 0, "y": 0}  # 드래그 데이터 초기화
             
         elif self.mode == "select":
+            # 드래그 중 미뤄 둔 원본 좌표 갱신 반영
+            self.flush_bbox_update()
             self.resizing = False
             self.resize_handle = None
             self.resize_corner = None
@@ -718,106 +970,259 @@ class ImageViewer:
         else:
             self.counter_label.configure(text="0/0")
     
-    def show_current_image(self):
-        self.canvas.delete("all")  # 캔버스 초기화
-        
-        if self.images and 0 <= self.current_index < len(self.images):
-            # 이미지 로드
-            image = Image.open(self.images[self.current_index])
-            
-            if self.fullscreen:
-                screen_width = self.root.winfo_screenwidth()
-                screen_height = self.root.winfo_screenheight()
-            else:
-                screen_width = self.root.winfo_width()
-                screen_height = self.root.winfo_height() - self.menu_frame.winfo_height()
-            
-            # 원본 이미지 크기 저장
-            orig_width, orig_height = image.size
-            
-            # 이미지 비율 유지하며 크기 조정
-            scale_x = screen_width / orig_width
-            scale_y = screen_height / orig_height
-            base_scale = min(scale_x, scale_y)
-            
-            # 확대/축소 적용
-            final_scale = base_scale * self.scale
-            new_width = int(orig_width * final_scale)
-            new_height = int(orig_height * final_scale)
-            
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # PhotoImage로 변환
-            self.current_image_tk = ImageTk.PhotoImage(image)
-            
-            # 이미지를 캔버스 중앙에 배치
-            # x = (screen_width - new_width) // 2
-            # y = (screen_height - new_height) // 2
-            
-            # # 이미지 위치 저장
-            # self.image_position = (x, y)
-
-            # 이미지 위치 설정 - 패닝 위치 유지
-            if not hasattr(self, 'image_position') or self.image_position is None:
-                # 초기 위치 (중앙)
-                x = (screen_width - new_width) // 2
-                y = (screen_height - new_height) // 2
-                self.image_position = (x, y)
-            else:
-                # 현재 패닝 위치 사용
-                x, y = self.image_position
-            
-            # 이미지 그리기
-            self.canvas.create_image(x, y, anchor='nw', image=self.current_image_tk)
-            
-            # bbox 스케일 조정을 위한 비율 계산
-            scale_factor = base_scale * self.scale
-            
-            # 저장된 bbox 그리기
-            current_image = self.images[self.current_index]
-            if current_image in self.image_bboxes:
-                for bbox in self.image_bboxes[current_image]:
-                    # bbox 좌표는 이미 base_scale이 적용된 상태이므로
-                    # self.scale만 추가로 적용
-                    scaled_x1 = x +bbox[1] * scale_factor
-                    scaled_y1 = y + bbox[2] * scale_factor
-                    scaled_x2 = x + bbox[3] * scale_factor
-                    scaled_y2 = y + bbox[4] * scale_factor
-                    
-                    # self.canvas.create_rectangle(
-                    #     scaled_x1, scaled_y1, scaled_x2, scaled_y2,
-                    #     outline='red', width=1
-                    # )
-                    class_id = bbox[0]
-                    color = self.get_bbox_color(class_id)
-                    label_text = self.class_names[class_id]
-                    
-                    # bbox 그리기
-                    bbox_id = self.canvas.create_rectangle(
-                        scaled_x1, scaled_y1, scaled_x2, scaled_y2,
-                        outline=color, width=1
-                    )
+    def get_screen_size(self):
+        """이미지를 표시할 영역의 크기 (width, height) 반환"""
+        if self.fullscreen:
+            screen_width = self.root.winfo_screenwidth()
+            screen_height = self.root.winfo_screenheight()
+        else:
+            screen_width = self.root.winfo_width()
+            screen_height = self.root.winfo_height() - self.menu_frame.winfo_height()
+        return screen_width, screen_height
+
+    def get_canvas_size(self):
+        """캔버스 크기 (width, height) 반환, 아직 배치되지 않았으면 화면 크기 사용"""
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        if canvas_width <= 1 or canvas_height <= 1:
+            return self.get_screen_size()
+        return canvas_width, canvas_height
+
+    def get_viewport(self, image_path=None):
+        """이미지별 배치 정보(Viewport) 반환, 없으면 생성"""
+        if image_path is None:
+            image_path = self.images[self.current_index]
+        viewport = self.viewports.get(image_path)
+        if viewport is None:
+            viewport = Viewport(self.image_cache.get_size(image_path),
+                                self.get_screen_size(),
+                                zoom=self.scale,
+                                image_position=self.image_position or (0, 0))
+            self.viewports[image_path] = viewport
+        return viewport
+
+    def render_image(self, image_path, viewport, resample=Image.Resampling.LANCZOS):
+        """
+        배치 정보에 맞게 화면에 그릴 이미지 생성
 
-                    self.canvas.create_text(
-                        scaled_x1, scaled_y1 - 5,
-                        text=label_text,
-                        fill=color,
-                        anchor='sw',
-                        font=('Arial', 8)
-                    )
+        Returns:
+            tuple: (PIL.Image, (x, y), photo_key) 그릴 이미지와 캔버스 위치,
+                   미리 만들어 둔 PhotoImage를 찾을 키 (잘라서 그린 경우 None)
+                   보이는 영역이 없으면 이미지는 None
+        """
+        new_width, new_height = viewport.display_size
+        canvas_size = self.get_canvas_size()
+
+        # 큰 이미지는 원본 대신 화면 배율에 가까운 피라미드 레벨 사용
+        source_path = self.pyramid_cache.get_level(image_path, viewport.orig_size,
+                                                   viewport.scale_factor)
+        if source_path is None:
+            source_path = image_path
+
+        # 확대된 이미지가 캔버스보다 크면 보이는 영역만 잘라서 크기 조정
+        self.cropped_render = (self.crop_rendering and
+                               (new_width > canvas_size[0] or new_height > canvas_size[1]))
+        if not self.cropped_render:
+            image = self.image_cache.get_scaled(source_path, (new_width, new_height), resample)
+            return image, viewport.image_position, (source_path, new_width, new_height, resample)
+
+        region = viewport.visible_region(canvas_size)
+        if region is None:
+            return None, viewport.image_position, None
+        source_box, position, region_size = region
+
+        if source_path == image_path:
+            # 초대형 이미지는 원본 전체 대신 보이는 영역에 걸치는 타일만 읽어서 합성
+            tiled = self.tile_source.get(image_path, viewport.orig_size)
+            if tiled is not None:
+                image = self.tile_source.get_region(tiled, source_box, region_size, resample)
+                return image, position, None
+        else:
+            # 원본 좌표를 피라미드 레벨 좌표로 변환
+            level_width, level_height = self.image_cache.get_size(source_path)
+            ratio_x = level_width / viewport.orig_width
+            ratio_y = level_height / viewport.orig_height
+            left, top, right, bottom = source_box
+            source_box = (left * ratio_x, top * ratio_y, right * ratio_x, bottom * ratio_y)
+
+        image = self.image_cache.get_region(source_path, source_box, region_size, resample)
+        return image, position, None
+
+    def request_render(self):
+        """
+        확대/축소, 패닝 중 화면 갱신 요청
+
+        연속된 입력은 하나의 빠른 미리보기로 합쳐서 그리고,
+        입력이 잠시 멈추면 고화질(LANCZOS)로 한 번 더 그림
+        """
+        if self.preview_render_id is None:
+            self.preview_render_id = self.root.after_idle(self.render_preview)
+
+        # 새 입력이 들어오면 고화질 렌더링을 다시 미룸
+        if self.hq_render_id is not None:
+            self.root.after_cancel(self.hq_render_id)
+        self.hq_render_id = self.root.after(self.hq_render_delay, self.render_high_quality)
+
+    def render_preview(self):
+        """빠른 리샘플링으로 미리보기 그리기"""
+        self.preview_render_id = None
+        self.show_current_image(resample=self.preview_resample)
+
+    def render_high_quality(self):
+        """입력이 멈춘 뒤 고화질로 다시 그리기"""
+        self.hq_render_id = None
+        self.show_current_image()
+
+    def show_current_image(self, resample=Image.Resampling.LANCZOS):
+        """
+        현재 이미지와 bbox 표시
+
+        캔버스 항목은 지우지 않고 유지하며, 이미지 항목은 새 이미지로 교체하고
+        bbox 항목은 이미지가 바뀐 경우에만 다시 생성 (그 외에는 위치만 갱신)
+        """
+        if not self.images or not 0 <= self.current_index < len(self.images):
+            self.canvas.delete("all")  # 캔버스 초기화
+            self.resize_handles = []
+            self.overlay_item = None
+            self.lod_summary_item = None
+            self.lod_active = False
+            self.image_item = None
+            self.displayed_image = None
+            self.bbox_items = {}
+            return
+
+        # 이미지 배치 정보 갱신 (창 크기 변경 및 확대/축소 반영)
+        image_path = self.images[self.current_index]
+        if self.project_db is not None:
+            self.load_project_labels(image_path)
+        else:
+            self.label_index.prioritize(image_path)  # 아직 읽지 않은 라벨이면 먼저 읽음
+        screen_width, screen_height = self.get_screen_size()
+        viewport = self.get_viewport(image_path)
+        viewport.update_screen((screen_width, screen_height))
+        viewport.set_zoom(self.scale)
+        
+        # 확대/축소 적용 (이미지 비율 유지)
+        new_width, new_height = viewport.display_size
+
+        # 이미지 위치 설정 - 패닝 위치 유지
+        if not hasattr(self, 'image_position') or self.image_position is None:
+            # 초기 위치 (중앙)
+            x = (screen_width - new_width) // 2
+            y = (screen_height - new_height) // 2
+            self.image_position = (x, y)
+        viewport.set_position(self.image_position)
+
+        # 화면에 맞는 이미지 생성
+        image, (x, y), photo_key = self.render_image(image_path, viewport, resample)
+        
+        # PhotoImage로 변환 (미리 준비된 것이 있으면 그대로 사용)
+        if image is not None:
+            image, photo_key = self.apply_display_window(image_path, image, photo_key)
+            self.current_image_tk = self.photo_cache.get(photo_key)
+            if self.current_image_tk is None:
+                self.current_image_tk = ImageTk.PhotoImage(image)
+
+        # 이미지 항목 재사용 (없으면 생성해서 맨 아래에 배치)
+        if self.image_item is None:
+            self.image_item = self.canvas.create_image(x, y, anchor='nw', tags='image')
+            self.canvas.tag_lower(self.image_item)
+        self.canvas.coords(self.image_item, x, y)
+        if image is not None:
+            self.canvas.itemconfig(self.image_item, image=self.current_image_tk, state='normal')
+        else:
+            self.canvas.itemconfig(self.image_item, state='hidden')
+        
+        # 이미지가 바뀌었으면 bbox 항목을 다시 만들고, 아니면 위치만 갱신
+        if self.displayed_image != image_path:
+            self.displayed_image = image_path
+            self.rebuild_bbox_items()
+        else:
+            self.update_bbox_items()
 
-    
     def next_image(self, event=None):
         if self.images:
             self.current_index = (self.current_index + 1) % len(self.images)
             self.update_counter()
             self.show_current_image()
+            self.prefetch_neighbors()
 
     def previous_image(self, event=None):
         if self.images:
             self.current_index = (self.current_index - 1) % len(self.images)
             self.update_counter()
             self.show_current_image()
+            self.prefetch_neighbors()
+
+    def go_to_image(self, event=None):
+        """번호를 입력받아 해당 이미지/프레임으로 이동"""
+        if not self.images:
+            return
+        number = simpledialog.askinteger("이동", f"이동할 번호를 입력하세요 (1~{len(self.images)}):",
+                                         minvalue=1, maxvalue=len(self.images), parent=self.root)
+        if number is None:
+            return
+        self.current_index = number - 1
+        self.update_counter()
+        self.show_current_image()
+        self.prefetch_neighbors()
+
+    def prefetch_neighbors(self):
+        """현재 이미지 앞뒤 prefetch_count장을 백그라운드에서 미리 준비"""
+        if not self.images or self.prefetch_count <= 0:
+            return
+
+        current_image = self.images[self.current_index]
+        image_paths = []
+        for offset in range(1, self.prefetch_count + 1):
+            for index in (self.current_index + offset, self.current_index - offset):
+                image_path = self.images[index % len(self.images)]
+                if image_path != current_image and image_path not in image_paths:
+                    image_paths.append(image_path)
+
+        # 화면 크기와 배율은 Tk 스레드에서 미리 읽어 둠
+        screen_size = self.get_screen_size()
+        canvas_size = self.get_canvas_size()
+        zoom = self.scale
+        self.prefetcher.prefetch(
+            image_paths,
+            lambda image_path: self.prepare_display_image(image_path, screen_size, canvas_size, zoom),
+            self.on_prefetch_ready
+        )
+
+    def prepare_display_image(self, image_path, screen_size, canvas_size, zoom):
+        """
+        (작업 스레드) 화면 표시용 이미지 디코딩 및 크기 조정
+
+        Returns:
+            tuple: (photo_key, PIL.Image) 잘라서 그려야 하는 크기면 디코딩만 하고 None 반환
+        """
+        viewport = Viewport(self.image_cache.get_size(image_path), screen_size, zoom=zoom)
+        new_width, new_height = viewport.display_size
+        if self.crop_rendering and (new_width > canvas_size[0] or new_height > canvas_size[1]):
+            return None
+
+        source_path = self.pyramid_cache.get_level(image_path, viewport.orig_size,
+                                                   viewport.scale_factor) or image_path
+        resample = Image.Resampling.LANCZOS
+        image = self.image_cache.get_scaled(source_path, (new_width, new_height), resample)
+        image, photo_key = self.apply_display_window(image_path, image,
+                                                     (source_path, new_width, new_height, resample))
+        return photo_key, image
+
+    def on_prefetch_ready(self, image_path, result):
+        """(작업 스레드) 준비된 이미지를 Tk 스레드에서 PhotoImage로 변환하도록 전달"""
+        if result is not None:
+            self.root.after(0, self.store_photo_image, *result)
+
+    def store_photo_image(self, photo_key, image):
+        """미리 준비된 이미지를 PhotoImage로 만들어 보관 (Tk 스레드)"""
+        if photo_key in self.photo_cache:
+            self.photo_cache.move_to_end(photo_key)
+            return
+        self.photo_cache[photo_key] = ImageTk.PhotoImage(image)
+        while len(self.photo_cache) > self.prefetch_count * 2 + 2:
+            self.photo_cache.popitem(last=False)
 
     def exit_fullscreen(self, event=None):
         if self.fullscreen:
@@ -830,6 +1235,8 @@ class ImageViewer:
         if class_name:
             self.bbox_saver.add_class(class_name)
             self.class_combo['values'] = self.bbox_saver.get_classes()
+            if self.project_db is not None:
+                self.project_db.set_classes(self.bbox_saver.get_classes())
 
     def save_current_image_bboxes(self, event=None):
         """현재 이미지의 bbox 데이터를 YOLO 형식으로 저장"""
@@ -837,7 +1244,7 @@ class ImageViewer:
             return
         
         current_image = self.images[self.current_index]
-        if current_image not in self.yolo_bboxes:
+        if current_image not in self.annotations:
             return
         
         # # 저장 디렉토리 선택
@@ -877,82 +1284,35 @@ class ImageViewer:
             
         try:
             current_image = self.images[self.current_index]
-            # 현재 이미지 로드
-            orig_image = cv2.imread(current_image)
+            # 현재 이미지 로드 (16비트/DICOM은 현재 윈도우/레벨을 적용한 8비트로 변환)
+            cached_image = self.image_cache.get(current_image).image
+            if cached_image.mode in HIGH_DEPTH_MODES:
+                windowed, _ = self.apply_display_window(current_image, cached_image)
+                orig_image = cv2.cvtColor(np.asarray(windowed), cv2.COLOR_GRAY2BGR)
+            elif parse_frame_path(current_image) is not None:
+                orig_image = cv2.cvtColor(np.asarray(cached_image), cv2.COLOR_RGB2BGR)
+            else:
+                orig_image = cv2.imread(current_image)
             if orig_image is None:
                 raise Exception("이미지를 불러올 수 없습니다.")
                 
             # 기존 bbox 삭제
             self.clear_bboxes()
-            
-            # 이미지 bboxes 초기화
-            self.image_bboxes[current_image] = []
-
-            # 학습용 YOLO 포맷 bbox 초기화
-            self.yolo_bboxes[current_image] = []
 
             # 검출 수행
             bbox_coordinates = self.detector.detect(orig_image)
             print(f"bbox_coordinates: {bbox_coordinates}")
 
-            # PIL로 이미지 로드
-            image = Image.open(current_image)
-            
-            # 화면 크기 계산
-            if self.fullscreen:
-                screen_width = self.root.winfo_screenwidth()
-                screen_height = self.root.winfo_screenheight()
-            else:
-                screen_width = self.root.winfo_width()
-                screen_height = self.root.winfo_height() - self.menu_frame.winfo_height()
-            
-            # 이미지 크기 조정 (show_current_image와 동일)
-            image.thumbnail((screen_width, screen_height), Image.Resampling.LANCZOS)
-            
-            # 조정된 이미지 크기
-            image_width = image.size[0]
-            image_height = image.size[1]
-
-            # 원본 이미지와 조정된 이미지의 비율 계산
-            scale_x = image_width / orig_image.shape[1]
-            scale_y = image_height / orig_image.shape[0]
-
-            orig_width = orig_image.shape[1]
-            orig_height = orig_image.shape[0]
+            # 원본 이미지 크기
+            orig_size = (orig_image.shape[1], orig_image.shape[0])
             
             for x1, y1, x2, y2, cls in bbox_coordinates:
-                # 좌표를 조정된 이미지 크기에 맞게 스케일링하고 오프셋 적용
-                canvas_x1 = int(x1 * scale_x)
-                canvas_y1 = int(y1 * scale_y)
-                canvas_x2 = int(x2 * scale_x)
-                canvas_y2 = int(y2 * scale_y)
-
-                # bbox 생성
-                self.image_bboxes[current_image].append((
-                    cls,  # model 이 예측한 cls
-                    canvas_x1,  # x1
-                    canvas_y1,  # y1
-                    canvas_x2,  # x2
-                    canvas_y2   # y2
-                ))
-
-                # YOLO 포맷: <class> <x_center> <y_center> <width> <height>
-                x_center = ((x1 + x2) / 2) / orig_width
-                y_center = ((y1 + y2) / 2) / orig_height
-                width = (x2 - x1) / orig_width
-                height = (y2 - y1) / orig_height
-
-                # 학습용 YOLO bbox 저장
-                self.yolo_bboxes[current_image].append((
-                    cls,  # model 이 예측한 cls
-                    x_center,  # 중심 x
-                    y_center,  # 중심 y
-                    width,     # 너비
-                    height     # 높이
-                ))
-
-            # 화면 업데이트
-            self.show_current_image()
+                # 원본 좌표로 bbox 생성 (YOLO 포맷도 같은 id로 저장)
+                self.add_bbox(cls, x1, y1, x2, y2,
+                              image_path=current_image, orig_size=orig_size)
+
+            # 검출된 bbox 항목만 다시 그리기
+            self.rebuild_bbox_items()
             messagebox.showinfo("완료", f"{len(bbox_coordinates)}개의 객체가 검출되었습니다.")
             
         except Exception as e:
@@ -999,6 +1359,70 @@ class ImageViewer:
             dy = new_y - current_y
             self.canvas.move("all", dx, dy)
             
+            # 빠른 미리보기 후 입력이 멈추면 고화질로 다시 그림
+            self.request_render()
+
+    def get_window(self, image_path):
+        """이미지의 윈도우/레벨 (center, width) 반환, 없으면 기본값 계산"""
+        window = self.window_levels.get(image_path)
+        if window is None:
+            window = default_window(self.image_cache.get(image_path).image)
+            self.window_levels[image_path] = window
+        return window
+
+    def apply_display_window(self, image_path, image, photo_key=None):
+        """
+        16비트 이미지에 현재 윈도우/레벨을 LUT로 적용 (8비트 이미지는 그대로 반환)
+
+        Returns:
+            tuple: (PIL.Image, photo_key) 윈도우 설정을 포함한 PhotoImage 캐시 키
+        """
+        if image.mode not in HIGH_DEPTH_MODES:
+            return image, photo_key
+        center, width = self.get_window(image_path)
+        image = self.window_lut_cache.apply(image, center, width)
+        if photo_key is not None:
+            photo_key = photo_key + ((center, width),)
+        return image, photo_key
+
+    def start_window_drag(self, event):
+        """윈도우/레벨 조절 시작 (16비트 이미지에서만 동작)"""
+        self.window_drag_start = None
+        if not self.images or self.current_index >= len(self.images):
+            return
+        image_path = self.images[self.current_index]
+        if self.image_cache.get_mode(image_path) not in HIGH_DEPTH_MODES:
+            return
+        center, width = self.get_window(image_path)
+        self.window_drag_start = (event.x, event.y, center, width)
+
+    def window_drag(self, event):
+        """윈도우/레벨 조절 중 (이동 이벤트는 합쳐서 처리)"""
+        if self.window_drag_start is not None:
+            self.window_scheduler.submit(event)
+
+    def process_window_drag(self, event):
+        """가로 이동은 윈도우 폭, 세로 이동은 레벨(중심값) 조절"""
+        if self.window_drag_start is None:
+            return
+        start_x, start_y, center, width = self.window_drag_start
+        step = width / 256  # 현재 폭에 비례한 감도
+        new_width = max(1.0, width + (event.x - start_x) * step)
+        new_center = center + (event.y - start_y) * step
+        self.window_levels[self.images[self.current_index]] = (new_center, new_width)
+
+        # 디코딩/크기 조정된 16비트 이미지는 캐시에 있으므로 LUT만 다시 적용됨
+        self.request_render()
+
+    def end_window_drag(self, event):
+        """윈도우/레벨 조절 종료"""
+        self.window_scheduler.flush()
+        self.window_drag_start = None
+
+    def reset_window(self, event=None):
+        """현재 이미지의 윈도우/레벨을 기본값으로 되돌림"""
+        if self.images and self.current_index < len(self.images):
+            self.window_levels.pop(self.images[self.current_index], None)
             self.show_current_image()
 
     def start_pan(self, event):
@@ -1011,7 +1435,11 @@ class ImageViewer:
         self.pan_start_image_pos = self.image_position
 
     def pan(self, event):
-        """패닝 중"""
+        """패닝 중 (B2-Motion 이벤트는 합쳐서 주기마다 마지막 위치만 처리)"""
+        self.pan_scheduler.submit(event)
+
+    def process_pan(self, event):
+        """패닝 이동 처리"""
         if self.pan_start_x is not None:
             # 이동 거리 계산
             dx = event.x - self.pan_start_x
@@ -1023,6 +1451,12 @@ class ImageViewer:
             # 이미지 위치 업데이트
             x, y = self.pan_start_image_pos
             self.image_position = (x + dx, y + dy)
+            if self.images:
+                self.get_viewport().set_position(self.image_position)
+
+            # 잘라서 그린 이미지와 bbox 오버레이는 새로 보이게 된 영역을 다시 그림
+            if self.cropped_render or self.lod_active:
+                self.request_render()
             
             # 시작점 업데이트
             self.pan_start_x = event.x
@@ -1031,6 +1465,7 @@ class ImageViewer:
 
     def end_pan(self, event):
         """패닝 종료"""
+        self.pan_scheduler.flush()
         self.pan_start_x = None
         self.pan_start_y = None
         self.pan_start_image_pos = None
@@ -1055,34 +1490,92 @@ class ImageViewer:
             current_image = self.images[self.current_index]
             
             # 이미지가 없거나 bbox가 없는 경우
-            if not current_image or current_image not in self.yolo_bboxes:
+            if not current_image or current_image not in self.annotations:
                 messagebox.showwarning("경고", "저장할 bbox가 없습니다.")
                 return
 
+            annotations = self.annotations[current_image]
+            if self.project_db is not None:
+                # 프로젝트 DB에 한 트랜잭션으로 저장 (.txt는 내보내기로 생성)
+                self.project_db.save_annotations(current_image, annotations.image_size,
+                                                 annotations.class_ids, annotations.yolo_boxes())
+                if self.edit_journal is not None:
+                    self.edit_journal.record_saved(current_image)
+                self.update_status(f"프로젝트 DB 저장 완료: {os.path.basename(current_image)}")
+                return
+
             # .txt 파일 경로 생성
-            txt_path = os.path.splitext(current_image)[0] + '.txt'
+            txt_path = label_path_for(current_image)
             
-            # bbox 정보 저장
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                for bbox in self.yolo_bboxes[current_image]:
-                    class_id, x_center, y_center, width, height = bbox
-                    # 좌표값을 소수점 6자리까지 저장
-                    f.write(f"{class_id} {x_center:.6f} {y_center:.6f} {width:.6f} {height:.6f}\n")
-            
-            # 성공 메시지 표시
-            messagebox.showinfo("완료", f"Annotation이 저장되었습니다.\n저장 위치: {txt_path}")
+            # 백그라운드 저장 요청 (결과는 상태바에 표시)
+            self.annotation_writer.submit(txt_path, annotations.class_ids, annotations.yolo_boxes())
+            if self.edit_journal is not None:
+                # 저장 요청 이후의 편집은 다시 처음부터 기록 (저장 실패 시 poll_save_results에서 재기록)
+                self.edit_journal.record_saved(current_image)
+            self.update_status(f"저장 중: {os.path.basename(txt_path)}")
+            if self.save_poll_id is None:
+                self.save_poll_id = self.root.after(self.save_poll_interval, self.poll_save_results)
 
         except Exception as e:
             messagebox.showerror("오류", f"저장 중 오류가 발생했습니다: {str(e)}")
 
+    def poll_save_results(self):
+        """백그라운드 저장 결과를 상태바에 표시"""
+        self.save_poll_id = None
+        for txt_path, error in self.annotation_writer.poll_results():
+            if error is None:
+                self.update_status(f"저장 완료: {txt_path}")
+            else:
+                self.update_status(f"저장 실패: {os.path.basename(txt_path)} ({error})")
+                # 저장하지 못한 이미지는 복구할 수 있도록 저널에 다시 기록
+                for image_path, annotations in self.annotations.items():
+                    if label_path_for(image_path) == txt_path:
+                        self.get_edit_journal(image_path, annotations)
+
+        if self.annotation_writer.pending_count():
+            self.save_poll_id = self.root.after(self.save_poll_interval, self.poll_save_results)
+
+    def update_status(self, message):
+        """상태바 메시지 업데이트 (상태바가 없으면 콘솔에 출력)"""
+        if hasattr(self, 'status_label'):
+            self.status_label.config(text=message)
+        else:
+            print(message)
+
+    def on_close(self):
+        """창을 닫기 전에 대기 중인 라벨 저장을 마치고 편집 저널을 정리"""
+        if not self.annotation_writer.close(timeout=10):
+            messagebox.showwarning("경고", "저장하지 못한 라벨 파일이 있습니다.")
+        self.poll_save_results()
+        if self.edit_journal is not None:
+            self.edit_journal.close()
+        if self.project_db is not None:
+            self.project_db.close()
+        if self.manifest is not None:
+            self.manifest.close()
+        if self.frame_sampler is not None:
+            self.frame_sampler.cancel()
+        self.video_source.shutdown()
+        self.prefetcher.shutdown()
+        self.pyramid_cache.shutdown()
+        self.tile_source.shutdown()
+        self.root.destroy()
+
     def load_images(self):
         file_paths = filedialog.askopenfilenames(
             title="이미지 파일 선택",
-            filetypes=[("Image files", "*.png *.jpg *.jpeg *.gif *.bmp")]
+            filetypes=[("Image files", " ".join(f"*{extension}" for extension in IMAGE_EXTENSIONS)),
+                       ("Video files", " ".join(f"*{extension}" for extension in VIDEO_EXTENSIONS))]
         )
         if file_paths:
             self.process_file_paths(file_paths)
 
+    def load_folder(self):
+        """폴더를 선택해 하위 폴더의 이미지까지 모두 열기"""
+        directory = filedialog.askdirectory(title="이미지 폴더 선택")
+        if directory:
+            self.process_file_paths([directory])
+
     def setup_drag_drop(self):
         # 드래그 앤 드롭을 위한 이벤트 바인딩
         self.root.drop_target_register(DND_FILES)
@@ -1091,20 +1584,444 @@ class ImageViewer:
     def handle_drop(self, event):
         # 드롭된 파일 경로를 처리
         file_paths = self.root.tk.splitlist(event.data)
-        # 이미지 파일만 필터링
-        valid_extensions = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
-        image_files = [f for f in file_paths if f.lower().endswith(valid_extensions)]
+        # 이미지/동영상 파일과 폴더만 필터링
+        image_files = [f for f in file_paths
+                       if f.lower().endswith(IMAGE_EXTENSIONS) or is_video(f) or os.path.isdir(f)]
         
         if image_files:
             self.process_file_paths(image_files)
 
     def process_file_paths(self, file_paths):
+        """
+        이미지 파일/폴더 열기
+
+        폴더는 백그라운드에서 읽으며 찾은 이미지를 목록 뒤에 계속 추가하고,
+        동영상은 프레임 하나하나를 이미지처럼 목록에 넣음
+        """
         if file_paths:
-            self.file_paths = os.path.dirname(file_paths[0])
-            self.images = list(file_paths)
+            image_files = []
+            directories = []
+            for path in file_paths:
+                if not path.lower().endswith(IMAGE_EXTENSIONS) and not is_video(path) and os.path.isdir(path):
+                    directories.append(path)
+                else:
+                    image_files.append(path)
+
+            self.file_paths = directories[0] if directories else os.path.dirname(file_paths[0])
+            self.pending_videos = []  # 이전 목록에서 기다리던 동영상은 버림
+            self.images = PathList(self.expand_video_paths(image_files))
             self.current_index = 0
+            self.open_manifest()
+            self.refresh_manifest(image_files)
+            self.open_edit_journal()
+            self.start_label_index()
             self.update_counter()
             self.show_current_image()
+            self.prefetch_neighbors()
+
+            if directories:
+                self.directory_scanner.start(directories)
+                self.update_status("폴더 읽는 중...")
+                if self.scan_poll_id is None:
+                    self.scan_poll_id = self.root.after(self.scan_poll_interval, self.poll_directory_scan)
+            else:
+                self.directory_scanner.cancel()
+
+    def poll_directory_scan(self):
+        """폴더에서 새로 찾은 이미지를 목록에 추가 (첫 이미지는 바로 표시)"""
+        self.scan_poll_id = None
+        image_paths = self.directory_scanner.drain()
+        if image_paths:
+            self.refresh_manifest(image_paths)
+            self.append_images(self.expand_video_paths(image_paths))
+
+        if self.directory_scanner.has_work():
+            self.scan_poll_id = self.root.after(self.scan_poll_interval, self.poll_directory_scan)
+        else:
+            self.update_status(f"이미지 {len(self.images)}개를 불러왔습니다.")
+
+    def append_images(self, image_paths):
+        """목록 뒤에 이미지 추가 (목록이 비어 있었으면 첫 이미지를 바로 표시)"""
+        if not image_paths:
+            return
+        was_empty = not self.images
+        self.images.extend(image_paths)
+        if self.project_db is not None:
+            self.project_db.add_images(image_paths)
+        else:
+            self.label_index.add(image_paths)
+            if self.label_poll_id is None:
+                self.label_poll_id = self.root.after(self.label_poll_interval, self.poll_loaded_labels)
+        self.update_counter()
+        if was_empty:
+            self.show_current_image()
+            self.prefetch_neighbors()
+
+    def expand_video_paths(self, paths):
+        """
+        동영상 경로를 프레임 경로들로 펼침 (이미지 경로는 그대로)
+
+        프레임 인덱스가 아직 없는 동영상은 작업 스레드에서 인덱스를 만들고,
+        만들어지면 poll_video_indexes에서 프레임 경로를 목록 뒤에 추가함
+        """
+        expanded = []
+        for path in paths:
+            if not is_video(path):
+                expanded.append(path)
+                continue
+            try:
+                frame_paths = self.video_source.frame_paths(path)
+            except OSError as e:
+                print(f"동영상 열기 중 오류 발생: {e}")
+                continue
+            if frame_paths is not None:
+                expanded.extend(frame_paths)
+            else:
+                self.pending_videos.append(path)
+                if self.video_poll_id is None:
+                    self.video_poll_id = self.root.after(self.video_poll_interval, self.poll_video_indexes)
+        return expanded
+
+    def poll_video_indexes(self):
+        """인덱스가 만들어진 동영상의 프레임을 목록에 추가"""
+        self.video_poll_id = None
+        waiting = []
+        image_paths = []
+        for video_path in self.pending_videos:
+            try:
+                frame_paths = self.video_source.frame_paths(video_path)
+            except OSError as e:
+                print(f"동영상 열기 중 오류 발생: {e}")
+                continue
+            if frame_paths is not None:
+                image_paths.extend(frame_paths)
+            elif self.video_source.index_failed(video_path):
+                self.update_status(f"동영상을 열 수 없습니다: {os.path.basename(video_path)}")
+            else:
+                waiting.append(video_path)
+        self.pending_videos = waiting
+        self.append_images(image_paths)
+
+        if self.pending_videos:
+            self.video_poll_id = self.root.after(self.video_poll_interval, self.poll_video_indexes)
+        elif image_paths:
+            self.update_status(f"이미지 {len(self.images)}개를 불러왔습니다.")
+
+    def refresh_manifest(self, paths):
+        """이미지 파일 헤더를 매니페스트에 미리 읽어 둠 (동영상, 프레임 경로, 캐시 폴더 파일은 제외)"""
+        if self.manifest is not None:
+            self.manifest.refresh([path for path in paths
+                                   if not is_video(path) and parse_frame_path(path) is None
+                                   and not is_cache_path(path)],
+                                  self.image_cache.get_header)
+
+    def sample_video_frames(self, event=None):
+        """
+        동영상에서 학습에 쓸 프레임만 골라 이미지 목록으로 열기
+
+        추출 방식과 설정을 입력받아 작업 스레드에서 동영상을 한 번만 디코딩하며 고르고,
+        고른 프레임은 이미지 파일로 저장하거나 저장 없이 동영상에서 바로 읽음
+        """
+        video_path = filedialog.askopenfilename(
+            title="동영상 선택",
+            filetypes=[("Video files", " ".join(f"*{extension}" for extension in VIDEO_EXTENSIONS))]
+        )
+        if not video_path:
+            return
+
+        mode = simpledialog.askstring("프레임 추출", "추출 방식을 입력하세요 (scene / every_n / interval):",
+                                      initialvalue=self.frame_sample_mode, parent=self.root)
+        if mode is None:
+            return
+        mode = mode.strip()
+        if mode not in SAMPLE_MODES:
+            messagebox.showwarning("경고", f"지원하지 않는 추출 방식입니다: {mode}")
+            return
+
+        if mode == 'every_n':
+            value = simpledialog.askinteger("프레임 추출", "몇 프레임마다 추출할까요?",
+                                            initialvalue=self.frame_sample_every_n, minvalue=1, parent=self.root)
+        elif mode == 'interval':
+            value = simpledialog.askfloat("프레임 추출", "몇 초마다 추출할까요?",
+                                          initialvalue=self.frame_sample_interval, minvalue=0.01, parent=self.root)
+        else:
+            value = simpledialog.askfloat("프레임 추출", "장면 변화 기준 (0~1, 작을수록 많이 추출):",
+                                          initialvalue=self.frame_sample_threshold,
+                                          minvalue=0.0, maxvalue=1.0, parent=self.root)
+        if value is None:
+            return
+        self.frame_sample_mode = mode
+        if mode == 'every_n':
+            self.frame_sample_every_n = value
+        elif mode == 'interval':
+            self.frame_sample_interval = value
+        else:
+            self.frame_sample_threshold = value
+
+        output_dir = None
+        if messagebox.askyesno("프레임 추출", "고른 프레임을 이미지 파일로 저장할까요?\n"
+                                            "(아니오: 저장하지 않고 동영상에서 바로 읽음)"):
+            stem = os.path.splitext(os.path.basename(video_path))[0]
+            output_dir = os.path.join(os.path.dirname(video_path), f"{stem}_frames")
+
+        if self.frame_sampler is not None:
+            self.frame_sampler.cancel()
+        sampler = FrameSampler(mode, every_n=self.frame_sample_every_n, interval=self.frame_sample_interval,
+                               threshold=self.frame_sample_threshold)
+        self.frame_sampler = sampler
+
+        def report_progress(done, total):
+            self.root.after(0, self.update_status, f"프레임 추출 중: {done}/{total}")
+
+        def run_sampler():
+            try:
+                image_paths = sampler.sample(video_path, output_dir, progress=report_progress)
+            except Exception as e:
+                print(f"프레임 추출 중 오류 발생: {e}")
+                return
+            if image_paths and self.frame_sampler is sampler:
+                self.root.after(0, self.finish_video_sampling, sampler, image_paths)
+
+        threading.Thread(target=run_sampler, name="frame-sampler", daemon=True).start()
+
+    def finish_video_sampling(self, sampler, image_paths):
+        """(Tk 스레드) 고른 프레임으로 이미지 목록 열기"""
+        if self.frame_sampler is not sampler:
+            return
+        self.frame_sampler = None
+        self.process_file_paths(image_paths)
+        self.update_status(f"프레임 {len(image_paths)}개를 추출했습니다.")
+
+    def open_manifest(self):
+        """
+        이미지 폴더의 헤더 매니페스트 열기
+
+        이미지 크기/모드 조회가 매니페스트를 거치도록 이미지 캐시에 연결하고,
+        목록의 헤더는 백그라운드에서 미리 읽어 둠
+        """
+        dataset_dir = os.path.abspath(self.file_paths)
+        if self.manifest is not None:
+            if self.manifest.dataset_dir == dataset_dir:
+                self.manifest.cancel()  # 이전 목록의 남은 작업은 버림
+                return
+            self.manifest.close()
+            self.manifest = None
+
+        try:
+            self.manifest = ImageManifest(dataset_dir)
+        except (OSError, sqlite3.Error) as e:
+            print(f"이미지 매니페스트 생성 중 오류 발생: {e}")
+        self.image_cache.set_manifest(self.manifest)
+
+    def open_edit_journal(self):
+        """
+        이미지 폴더의 편집 저널 열기
+
+        이전 실행에서 저장하지 못한 편집이 남아 있으면 복구 여부를 묻고,
+        복구한 이미지는 라벨 파일보다 저널 내용을 우선함
+        """
+        journal_dir = os.path.join(self.file_paths, ".bbox_cache", "journal")
+        if self.edit_journal is not None:
+            if self.edit_journal.journal_dir == journal_dir:
+                return
+            self.edit_journal.close()
+
+        self.edit_journal = EditJournal(journal_dir, self.journal_checkpoint_interval)
+        recovered = {}
+        try:
+            if self.edit_journal.has_unsaved():
+                recovered = self.edit_journal.recover()
+        except Exception as e:
+            print(f"편집 저널 복구 중 오류 발생: {e}")
+
+        # 이번 실행에서 이미 열었던 이미지는 메모리의 내용이 최신
+        initial_state = {image_path: self.annotations[image_path]
+                         for image_path in recovered if image_path in self.annotations}
+        restorable = {image_path: state for image_path, state in recovered.items()
+                      if image_path not in self.annotations}
+        if restorable and messagebox.askyesno(
+                "복구", f"저장되지 않은 편집이 있는 이미지 {len(restorable)}개를 복구하시겠습니까?"):
+            for image_path, (image_size, boxes) in restorable.items():
+                annotations = AnnotationStore(image_size)
+                for bbox in boxes:
+                    annotations.add(self.new_bbox_key(), bbox[0], bbox[1:])
+                self.annotations[image_path] = annotations
+                self.spatial_indexes.pop(image_path, None)
+                self.labels_loaded.add(image_path)  # 라벨 파일로 덮어쓰지 않음
+                initial_state[image_path] = annotations
+
+        try:
+            self.edit_journal.start({image_path: (annotations.image_size, dict(annotations.items()))
+                                     for image_path, annotations in initial_state.items()})
+        except OSError as e:
+            print(f"편집 저널 생성 중 오류 발생: {e}")
+            self.edit_journal = None
+
+    def start_label_index(self):
+        """이미지 목록에 해당하는 기존 YOLO 라벨을 백그라운드에서 읽기 시작"""
+        if self.project_db is not None:
+            # 프로젝트 DB를 사용하면 라벨은 이미지를 열 때 DB에서 읽음
+            self.project_db.add_images(self.images)
+            self.label_index.start([])
+            return
+        self.label_index.start(self.images)
+        if self.label_poll_id is None:
+            self.label_poll_id = self.root.after(self.label_poll_interval, self.poll_loaded_labels)
+
+    def poll_loaded_labels(self):
+        """읽기가 끝난 라벨을 저장소에 반영 (현재 이미지면 bbox 항목도 갱신)"""
+        self.label_poll_id = None
+        current_image = self.images[self.current_index] if self.images else None
+        current_updated = False
+        for image_path, image_size, class_ids, yolo_boxes in self.label_index.drain():
+            if self.apply_loaded_labels(image_path, image_size, class_ids, yolo_boxes):
+                current_updated = current_updated or image_path == current_image
+        if current_updated:
+            self.update_bbox_items()
+
+        if self.label_index.has_work():
+            self.label_poll_id = self.root.after(self.label_poll_interval, self.poll_loaded_labels)
+
+    def apply_loaded_labels(self, image_path, image_size, class_ids, yolo_boxes):
+        """
+        읽은 YOLO 라벨을 이미지의 bbox 저장소에 추가
+
+        이번 실행에서 이미 반영한 이미지는 건너뛰고 (편집 내용 유지),
+        라벨이 도착하기 전에 그린 bbox가 있으면 함께 보관함
+
+        Returns:
+            bool: 반영했으면 True
+        """
+        if image_path in self.labels_loaded:
+            return False
+        self.labels_loaded.add(image_path)
+
+        # 클래스 목록에 없는 id는 이름/색을 정할 수 없으므로 건너뜀
+        known = (class_ids >= 0) & (class_ids < len(self.class_names))
+        if not known.all():
+            unknown_ids = sorted(set(class_ids[~known].tolist()))
+            print(f"경고: 클래스 목록에 없는 id {unknown_ids}의 bbox {int((~known).sum())}개를 건너뜁니다 ({image_path})")
+            class_ids = class_ids[known]
+            yolo_boxes = yolo_boxes[known]
+
+        annotations = self.get_annotations(image_path, image_size)
+        bbox_keys = [self.new_bbox_key() for _ in range(len(class_ids))]
+        annotations.add_yolo(bbox_keys, class_ids, yolo_boxes)
+        if self.edit_journal is not None and self.edit_journal.is_tracking(image_path):
+            # 라벨이 도착하기 전에 편집을 시작했으면 합쳐진 내용을 다시 기록
+            self.edit_journal.record_image(image_path, annotations.image_size, annotations.items())
+
+        # 공간 인덱스는 다음 조회 때 저장소에서 다시 생성
+        self.spatial_indexes.pop(image_path, None)
+        return True
+
+    def open_project_db(self):
+        """
+        프로젝트 DB(SQLite) 열기 또는 새로 만들기
+
+        DB에 등록된 이미지가 있으면 그 목록을 열고,
+        새 DB면 현재 이미지를 등록하고 기존 라벨 파일을 백그라운드에서 가져옴
+        """
+        db_path = filedialog.asksaveasfilename(
+            title="프로젝트 DB 선택",
+            initialdir=self.file_paths if self.file_paths else ".",
+            defaultextension=".db",
+            filetypes=[("Project DB", "*.db")],
+            confirmoverwrite=False
+        )
+        if not db_path:
+            return
+
+        try:
+            project_db = ProjectDatabase(db_path)
+            if not project_db.get_classes():
+                project_db.set_classes(self.bbox_saver.get_classes())
+            image_paths = project_db.image_paths()
+        except sqlite3.Error as e:
+            messagebox.showerror("오류", f"프로젝트 DB를 열 수 없습니다: {str(e)}")
+            return
+
+        if self.project_db is not None:
+            self.project_db.close()
+        self.project_db = project_db
+
+        if image_paths:
+            self.process_file_paths(image_paths)
+        elif self.images:
+            project_db.add_images(self.images)
+            threading.Thread(target=self.import_project_labels, args=(db_path, list(self.images)),
+                             name="project-import", daemon=True).start()
+        self.update_status(f"프로젝트 DB: {os.path.basename(db_path)}")
+
+    def import_project_labels(self, db_path, image_paths):
+        """(작업 스레드) 기존 YOLO 라벨 파일을 프로젝트 DB로 가져오기"""
+        try:
+            project_db = ProjectDatabase(db_path)  # 스레드 전용 연결
+            try:
+                imported = project_db.import_yolo_labels(image_paths, self.image_cache)
+            finally:
+                project_db.close()
+            self.root.after(0, self.update_status, f"라벨 파일 {imported}개를 프로젝트 DB로 가져왔습니다.")
+        except Exception as e:
+            print(f"라벨 가져오기 중 오류 발생: {e}")
+
+    def load_project_labels(self, image_path):
+        """
+        프로젝트 DB에 저장된 이미지의 bbox를 처음 열 때 한 번 읽어서 반영
+
+        DB에 아직 라벨이 없으면 (라벨 파일 가져오기가 끝나지 않았거나 나중에 추가된 이미지)
+        라벨 파일에서 읽으므로, 저장할 때 기존 라벨이 빈 bbox로 덮이지 않음
+        """
+        if image_path in self.labels_loaded:
+            return
+        loaded = self.project_db.load_annotations(image_path)
+        if loaded is None:
+            txt_path = label_path_for(image_path)
+            if os.path.exists(txt_path):
+                try:
+                    class_ids, yolo_boxes = parse_yolo_label(txt_path)
+                    loaded = (self.image_cache.get_size(image_path), class_ids, yolo_boxes)
+                except Exception as e:
+                    print(f"라벨 읽기 중 오류 발생 ({txt_path}): {e}")
+        if loaded is None:
+            self.labels_loaded.add(image_path)
+            return
+        image_size, class_ids, yolo_boxes = loaded
+        self.apply_loaded_labels(image_path, image_size, class_ids, yolo_boxes)
+
+    def toggle_review_status(self, event=None):
+        """현재 이미지의 검수 완료 표시 전환 (프로젝트 DB를 연 경우)"""
+        if self.project_db is None or not self.images:
+            return
+        image_path = self.images[self.current_index]
+        if self.project_db.get_status(image_path) == STATUS_REVIEWED:
+            status = STATUS_LABELED
+        else:
+            status = STATUS_REVIEWED
+        self.project_db.set_status([image_path], status)
+        self.update_status(f"검수 상태: {status} ({os.path.basename(image_path)})")
+
+    def export_project_yolo(self):
+        """프로젝트 DB의 라벨을 YOLO .txt 파일로 일괄 내보내기 (백그라운드)"""
+        if self.project_db is None:
+            messagebox.showwarning("경고", "프로젝트 DB를 먼저 여세요.")
+            return
+        output_dir = filedialog.askdirectory(
+            title="YOLO 라벨을 내보낼 폴더 선택",
+            initialdir=self.project_db.root_dir
+        )
+        if not output_dir:
+            return
+
+        def run_export(project_db=self.project_db):
+            try:
+                written = project_db.export_yolo(output_dir)
+                self.root.after(0, self.update_status, f"YOLO 라벨 {written}개 내보내기 완료: {output_dir}")
+            except Exception as e:
+                print(f"YOLO 내보내기 중 오류 발생: {e}")
+
+        self.update_status("YOLO 라벨 내보내는 중...")
+        threading.Thread(target=run_export, name="project-export", daemon=True).start()
 
     def get_bbox_color(self, class_id):
             """클래스 ID에 따른 색상 반환"""
@@ -0,0 +1,179 @@
+import numpy as np
+
+
+class AnnotationStore:
+    def __init__(self, image_size, capacity=8):
+        """
+        이미지 한 장의 bbox를 열(column) 단위 NumPy 배열로 보관
+
+        원본 픽셀 좌표(x1, y1, x2, y2)만 float32 배열 하나에 저장하고,
+        YOLO 포맷은 필요할 때 벡터 연산으로 변환함
+
+        Args:
+            image_size (tuple): 원본 이미지 크기 (width, height)
+            capacity (int): 초기 배열 크기 (부족하면 두 배로 늘림)
+        """
+        self.image_width, self.image_height = image_size
+        self._boxes = np.empty((capacity, 4), dtype=np.float32)
+        self._class_ids = np.empty(capacity, dtype=np.int32)
+        self._keys = np.empty(capacity, dtype=np.int64)
+        self._rows = {}  # bbox id -> 배열 행 번호
+        self._count = 0
+
+    @property
+    def image_size(self):
+        return (self.image_width, self.image_height)
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key):
+        return key in self._rows
+
+    def _grow(self):
+        capacity = max(8, len(self._boxes) * 2)
+        self._boxes = np.resize(self._boxes, (capacity, 4))
+        self._class_ids = np.resize(self._class_ids, capacity)
+        self._keys = np.resize(self._keys, capacity)
+
+    def add(self, key, class_id, box):
+        """
+        bbox 추가
+
+        Args:
+            key (int): bbox id
+            class_id (int): 클래스 번호
+            box (tuple): 원본 픽셀 좌표 (x1, y1, x2, y2)
+        """
+        if key in self._rows:
+            raise ValueError(f"이미 존재하는 bbox id: {key}")
+        if self._count == len(self._boxes):
+            self._grow()
+        row = self._count
+        self._boxes[row] = box
+        self._class_ids[row] = class_id
+        self._keys[row] = key
+        self._rows[key] = row
+        self._count += 1
+
+    def add_many(self, keys, class_ids, boxes):
+        """여러 bbox를 한 번에 추가 (boxes: (N, 4) 원본 픽셀 좌표)"""
+        boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        if len(boxes) == 0:
+            return
+        while self._count + len(boxes) > len(self._boxes):
+            self._grow()
+        start, end = self._count, self._count + len(boxes)
+        self._boxes[start:end] = boxes
+        self._class_ids[start:end] = class_ids
+        self._keys[start:end] = keys
+        for row, key in enumerate(self._keys[start:end].tolist(), start):
+            self._rows[key] = row
+        self._count = end
+
+    def add_yolo(self, keys, class_ids, yolo_boxes):
+        """YOLO 포맷 (N, 4) cxcywh 배열을 원본 좌표로 변환하여 추가"""
+        self.add_many(keys, class_ids, self.yolo_to_pixel(yolo_boxes))
+
+    def update(self, key, box):
+        """bbox 좌표 갱신"""
+        self._boxes[self._rows[key]] = box
+
+    def set_class(self, key, class_id):
+        """bbox 클래스 변경"""
+        self._class_ids[self._rows[key]] = class_id
+
+    def remove(self, key):
+        """bbox 삭제 (마지막 행을 빈 자리로 옮겨 O(1)로 처리)"""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        last = self._count - 1
+        if row != last:
+            self._boxes[row] = self._boxes[last]
+            self._class_ids[row] = self._class_ids[last]
+            self._keys[row] = self._keys[last]
+            self._rows[int(self._keys[row])] = row
+        self._count = last
+
+    def clear(self):
+        self._rows.clear()
+        self._count = 0
+
+    def get(self, key):
+        """bbox 하나를 (class_id, x1, y1, x2, y2) 튜플로 반환"""
+        row = self._rows[key]
+        return (int(self._class_ids[row]), *self._boxes[row].tolist())
+
+    def row(self, key):
+        """bbox id의 배열 행 번호 (pixel_boxes, class_ids 인덱스)"""
+        return self._rows[key]
+
+    def keys(self):
+        """bbox id 목록 (배열 행 순서)"""
+        return self._keys[:self._count].tolist()
+
+    def items(self):
+        """(bbox id, (class_id, x1, y1, x2, y2)) 순회"""
+        for key in self.keys():
+            yield key, self.get(key)
+
+    @property
+    def class_ids(self):
+        """클래스 번호 배열 (N,) - 복사본이 아닌 뷰"""
+        return self._class_ids[:self._count]
+
+    @property
+    def pixel_boxes(self):
+        """원본 픽셀 좌표 배열 (N, 4) x1y1x2y2 - 복사본이 아닌 뷰"""
+        return self._boxes[:self._count]
+
+    def yolo_boxes(self):
+        """YOLO 포맷 배열 (N, 4) 정규화된 x_center, y_center, width, height"""
+        boxes = self.pixel_boxes
+        size = np.array([self.image_width, self.image_height], dtype=np.float32)
+        centers = (boxes[:, :2] + boxes[:, 2:]) / 2 / size
+        sizes = np.abs(boxes[:, 2:] - boxes[:, :2]) / size
+        return np.concatenate([centers, sizes], axis=1)
+
+    def yolo_to_pixel(self, yolo_boxes):
+        """YOLO 포맷 (N, 4) 배열을 원본 픽셀 x1y1x2y2 배열로 변환"""
+        yolo_boxes = np.asarray(yolo_boxes, dtype=np.float32).reshape(-1, 4)
+        size = np.array([self.image_width, self.image_height], dtype=np.float32)
+        centers = yolo_boxes[:, :2] * size
+        half_sizes = yolo_boxes[:, 2:] * size / 2
+        return np.concatenate([centers - half_sizes, centers + half_sizes], axis=1)
+
+    def clip(self):
+        """모든 bbox를 이미지 경계 안으로 제한"""
+        boxes = self.pixel_boxes
+        np.clip(boxes[:, 0::2], 0, self.image_width, out=boxes[:, 0::2])
+        np.clip(boxes[:, 1::2], 0, self.image_height, out=boxes[:, 1::2])
+
+    def filter(self, mask):
+        """
+        mask가 True인 bbox만 남김
+
+        Args:
+            mask (numpy.ndarray): (N,) bool 배열 (행 순서)
+
+        Returns:
+            list: 삭제된 bbox id 목록
+        """
+        mask = np.asarray(mask, dtype=bool)
+        removed = self._keys[:self._count][~mask].tolist()
+        kept = int(mask.sum())
+        self._boxes[:kept] = self._boxes[:self._count][mask]
+        self._class_ids[:kept] = self._class_ids[:self._count][mask]
+        self._keys[:kept] = self._keys[:self._count][mask]
+        self._count = kept
+        self._rows = {key: row for row, key in enumerate(self._keys[:kept].tolist())}
+        return removed
+
+    def scale(self, scale_x, scale_y):
+        """모든 bbox 좌표를 배율만큼 조정 (이미지 크기도 함께 변경)"""
+        boxes = self.pixel_boxes
+        boxes[:, 0::2] *= scale_x
+        boxes[:, 1::2] *= scale_y
+        self.image_width *= scale_x
+        self.image_height *= scale_y
@@ -0,0 +1,114 @@
+import os
+import threading
+from collections import OrderedDict, deque
+import numpy as np
+
+
+def format_yolo_lines(class_ids, yolo_boxes):
+    """YOLO 라벨 파일 내용 생성 (좌표는 소수점 6자리)"""
+    lines = [f"{class_id} {x_center:.6f} {y_center:.6f} {width:.6f} {height:.6f}\n"
+             for class_id, (x_center, y_center, width, height)
+             in zip(np.asarray(class_ids).tolist(), np.asarray(yolo_boxes).tolist())]
+    return "".join(lines)
+
+
+def write_atomic(path, text):
+    """임시 파일에 쓴 뒤 이름을 바꿔서 덜 쓰인 파일이 남지 않도록 저장"""
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class AnnotationWriter:
+    def __init__(self):
+        """
+        YOLO 라벨 파일을 백그라운드 스레드에서 저장하는 write-behind 큐
+
+        같은 파일에 대한 저장 요청이 쌓이면 마지막 내용만 한 번 저장하고,
+        결과는 poll_results()로 Tk 스레드에서 꺼내 상태바에 표시함
+        """
+        self._pending = OrderedDict()  # 라벨 경로 -> (class_ids, yolo_boxes)
+        self._results = deque()        # (라벨 경로, 오류 또는 None)
+        self._writing = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._worker, name="annotation-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, txt_path, class_ids, yolo_boxes):
+        """
+        라벨 저장 요청 (즉시 반환)
+
+        Args:
+            txt_path (str): 저장할 라벨 파일 경로
+            class_ids (numpy.ndarray): (N,) 클래스 번호
+            yolo_boxes (numpy.ndarray): (N, 4) 정규화된 x_center, y_center, width, height
+        """
+        # 저장 전에 bbox가 다시 편집되어도 요청 시점의 내용이 저장되도록 복사
+        snapshot = (np.array(class_ids, copy=True), np.array(yolo_boxes, copy=True))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("저장 큐가 이미 종료되었습니다.")
+            self._pending.pop(txt_path, None)
+            self._pending[txt_path] = snapshot
+            self._condition.notify()
+
+    def pending_count(self):
+        with self._condition:
+            return len(self._pending) + (1 if self._writing else 0)
+
+    def poll_results(self):
+        """
+        (Tk 스레드) 끝난 저장 결과 꺼내기
+
+        Returns:
+            list: [(라벨 경로, 오류 또는 None), ...]
+        """
+        results = []
+        with self._condition:
+            while self._results:
+                results.append(self._results.popleft())
+        return results
+
+    def flush(self, timeout=None):
+        """
+        대기 중인 저장이 모두 끝날 때까지 기다림
+
+        Returns:
+            bool: 제한 시간 안에 모두 저장했으면 True
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and self._writing is None, timeout=timeout)
+
+    def close(self, timeout=None):
+        """남은 저장을 마치고 작업 스레드 종료 (프로그램 종료 시 호출)"""
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        return flushed
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                txt_path, (class_ids, yolo_boxes) = self._pending.popitem(last=False)
+                self._writing = txt_path
+
+            error = None
+            try:
+                write_atomic(txt_path, format_yolo_lines(class_ids, yolo_boxes))
+            except Exception as e:
+                print(f"라벨 저장 중 오류 발생 ({txt_path}): {e}")
+                error = e
+
+            with self._condition:
+                self._writing = None
+                self._results.append((txt_path, error))
+                self._condition.notify_all()
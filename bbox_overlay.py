@@ -0,0 +1,50 @@
+import numpy as np
+from PIL import Image, ImageDraw
+
+
+def visible_box_mask(canvas_boxes, canvas_size):
+    """
+    캔버스 영역과 겹치는 bbox 마스크
+
+    Args:
+        canvas_boxes (numpy.ndarray): (N, 4) 캔버스 좌표 x1y1x2y2
+        canvas_size (tuple): 캔버스 크기 (width, height)
+
+    Returns:
+        numpy.ndarray: (N,) bool 배열
+    """
+    canvas_boxes = np.asarray(canvas_boxes, dtype=np.float32).reshape(-1, 4)
+    width, height = canvas_size
+    left = np.minimum(canvas_boxes[:, 0], canvas_boxes[:, 2])
+    right = np.maximum(canvas_boxes[:, 0], canvas_boxes[:, 2])
+    top = np.minimum(canvas_boxes[:, 1], canvas_boxes[:, 3])
+    bottom = np.maximum(canvas_boxes[:, 1], canvas_boxes[:, 3])
+    return (right >= 0) & (left <= width) & (bottom >= 0) & (top <= height)
+
+
+def render_box_overlay(canvas_boxes, colors, canvas_size, width=1):
+    """
+    여러 bbox를 투명 배경의 RGBA 이미지 한 장에 그림 (캔버스 항목 대신 사용)
+
+    Args:
+        canvas_boxes (numpy.ndarray): (N, 4) 캔버스 좌표 x1y1x2y2
+        colors (list): bbox별 색상 ('#RRGGBB')
+        canvas_size (tuple): 캔버스 크기 (width, height)
+        width (int): 선 두께
+
+    Returns:
+        PIL.Image: 캔버스 크기의 RGBA 이미지
+    """
+    overlay = Image.new('RGBA', canvas_size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+
+    # 뒤집힌 좌표 정리 후 캔버스 밖으로 크게 벗어난 좌표는 잘라서 그림
+    boxes = np.asarray(canvas_boxes, dtype=np.float32).reshape(-1, 4)
+    boxes = np.concatenate([np.minimum(boxes[:, :2], boxes[:, 2:]),
+                            np.maximum(boxes[:, :2], boxes[:, 2:])], axis=1)
+    limit = np.array([canvas_size[0], canvas_size[1]] * 2, dtype=np.float32)
+    boxes = np.clip(boxes, -width - 1, limit + width + 1).round().astype(np.int32).tolist()
+
+    for box, color in zip(boxes, colors):
+        draw.rectangle(box, outline=color, width=width)
+    return overlay
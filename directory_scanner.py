@@ -0,0 +1,161 @@
+import os
+import threading
+from array import array
+from collections import deque
+from windowing import DICOM_EXTENSIONS, pydicom
+
+# DICOM은 pydicom이 설치된 경우에만 포함 (없으면 목록에 넣어도 열 때 ImportError)
+IMAGE_EXTENSIONS = (('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff')
+                    + (DICOM_EXTENSIONS if pydicom is not None else ()))
+
+
+class PathList:
+    def __init__(self, paths=()):
+        """
+        이미지 경로 목록을 폴더 목록 + 파일 이름 바이트열로 압축 보관
+
+        경로마다 문자열 객체를 만들지 않고 폴더 번호(4바이트)와 이름 위치(8바이트)만 저장하므로
+        백만 개 단위 폴더도 메모리를 적게 사용함. 인덱스로 꺼낼 때 경로 문자열을 다시 만듦
+
+        Args:
+            paths (iterable): 초기 경로 목록
+        """
+        self._directories = []       # 폴더 경로 (끝의 구분자 포함)
+        self._directory_ids = {}     # 폴더 경로 -> 번호
+        self._entry_directories = array('I')
+        self._names = bytearray()    # 파일 이름을 이어 붙인 UTF-8 바이트열
+        self._offsets = array('Q', [0])
+        self.extend(paths)
+
+    def __len__(self):
+        return len(self._entry_directories)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("경로 목록 범위를 벗어났습니다.")
+        name = self._names[self._offsets[index]:self._offsets[index + 1]].decode('utf-8', 'surrogateescape')
+        return self._directories[self._entry_directories[index]] + name
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, path):
+        # 원래 문자열 그대로 복원되도록 마지막 구분자 위치에서 자름 ('/'와 os.sep 모두 처리)
+        cut = max(path.rfind('/'), path.rfind(os.sep)) + 1
+        directory = path[:cut]
+        directory_id = self._directory_ids.get(directory)
+        if directory_id is None:
+            directory_id = len(self._directories)
+            self._directories.append(directory)
+            self._directory_ids[directory] = directory_id
+        self._entry_directories.append(directory_id)
+        self._names += path[cut:].encode('utf-8', 'surrogateescape')
+        self._offsets.append(len(self._names))
+
+    def extend(self, paths):
+        for path in paths:
+            self.append(path)
+
+
+class DirectoryScanner:
+    def __init__(self, extensions=IMAGE_EXTENSIONS, recursive=True, chunk_size=2000):
+        """
+        폴더를 백그라운드 스레드에서 os.scandir로 훑어 이미지 경로를 조금씩 넘겨주는 스캐너
+
+        폴더마다 파일 이름 순으로 정렬해서 내보내며, 파일이 많은 폴더는 chunk_size개씩
+        정렬해서 바로 내보내므로 전체 목록을 다 읽기 전에 첫 이미지를 보여줄 수 있음.
+        '.'으로 시작하는 폴더(.bbox_cache 등)는 건너뜀
+
+        Args:
+            extensions (tuple): 포함할 확장자 (소문자)
+            recursive (bool): 하위 폴더까지 읽을지 여부
+            chunk_size (int): 한 번에 내보내는 최대 경로 수
+        """
+        self.extensions = tuple(extensions)
+        self.recursive = recursive
+        self.chunk_size = chunk_size
+        self._generation = 0
+        self._scanning = False
+        self._found = deque()  # 찾았지만 아직 꺼내지 않은 경로
+        self._lock = threading.Lock()
+
+    def start(self, directories):
+        """새 폴더 목록 읽기 시작 (이전 작업은 버림)"""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._found.clear()
+            self._scanning = True
+        threading.Thread(target=self._scan, args=(generation, list(directories)),
+                         name="directory-scan", daemon=True).start()
+
+    def cancel(self):
+        with self._lock:
+            self._generation += 1
+            self._found.clear()
+            self._scanning = False
+
+    def has_work(self):
+        with self._lock:
+            return self._scanning or bool(self._found)
+
+    def drain(self, limit=5000):
+        """
+        (Tk 스레드) 찾은 경로를 최대 limit개 꺼냄
+
+        Returns:
+            list: 이미지 경로 목록
+        """
+        results = []
+        with self._lock:
+            while self._found and len(results) < limit:
+                results.append(self._found.popleft())
+        return results
+
+    def _publish(self, generation, paths):
+        paths.sort()
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._found.extend(paths)
+        return True
+
+    def _scan(self, generation, directories):
+        stack = list(reversed(directories))
+        while stack:
+            directory = stack.pop()
+            files = []
+            subdirectories = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self.recursive:
+                                    subdirectories.append(entry.path)
+                            elif entry.name.lower().endswith(self.extensions):
+                                files.append(entry.path)
+                        except OSError:
+                            continue
+                        if len(files) >= self.chunk_size:
+                            if not self._publish(generation, files):
+                                return
+                            files = []
+            except OSError as e:
+                print(f"폴더 읽기 중 오류 발생 ({directory}): {e}")
+
+            if not self._publish(generation, files):
+                return
+            subdirectories.sort(reverse=True)  # 이름 순서대로 꺼내지도록
+            stack.extend(subdirectories)
+
+        with self._lock:
+            if generation == self._generation:
+                self._scanning = False
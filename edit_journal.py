@@ -0,0 +1,197 @@
+import os
+import json
+import threading
+
+
+class EditJournal:
+    def __init__(self, journal_dir, checkpoint_interval=1000):
+        """
+        bbox 편집 내역을 추가 전용(JSONL) 저널에 기록해 비정상 종료 시 복구
+
+        이미지를 처음 편집할 때 그 이미지의 bbox 전체를 한 번 기록하고 이후에는 변경만 기록함.
+        저장(n)되지 않은 이미지의 bbox 상태를 메모리에 함께 유지하다가
+        checkpoint_interval개 기록마다 체크포인트로 한 번에 써 두고 저널을 비우므로,
+        복구 시 체크포인트 하나와 짧은 저널만 다시 적용하면 됨
+
+        Args:
+            journal_dir (str): 저널과 체크포인트를 둘 폴더
+            checkpoint_interval (int): 체크포인트 사이 최대 기록 수
+        """
+        self.journal_dir = journal_dir
+        self.journal_path = os.path.join(journal_dir, "journal.jsonl")
+        self.checkpoint_path = os.path.join(journal_dir, "checkpoint.json")
+        self.checkpoint_interval = checkpoint_interval
+        self._state = {}  # 이미지 경로 -> {"size": [w, h], "boxes": {bbox id: [class_id, x1, y1, x2, y2]}}
+        self._records = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def has_unsaved(self):
+        """이전 실행에서 남은 저널/체크포인트가 있는지 여부"""
+        return os.path.exists(self.checkpoint_path) or (
+            os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > 0)
+
+    def recover(self):
+        """
+        체크포인트와 저널을 다시 적용해 저장되지 않은 bbox 상태 복원
+
+        마지막 줄이 덜 쓰였으면 그 앞까지만 적용함
+
+        Returns:
+            dict: 이미지 경로 -> (이미지 크기, [(class_id, x1, y1, x2, y2), ...])
+                  (모두 지운 이미지는 빈 목록)
+        """
+        state = {}
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                for image_path, image_state in json.load(f).items():
+                    state[image_path] = {
+                        "size": image_state["size"],
+                        "boxes": {int(key): bbox for key, bbox in image_state["boxes"].items()},
+                    }
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # 기록 도중 종료된 마지막 줄
+                    self._apply(state, record)
+
+        return {image_path: (tuple(image_state["size"]), list(image_state["boxes"].values()))
+                for image_path, image_state in state.items()}
+
+    def start(self, initial_state=None):
+        """
+        새 저널 시작 (이전 기록은 체크포인트 하나로 정리)
+
+        Args:
+            initial_state (dict): 이미지 경로 -> (이미지 크기, {bbox id: (class_id, x1, y1, x2, y2)})
+                                  복구해서 다시 저장해야 하는 상태
+        """
+        with self._lock:
+            self._state = {}
+            for image_path, (image_size, boxes) in (initial_state or {}).items():
+                self._state[image_path] = {
+                    "size": list(image_size),
+                    "boxes": {key: list(bbox) for key, bbox in boxes.items()},
+                }
+            os.makedirs(self.journal_dir, exist_ok=True)
+            self._checkpoint()
+
+    def is_tracking(self, image_path):
+        """저장되지 않은 편집이 기록된 이미지인지 여부"""
+        with self._lock:
+            return image_path in self._state
+
+    def record_image(self, image_path, image_size, items):
+        """
+        편집 전 이미지의 bbox 전체 기록 (라벨 파일에서 읽은 bbox도 복구되도록)
+
+        Args:
+            items (iterable): [(bbox id, (class_id, x1, y1, x2, y2)), ...]
+        """
+        self._record({"op": "image", "image": image_path, "size": list(image_size),
+                      "boxes": [[bbox_key, int(bbox[0]), *(float(v) for v in bbox[1:])]
+                                for bbox_key, bbox in items]})
+
+    def record_add(self, image_path, image_size, bbox_key, class_id, box):
+        self._record({"op": "add", "image": image_path, "size": list(image_size),
+                      "key": bbox_key, "class": int(class_id), "box": [float(v) for v in box]})
+
+    def record_update(self, image_path, bbox_key, box):
+        self._record({"op": "update", "image": image_path, "key": bbox_key,
+                      "box": [float(v) for v in box]})
+
+    def record_class(self, image_path, bbox_key, class_id):
+        self._record({"op": "class", "image": image_path, "key": bbox_key, "class": int(class_id)})
+
+    def record_remove(self, image_path, bbox_key):
+        self._record({"op": "remove", "image": image_path, "key": bbox_key})
+
+    def record_clear(self, image_path):
+        self._record({"op": "clear", "image": image_path})
+
+    def record_saved(self, image_path):
+        """라벨 파일로 저장된 이미지는 더 이상 복구할 필요 없음"""
+        self._record({"op": "saved", "image": image_path})
+
+    def close(self):
+        """
+        저널 닫기
+
+        저장되지 않은 편집이 없으면 저널 파일을 지우고,
+        남아 있으면 다음 실행에서 복구할 수 있도록 체크포인트로 정리함
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            if self._state:
+                self._checkpoint()
+                self._file.close()
+            else:
+                self._file.close()
+                for path in (self.journal_path, self.checkpoint_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+            self._file = None
+
+    def _record(self, record):
+        with self._lock:
+            if self._file is None:
+                return
+            self._apply(self._state, record)
+            self._file.write(json.dumps(record, separators=(',', ':')) + "\n")
+            self._file.flush()  # 프로그램이 비정상 종료되어도 OS 버퍼에는 남음
+            self._records += 1
+            if self._records >= self.checkpoint_interval:
+                self._checkpoint()
+
+    def _apply(self, state, record):
+        """기록 하나를 상태에 반영 (같은 기록을 다시 적용해도 결과가 같음)"""
+        op = record["op"]
+        image_path = record["image"]
+        if op == "saved":
+            state.pop(image_path, None)
+            return
+
+        if op == "image":
+            state[image_path] = {"size": record["size"],
+                                 "boxes": {row[0]: row[1:] for row in record["boxes"]}}
+            return
+
+        if op == "add":
+            image_state = state.setdefault(image_path, {"size": record["size"], "boxes": {}})
+            image_state["boxes"][record["key"]] = [record["class"], *record["box"]]
+            return
+
+        image_state = state.get(image_path)
+        if image_state is None:
+            return
+        if op == "clear":
+            image_state["boxes"].clear()
+            return
+        if record["key"] not in image_state["boxes"]:
+            return
+        if op == "update":
+            image_state["boxes"][record["key"]][1:] = record["box"]
+        elif op == "class":
+            image_state["boxes"][record["key"]][0] = record["class"]
+        elif op == "remove":
+            del image_state["boxes"][record["key"]]
+
+    def _checkpoint(self):
+        """현재 상태를 체크포인트로 원자적으로 저장하고 저널을 비움 (락 안에서 호출)"""
+        temp_path = self.checkpoint_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.checkpoint_path)
+
+        # 체크포인트가 저장된 뒤에 저널을 비움 (그 사이에 종료되어도 다시 적용하면 같은 결과)
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.journal_path, 'w', encoding='utf-8')
+        self._records = 0
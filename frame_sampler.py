@@ -0,0 +1,149 @@
+import os
+import threading
+import numpy as np
+import cv2
+from video_source import frame_path
+
+SAMPLE_MODES = ('every_n', 'interval', 'scene')
+
+
+def frame_signature(frame, analysis_size=(64, 36), bins=32):
+    """
+    장면 비교용 프레임 요약 (축소한 흑백 이미지, 정규화한 밝기 히스토그램)
+
+    Args:
+        frame (numpy.ndarray): BGR 프레임
+        analysis_size (tuple): 비교에 사용할 축소 크기 (width, height)
+        bins (int): 히스토그램 구간 수
+    """
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    small = cv2.resize(gray, analysis_size, interpolation=cv2.INTER_AREA).astype(np.float32)
+    histogram = np.bincount((small.astype(np.int32).ravel() * bins) >> 8, minlength=bins).astype(np.float32)
+    return small, histogram / histogram.sum()
+
+
+def scene_distance(signature, reference):
+    """
+    두 프레임 요약의 차이 (0~1)
+
+    픽셀 평균 절대 차이와 히스토그램 차이(total variation) 중 큰 값을 사용해
+    물체 이동과 밝기/대비 변화를 모두 잡음
+    """
+    pixel_difference = float(np.abs(signature[0] - reference[0]).mean()) / 255.0
+    histogram_difference = 0.5 * float(np.abs(signature[1] - reference[1]).sum())
+    return max(pixel_difference, histogram_difference)
+
+
+class FrameSampler:
+    def __init__(self, mode='scene', every_n=30, interval=1.0, threshold=0.15, min_gap=5,
+                 max_gap=None, analysis_stride=1):
+        """
+        동영상을 한 번만 디코딩하면서 학습용 프레임을 고르는 샘플러
+
+        Args:
+            mode (str): 'every_n' (N 프레임마다), 'interval' (일정 시간마다),
+                        'scene' (마지막으로 고른 프레임과 충분히 달라지면)
+            every_n (int): every_n 모드의 프레임 간격
+            interval (float): interval 모드의 시간 간격 (초)
+            threshold (float): scene 모드에서 새 프레임으로 고를 최소 차이 (0~1)
+            min_gap (int): scene 모드에서 고른 프레임 사이의 최소 간격 (프레임)
+            max_gap (int): scene 모드에서 변화가 없어도 이 간격마다 하나는 고름 (None이면 사용 안 함)
+            analysis_stride (int): scene 모드에서 비교할 프레임 간격 (나머지는 디코딩만 하고 건너뜀)
+        """
+        if mode not in SAMPLE_MODES:
+            raise ValueError(f"알 수 없는 샘플링 방식: {mode}")
+        self.mode = mode
+        self.every_n = max(1, int(every_n))
+        self.interval = float(interval)
+        self.threshold = threshold
+        self.min_gap = min_gap
+        self.max_gap = max_gap
+        self.analysis_stride = max(1, int(analysis_stride))
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def sample(self, video_path, output_dir=None, image_format='.jpg', progress=None):
+        """
+        프레임 고르기
+
+        Args:
+            video_path (str): 동영상 경로
+            output_dir (str): 고른 프레임을 이미지로 저장할 폴더
+                              (None이면 저장하지 않고 "video.mp4#000012" 프레임 경로만 반환)
+            image_format (str): 저장할 이미지 확장자
+            progress (callable): progress(처리한 프레임 수, 전체 프레임 수) - 작업 스레드에서 호출됨
+
+        Returns:
+            list: 고른 프레임의 이미지 경로 (또는 프레임 경로) 목록
+        """
+        capture = cv2.VideoCapture(video_path)
+        if not capture.isOpened():
+            raise IOError(f"동영상을 열 수 없습니다: {video_path}")
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(video_path))[0]
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+
+        selected = []
+        reference = None      # 마지막으로 고른 프레임의 요약 (scene)
+        last_selected = None  # 마지막으로 고른 프레임 번호
+        next_time = 0.0       # 다음으로 고를 시간 (interval, ms)
+        frame_index = -1
+        try:
+            while not self._cancelled.is_set():
+                # 필요한 프레임만 색 변환까지 하고 나머지는 grab()으로 넘김
+                if not capture.grab():
+                    break
+                frame_index += 1
+                if progress is not None and frame_index % 500 == 0:
+                    progress(frame_index, frame_count)
+
+                frame = None
+                signature = None
+                if self.mode == 'every_n':
+                    keep = frame_index % self.every_n == 0
+                elif self.mode == 'interval':
+                    timestamp = capture.get(cv2.CAP_PROP_POS_MSEC)
+                    keep = timestamp >= next_time
+                    if keep:
+                        next_time = timestamp + self.interval * 1000
+                else:
+                    gap = frame_index - last_selected if last_selected is not None else None
+                    if gap is None:
+                        keep = True
+                    elif gap < self.min_gap or frame_index % self.analysis_stride:
+                        keep = False
+                    elif self.max_gap is not None and gap >= self.max_gap:
+                        keep = True
+                    else:
+                        ok, frame = capture.retrieve()
+                        if ok:
+                            signature = frame_signature(frame)
+                        keep = ok and scene_distance(signature, reference) >= self.threshold
+                if not keep:
+                    continue
+
+                if frame is None:
+                    ok, frame = capture.retrieve()
+                    if not ok:
+                        continue
+                if self.mode == 'scene':
+                    reference = signature if signature is not None else frame_signature(frame)
+                last_selected = frame_index
+
+                if output_dir is None:
+                    selected.append(frame_path(video_path, frame_index))
+                else:
+                    # 동영상 프레임 라벨과 같은 이름 규칙 (video_000012.jpg -> video_000012.txt)
+                    image_path = os.path.join(output_dir, f"{stem}_{frame_index:06d}{image_format}")
+                    if not cv2.imwrite(image_path, frame):
+                        raise IOError(f"프레임을 저장할 수 없습니다: {image_path}")
+                    selected.append(image_path)
+        finally:
+            capture.release()
+
+        if progress is not None:
+            progress(frame_index + 1, frame_count)
+        return selected
@@ -0,0 +1,316 @@
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+from PIL import Image
+from resampling import get_resampler
+from windowing import load_image, read_header
+from video_source import parse_frame_path, source_file, get_video_source
+
+
+JPEG_EXTENSIONS = ('.jpg', '.jpeg')
+
+
+# 모드별 픽셀당 바이트 수 (메모리 사용량 추정용)
+_MODE_BYTES = {
+    '1': 1, 'L': 1, 'P': 1, 'LA': 2, 'RGB': 3, 'RGBA': 4, 'CMYK': 4,
+    'I;16': 2, 'I;16B': 2, 'I;16L': 2, 'I': 4, 'F': 4,
+}
+
+
+def estimate_image_bytes(image):
+    """PIL 이미지의 메모리 사용량(바이트) 추정"""
+    width, height = image.size
+    return width * height * _MODE_BYTES.get(image.mode, 4)
+
+
+class CachedImage:
+    def __init__(self, image_path, mtime, image, max_variants=4, reduce=1, orig_size=None):
+        """
+        디코딩된 이미지와 화면 표시용 스케일 이미지 보관
+
+        Args:
+            image_path (str): 이미지 파일 경로
+            mtime (float): 파일 수정 시간
+            image (PIL.Image): 디코딩된 이미지
+            max_variants (int): 보관할 스케일 이미지 최대 개수
+            reduce (int): 디코더 축소 배율 (1이면 원본 해상도)
+            orig_size (tuple): 원본 이미지 크기 (축소 디코딩한 경우)
+        """
+        self.image_path = image_path
+        self.mtime = mtime
+        self.image = image
+        self.reduce = reduce
+        self.key = (image_path, mtime, reduce)
+        self.size = image.size
+        self.orig_size = orig_size or image.size
+        self.max_variants = max_variants
+        self.variants = OrderedDict()  # (width, height, resample) -> PIL.Image
+        self.array = None  # OpenCV 리샘플링용 NumPy 배열 (처음 필요할 때 생성)
+
+    @property
+    def nbytes(self):
+        total = estimate_image_bytes(self.image)
+        if self.array is not None:
+            total += self.array.nbytes
+        for variant in self.variants.values():
+            total += estimate_image_bytes(variant)
+        return total
+
+
+class ImageCache:
+    def __init__(self, max_bytes=1024 * 1024 * 1024, draft_factors=(8, 4, 2)):
+        """
+        프로세스 전역 이미지 캐시 (LRU, 메모리 한도 적용)
+
+        Args:
+            max_bytes (int): 캐시가 사용할 최대 메모리 (기본값: 1GB)
+            draft_factors (tuple): JPEG 디코더 축소 배율 후보 (큰 것부터)
+        """
+        self.max_bytes = max_bytes
+        self.draft_factors = draft_factors
+        self._entries = OrderedDict()  # (path, mtime, reduce) -> CachedImage
+        self._path_keys = {}           # path -> {(path, mtime, reduce), ...}
+        self._headers = {}             # (path, mtime) -> ((width, height), mode)
+        self.max_headers = 100000
+        self._current_bytes = 0
+        self._lock = threading.RLock()
+        self.resampler = get_resampler()
+        self.manifest = None  # 데이터셋 헤더 매니페스트 (ImageManifest, 디스크에 보관)
+
+    def set_manifest(self, manifest):
+        """헤더를 읽을 때 사용할 매니페스트 지정 (None이면 사용하지 않음)"""
+        self.manifest = manifest
+
+    def _make_key(self, image_path, reduce=1):
+        image_path = os.path.abspath(image_path)
+        return (image_path, os.path.getmtime(source_file(image_path)), reduce)
+
+    def _decode(self, image_path, reduce=1, orig_size=None):
+        """이미지 파일을 디코딩하고 파일 핸들을 닫음 (16비트/DICOM은 깊이 유지, 동영상은 프레임 하나)"""
+        frame = parse_frame_path(image_path)
+        if frame is not None:
+            return get_video_source().read_frame(*frame)
+        if reduce == 1:
+            return load_image(image_path)
+        width, height = orig_size
+        return load_image(image_path, draft_size=(-(-width // reduce), -(-height // reduce)))
+
+    def get(self, image_path, reduce=1):
+        """
+        캐시된 이미지 반환 (없거나 파일이 변경된 경우 다시 디코딩)
+
+        Args:
+            image_path (str): 이미지 파일 경로
+            reduce (int): JPEG 디코더 축소 배율 (1이면 원본 해상도)
+
+        Returns:
+            CachedImage: 캐시 항목
+        """
+        key = self._make_key(image_path, reduce)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        # 디코딩은 락 밖에서 수행 (다른 스레드가 캐시를 계속 사용할 수 있도록)
+        orig_size = self.get_size(image_path) if reduce > 1 else None
+        image = self._decode(image_path, reduce, orig_size)
+        entry = CachedImage(key[0], key[1], image, reduce=reduce, orig_size=orig_size)
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing
+
+            # 같은 경로의 이전 버전(mtime이 다른 항목) 제거
+            for stale_key in list(self._path_keys.get(key[0], ())):
+                if stale_key[1] != key[1]:
+                    self._remove(stale_key)
+
+            self._entries[key] = entry
+            self._path_keys.setdefault(key[0], set()).add(key)
+            self._current_bytes += entry.nbytes
+            self._evict()
+        return entry
+
+    def _draft_factor(self, image_path, size):
+        """
+        목표 크기를 해상도 손실 없이 만들 수 있는 가장 큰 JPEG 디코더 축소 배율
+
+        원본이 이미 캐시되어 있거나 JPEG가 아니면 1
+        """
+        if not image_path.lower().endswith(JPEG_EXTENSIONS):
+            return 1
+        with self._lock:
+            if self._make_key(image_path) in self._entries:
+                return 1
+
+        orig_width, orig_height = self.get_size(image_path)
+        for factor in self.draft_factors:
+            if orig_width // factor >= size[0] and orig_height // factor >= size[1]:
+                return factor
+        return 1
+
+    def get_header(self, image_path):
+        """
+        원본 이미지 (크기, 모드) 반환
+
+        전체를 디코딩하지 않고 파일 헤더만 읽어서 경로/수정 시간별로 기억함
+        (매니페스트가 있으면 바뀌지 않은 파일은 열지 않음)
+        """
+        key = self._make_key(image_path)
+        with self._lock:
+            header = self._headers.get(key[:2])
+            if header is not None:
+                return header
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry.orig_size, entry.image.mode
+
+        frame = parse_frame_path(image_path)
+        manifest = self.manifest
+        if frame is not None:
+            header = (get_video_source().get_size(frame[0]), 'RGB')
+        elif manifest is not None:
+            header = manifest.read_header(image_path)
+        else:
+            header = read_header(image_path)
+
+        with self._lock:
+            self._headers[key[:2]] = header
+            # 오래된 헤더 정보 정리 (크기/모드만 보관하므로 넉넉하게 유지)
+            while len(self._headers) > self.max_headers:
+                self._headers.pop(next(iter(self._headers)))
+        return header
+
+    def get_size(self, image_path):
+        """원본 이미지 크기 (width, height) 반환 (초대형 이미지도 헤더만 읽음)"""
+        return self.get_header(image_path)[0]
+
+    def get_mode(self, image_path):
+        """디코딩 후 이미지 모드 반환 (16비트는 'I;16')"""
+        return self.get_header(image_path)[1]
+
+    def get_scaled(self, image_path, size, resample=Image.Resampling.LANCZOS):
+        """
+        화면 표시용으로 크기 조정된 이미지 반환
+
+        Args:
+            image_path (str): 이미지 파일 경로
+            size (tuple): 목표 크기 (width, height)
+            resample: PIL 리샘플링 필터
+
+        Returns:
+            PIL.Image: 크기 조정된 이미지
+        """
+        # 화면 크기가 원본의 1/2, 1/4, 1/8 이하이면 JPEG를 디코더에서 줄여서 읽음
+        entry = self.get(image_path, self._draft_factor(image_path, size))
+        if entry.size == tuple(size):
+            return entry.image
+
+        variant_key = (size[0], size[1], resample)
+        with self._lock:
+            variant = entry.variants.get(variant_key)
+            if variant is not None:
+                entry.variants.move_to_end(variant_key)
+                return variant
+
+        variant = self.resampler.resize(entry.image, size, resample, array=self._get_array(entry))
+
+        with self._lock:
+            if variant_key not in entry.variants:
+                entry.variants[variant_key] = variant
+                added_bytes = estimate_image_bytes(variant)
+                # 오래된 스케일 이미지 정리
+                while len(entry.variants) > entry.max_variants:
+                    _, old_variant = entry.variants.popitem(last=False)
+                    added_bytes -= estimate_image_bytes(old_variant)
+                # 크기 조정 중에 항목이 제거되었으면 사용량에 더하지 않음
+                if self._entries.get(entry.key) is entry:
+                    self._current_bytes += added_bytes
+                    self._evict()
+        return variant
+
+    def get_region(self, image_path, source_box, size, resample=Image.Resampling.LANCZOS):
+        """
+        원본 이미지의 일부 영역만 잘라서 크기 조정 (확대 시 화면에 보이는 부분만 처리)
+
+        결과는 패닝할 때마다 달라지므로 캐시하지 않음
+
+        Args:
+            image_path (str): 이미지 파일 경로
+            source_box (tuple): 원본 이미지 좌표의 (left, top, right, bottom)
+            size (tuple): 목표 크기 (width, height)
+            resample: PIL 리샘플링 필터
+
+        Returns:
+            PIL.Image: 잘라서 크기 조정된 이미지
+        """
+        entry = self.get(image_path)
+        return self.resampler.resize_region(entry.image, source_box, size, resample,
+                                            array=self._get_array(entry))
+
+    def _get_array(self, entry):
+        """
+        OpenCV 백엔드용 NumPy 배열 반환 (매번 변환하지 않도록 캐시 항목에 보관)
+
+        PIL 백엔드이거나 OpenCV가 다루지 못하는 모드면 None
+        """
+        if not self.resampler.uses_arrays(entry.image.mode):
+            return None
+        if entry.array is None:
+            array = np.asarray(entry.image)
+            with self._lock:
+                if entry.array is None:
+                    entry.array = array
+                    if self._entries.get(entry.key) is entry:
+                        self._current_bytes += array.nbytes
+                        self._evict()
+        return entry.array
+
+    def invalidate(self, image_path):
+        """특정 이미지의 캐시 항목 제거 (축소 디코딩 항목 포함)"""
+        with self._lock:
+            for key in list(self._path_keys.get(os.path.abspath(image_path), ())):
+                self._remove(key)
+
+    def clear(self):
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._path_keys.clear()
+            self._headers.clear()
+            self._current_bytes = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry.nbytes
+            path_keys = self._path_keys.get(key[0])
+            if path_keys is not None:
+                path_keys.discard(key)
+                if not path_keys:
+                    del self._path_keys[key[0]]
+
+    def _evict(self):
+        """메모리 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+        # 가장 최근 항목 하나는 한도를 넘더라도 유지
+        while self._current_bytes > self.max_bytes and len(self._entries) > 1:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_image_cache():
+    """프로세스 전역에서 공유하는 ImageCache 반환"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ImageCache()
+        return _shared_cache
@@ -0,0 +1,218 @@
+import os
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from windowing import read_header
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    file_size INTEGER NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    sha1 TEXT
+)
+"""
+
+# 도구가 만든 캐시 파일(매니페스트, 저널, 피라미드, 타일 등)을 두는 폴더 이름
+CACHE_DIR_NAME = ".bbox_cache"
+
+
+def is_cache_path(path):
+    """캐시 폴더 안의 파일인지 여부 (피라미드 단계 이미지 등은 데이터셋 이미지가 아님)"""
+    return CACHE_DIR_NAME in os.path.normpath(path).split(os.sep)
+
+
+def content_hash(image_path, chunk_size=1024 * 1024):
+    """파일 내용의 SHA-1 (픽셀을 디코딩하지 않고 바이트만 읽음)"""
+    digest = hashlib.sha1()
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageManifest:
+    def __init__(self, dataset_dir, hash_contents=False, max_workers=4, flush_size=500):
+        """
+        데이터셋 폴더의 이미지 헤더 정보(크기, 모드, 수정 시간, 파일 크기, 내용 해시)를
+        .bbox_cache/manifest.sqlite에 보관하는 매니페스트
+
+        파일 수정 시간과 크기가 같으면 저장된 정보를 그대로 사용하므로
+        다시 열 때 이미지 파일을 열지 않음. 새로 읽은 정보는 모아서 한 번에 기록함
+
+        Args:
+            dataset_dir (str): 데이터셋 폴더 (이 폴더 밖의 이미지는 기록하지 않음)
+            hash_contents (bool): 헤더를 읽을 때 내용 해시도 계산할지 여부
+            max_workers (int): 헤더를 미리 읽는 작업 스레드 수
+            flush_size (int): 이 개수만큼 모이면 파일에 기록
+        """
+        self.dataset_dir = os.path.abspath(dataset_dir)
+        self.hash_contents = hash_contents
+        self.flush_size = flush_size
+        cache_dir = os.path.join(self.dataset_dir, CACHE_DIR_NAME)
+        os.makedirs(cache_dir, exist_ok=True)
+        self.manifest_path = os.path.join(cache_dir, "manifest.sqlite")
+        self._conn = sqlite3.connect(self.manifest_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(SCHEMA)
+        self._pending = {}  # 상대 경로 -> 아직 기록하지 않은 행
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="manifest")
+
+    def _key(self, image_path):
+        """데이터셋 폴더 기준 상대 경로 (폴더 밖이거나 캐시 폴더 안이면 None)"""
+        image_path = os.path.abspath(image_path)
+        try:
+            relative = os.path.relpath(image_path, self.dataset_dir)
+        except ValueError:  # 다른 드라이브
+            return None
+        if relative.startswith(os.pardir) or is_cache_path(relative):
+            return None
+        return relative
+
+    def _get_row(self, key):
+        """(락 안에서 호출) 저장된 행 (mtime_ns, file_size, width, height, mode, sha1)"""
+        row = self._pending.get(key)
+        if row is None:
+            row = self._conn.execute(
+                "SELECT mtime_ns, file_size, width, height, mode, sha1 FROM entries WHERE path = ?",
+                (key,)).fetchone()
+        return row
+
+    def lookup(self, image_path, stat_result=None):
+        """
+        파일이 바뀌지 않았으면 저장된 헤더 반환
+
+        Returns:
+            tuple: ((width, height), mode), 기록이 없거나 파일이 바뀌었으면 None
+        """
+        key = self._key(image_path)
+        if key is None:
+            return None
+        if stat_result is None:
+            stat_result = os.stat(image_path)
+        with self._lock:
+            row = self._get_row(key)
+        if row is None or (row[0], row[1]) != (stat_result.st_mtime_ns, stat_result.st_size):
+            return None
+        return (row[2], row[3]), row[4]
+
+    def record(self, image_path, stat_result, header, sha1=None):
+        """
+        읽은 헤더 기록 (flush_size개가 모이면 파일에 기록)
+
+        Args:
+            stat_result (os.stat_result): 헤더를 읽기 전에 확인한 파일 정보
+            header (tuple): ((width, height), mode)
+            sha1 (str): 내용 해시 (없으면 hash_contents 설정에 따라 계산)
+        """
+        key = self._key(image_path)
+        if key is None:
+            return
+        if sha1 is None and self.hash_contents:
+            sha1 = content_hash(image_path)
+        (width, height), mode = header
+        row = (stat_result.st_mtime_ns, stat_result.st_size, int(width), int(height), mode, sha1)
+        with self._lock:
+            self._pending[key] = row
+            if len(self._pending) >= self.flush_size:
+                self._flush()
+
+    def is_changed(self, image_path):
+        """
+        마지막으로 기록한 뒤 파일이 바뀌었는지 확인 (디코딩 없음)
+
+        수정 시간/크기가 달라도 내용 해시가 같으면(복사, touch 등) 바뀌지 않은 것으로 보고
+        기록을 새 수정 시간으로 갱신함
+        """
+        key = self._key(image_path)
+        if key is None:
+            return True
+        stat_result = os.stat(image_path)
+        with self._lock:
+            row = self._get_row(key)
+        if row is None:
+            return True
+        if (row[0], row[1]) == (stat_result.st_mtime_ns, stat_result.st_size):
+            return False
+        if row[5] is None or row[1] != stat_result.st_size or content_hash(image_path) != row[5]:
+            return True
+        self.record(image_path, stat_result, ((row[2], row[3]), row[4]), sha1=row[5])
+        return False
+
+    def changed_paths(self, image_paths):
+        """새로 추가되었거나 바뀐 이미지 경로 목록"""
+        return [image_path for image_path in image_paths if self.is_changed(image_path)]
+
+    def refresh(self, image_paths, header_reader=None, chunk_size=256):
+        """
+        기록이 없거나 바뀐 이미지의 헤더를 작업 스레드에서 미리 읽어 둠 (즉시 반환)
+
+        Args:
+            image_paths (iterable): 이미지 경로 목록
+            header_reader (callable): 경로 -> ((width, height), mode)
+                                      (ImageCache.get_header를 넘기면 캐시와 매니페스트를 함께 채움)
+            chunk_size (int): 작업 하나에서 처리할 경로 수
+        """
+        if header_reader is None:
+            header_reader = self.read_header
+        with self._lock:
+            generation = self._generation
+        image_paths = list(image_paths)
+        for start in range(0, len(image_paths), chunk_size):
+            self._executor.submit(self._refresh_chunk, generation,
+                                  image_paths[start:start + chunk_size], header_reader)
+
+    def cancel(self):
+        """아직 시작하지 않은 refresh 작업 취소"""
+        with self._lock:
+            self._generation += 1
+
+    def read_header(self, image_path):
+        """매니페스트를 거쳐 헤더 읽기 (바뀌지 않았으면 파일을 열지 않음)"""
+        stat_result = os.stat(image_path)
+        header = self.lookup(image_path, stat_result)
+        if header is None:
+            header = read_header(image_path)
+            self.record(image_path, stat_result, header)
+        return header
+
+    def _refresh_chunk(self, generation, image_paths, header_reader):
+        for image_path in image_paths:
+            with self._lock:
+                if generation != self._generation:
+                    return
+            try:
+                if self.lookup(image_path) is None:
+                    header_reader(image_path)
+            except Exception as e:
+                print(f"이미지 헤더 읽기 중 오류 발생 ({image_path}): {e}")
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        """(락 안에서 호출) 모아 둔 행을 한 트랜잭션으로 기록"""
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (path, mtime_ns, file_size, width, height, mode, sha1) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((key, *row) for key, row in self._pending.items()))
+        self._pending.clear()
+
+    def close(self):
+        """남은 작업을 취소하고 기록을 마친 뒤 닫음"""
+        self.cancel()
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._flush()
+            self._conn.close()
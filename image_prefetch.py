@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ImagePrefetcher:
+    def __init__(self, max_workers=2):
+        """
+        다음/이전 이미지를 작업 스레드에서 미리 디코딩 및 크기 조정
+
+        Args:
+            max_workers (int): 작업 스레드 수
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="prefetch")
+        self._futures = {}  # image_path -> Future
+        self._lock = threading.Lock()
+
+    def prefetch(self, image_paths, prepare, on_ready=None):
+        """
+        이미지 목록을 순서대로 미리 준비
+
+        새 요청에 포함되지 않은 이전 작업은 아직 시작 전이면 취소함
+
+        Args:
+            image_paths (list): 준비할 이미지 경로 (우선순위 순)
+            prepare (callable): 작업 스레드에서 실행할 함수, prepare(image_path) -> 결과
+            on_ready (callable): 준비 완료 시 작업 스레드에서 호출, on_ready(image_path, 결과)
+        """
+        wanted = set(image_paths)
+        stale = []
+        submitted = []
+        with self._lock:
+            for image_path, future in list(self._futures.items()):
+                if image_path not in wanted:
+                    stale.append(future)
+                    del self._futures[image_path]
+
+            for image_path in image_paths:
+                if image_path in self._futures:
+                    continue
+                future = self._executor.submit(self._run, image_path, prepare, on_ready)
+                self._futures[image_path] = future
+                submitted.append((image_path, future))
+
+        # 취소와 완료 콜백은 콜백을 바로 실행할 수 있으므로 (_forget이 락을 잡음) 락 밖에서 호출
+        for future in stale:
+            future.cancel()
+        for image_path, future in submitted:
+            future.add_done_callback(
+                lambda f, image_path=image_path: self._forget(image_path, f))
+
+    def _run(self, image_path, prepare, on_ready):
+        result = prepare(image_path)
+        if on_ready is not None:
+            on_ready(image_path, result)
+        return result
+
+    def _forget(self, image_path, future):
+        with self._lock:
+            if self._futures.get(image_path) is future:
+                del self._futures[image_path]
+        if not future.cancelled() and future.exception() is not None:
+            print(f"이미지 미리 읽기 중 오류 발생 ({image_path}): {future.exception()}")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
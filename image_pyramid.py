@@ -0,0 +1,197 @@
+import os
+import glob
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from image_cache import get_image_cache
+from tile_source import get_tile_source
+from video_source import parse_frame_path
+from windowing import load_image
+
+# 피라미드 레벨로 저장할 수 있는 모드 (나머지는 RGB로 변환)
+_LEVEL_MODES = ("RGB", "RGBA", "L", "I;16")
+
+
+class PyramidCache:
+    def __init__(self, cache_dir_name=".bbox_cache", min_size=4096, min_level_size=512, max_workers=1):
+        """
+        큰 이미지용 다중 해상도(mipmap) 피라미드 관리
+
+        원본을 2의 거듭제곱 배율로 축소한 레벨들을 데이터셋 옆 캐시 폴더에 저장하고,
+        화면 배율에 가장 가까운 레벨을 대신 사용하도록 함.
+        원본은 공유 이미지 캐시에 올리지 않고 빌드 스레드에서 따로 읽음
+
+        Args:
+            cache_dir_name (str): 이미지 폴더 안에 만들 캐시 폴더 이름
+            min_size (int): 피라미드를 만들 이미지의 최소 긴 변 길이
+            min_level_size (int): 가장 작은 레벨의 긴 변 길이
+            max_workers (int): 백그라운드 빌드 스레드 수
+        """
+        self.cache_dir_name = cache_dir_name
+        self.min_size = min_size
+        self.min_level_size = min_level_size
+        self.image_cache = get_image_cache()
+        self.tile_source = get_tile_source()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending = {}  # pyramid_dir -> Future
+        self._lock = threading.Lock()
+
+    def _pyramid_dir(self, image_path):
+        """이미지 경로와 수정 시간으로 피라미드 폴더 경로 생성"""
+        image_dir, image_name = os.path.split(os.path.abspath(image_path))
+        mtime_ns = os.stat(image_path).st_mtime_ns
+        return os.path.join(image_dir, self.cache_dir_name, "pyramid", f"{image_name}.{mtime_ns}")
+
+    def _level_path(self, pyramid_dir, level):
+        return os.path.join(pyramid_dir, f"level_{level}.png")
+
+    def _level_count(self, orig_size):
+        """긴 변이 min_level_size 이하가 될 때까지의 레벨 수 (원본 제외)"""
+        longest = max(orig_size)
+        count = 0
+        while longest // 2 >= self.min_level_size:
+            longest //= 2
+            count += 1
+        return count
+
+    def needs_pyramid(self, orig_size):
+        return max(orig_size) >= self.min_size
+
+    def get_level(self, image_path, orig_size, scale_factor):
+        """
+        화면 배율에 맞는 피라미드 레벨 반환
+
+        원하는 배율보다 해상도가 낮아지지 않는 레벨 중 가장 작은 레벨을 선택하며,
+        피라미드가 아직 없으면 백그라운드 빌드를 요청하고 None을 반환
+
+        Args:
+            image_path (str): 원본 이미지 경로
+            orig_size (tuple): 원본 이미지 크기 (width, height)
+            scale_factor (float): 원본 대비 화면 배율
+
+        Returns:
+            str: 사용할 레벨 이미지 경로 (원본을 써야 하면 None)
+        """
+        if not self.needs_pyramid(orig_size) or parse_frame_path(image_path) is not None:
+            return None
+
+        # 처음 열린 이미지라면 백그라운드 빌드 시작
+        pyramid_dir = self._pyramid_dir(image_path)
+        self._request_build(image_path, pyramid_dir, orig_size)
+
+        level = 0
+        while level < self._level_count(orig_size) and scale_factor <= 0.5 ** (level + 1):
+            level += 1
+        if level == 0:
+            return None
+
+        level_path = self._level_path(pyramid_dir, level)
+        if os.path.exists(level_path):
+            return level_path
+        return None
+
+    def request_build(self, image_path):
+        """피라미드가 없으면 백그라운드에서 생성"""
+        if parse_frame_path(image_path) is not None:
+            return  # 동영상 프레임은 프레임 캐시 사용
+        orig_size = self.image_cache.get_size(image_path)
+        if self.needs_pyramid(orig_size):
+            self._request_build(image_path, self._pyramid_dir(image_path), orig_size)
+
+    def _request_build(self, image_path, pyramid_dir, orig_size):
+        last_level = self._level_count(orig_size)
+        if os.path.exists(self._level_path(pyramid_dir, last_level)):
+            return
+
+        with self._lock:
+            if pyramid_dir in self._pending:
+                return
+            future = self._executor.submit(self._build, image_path, pyramid_dir, orig_size, last_level)
+            self._pending[pyramid_dir] = future
+        future.add_done_callback(lambda f: self._finish_build(pyramid_dir, f))
+
+    def _finish_build(self, pyramid_dir, future):
+        with self._lock:
+            self._pending.pop(pyramid_dir, None)
+        error = future.exception()
+        if error is not None:
+            print(f"피라미드 생성 중 오류 발생: {error}")
+
+    def _build(self, image_path, pyramid_dir, orig_size, last_level):
+        """원본을 절반씩 줄여가며 각 레벨을 저장"""
+        os.makedirs(pyramid_dir, exist_ok=True)
+        self._remove_stale(image_path, pyramid_dir)
+
+        level_image = None
+        for level in range(1, last_level + 1):
+            if level_image is None:
+                level_image = self._first_level(image_path, orig_size)
+            else:
+                level_image = self._half(level_image)
+            level_path = self._level_path(pyramid_dir, level)
+            if os.path.exists(level_path):
+                continue
+
+            # 임시 파일에 쓴 뒤 이름을 바꿔 읽는 쪽에서 덜 쓰인 파일을 보지 않도록 함
+            temp_path = level_path + ".tmp"
+            level_image.save(temp_path, format="PNG", compress_level=1)
+            os.replace(temp_path, level_path)
+
+    def _first_level(self, image_path, orig_size):
+        """
+        원본의 1/2 레벨 만들기
+
+        초대형 이미지의 타일 저장소가 이미 있으면 가로 띠 단위로 읽어 줄이고,
+        없으면 원본을 따로 디코딩함 (JPEG는 디코더에서 바로 1/2 크기로 읽음)
+        """
+        tiled = self.tile_source.get(image_path, orig_size, build=False)
+        if tiled is not None:
+            width, height = tiled.size
+            level_image = Image.new(tiled.mode, ((width + 1) // 2, (height + 1) // 2))
+            strip = tiled.tile_size * 2  # 짝수 줄씩 읽어 띠 경계에서 픽셀이 섞이지 않도록 함
+            for top in range(0, height, strip):
+                rows = tiled.read_rows(top, min(top + strip, height))
+                level_image.paste(self._half(rows), (0, top // 2))
+            return level_image
+
+        half_size = ((orig_size[0] + 1) // 2, (orig_size[1] + 1) // 2)
+        level_image = load_image(image_path, draft_size=half_size)
+        if level_image.mode not in _LEVEL_MODES:
+            level_image = level_image.convert("RGB")
+        if level_image.size != half_size:
+            level_image = self._half(level_image)
+        return level_image
+
+    def _half(self, image):
+        if image.mode == "I;16":
+            # 16비트는 reduce()를 지원하지 않으므로 같은 크기로 BOX 축소
+            width, height = image.size
+            return image.resize(((width + 1) // 2, (height + 1) // 2), Image.Resampling.BOX)
+        return image.reduce(2)
+
+    def _remove_stale(self, image_path, pyramid_dir):
+        """수정 시간이 달라진 이전 피라미드 폴더 삭제"""
+        image_name = os.path.basename(image_path)
+        pattern = os.path.join(os.path.dirname(pyramid_dir), glob.escape(image_name) + ".*")
+        for stale_dir in glob.glob(pattern):
+            if stale_dir == pyramid_dir or not os.path.isdir(stale_dir):
+                continue
+            for name in os.listdir(stale_dir):
+                os.remove(os.path.join(stale_dir, name))
+            os.rmdir(stale_dir)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_pyramid_cache = None
+_shared_pyramid_cache_lock = threading.Lock()
+
+
+def get_pyramid_cache():
+    """프로세스 전역에서 공유하는 PyramidCache 반환 (작업 스레드에서도 호출됨)"""
+    global _shared_pyramid_cache
+    with _shared_pyramid_cache_lock:
+        if _shared_pyramid_cache is None:
+            _shared_pyramid_cache = PyramidCache()
+        return _shared_pyramid_cache
@@ -0,0 +1,69 @@
+import time
+
+
+class MotionScheduler:
+    def __init__(self, root, handler, rate=60):
+        """
+        마우스 이동 이벤트 합치기 (화면 갱신 주기당 한 번만 처리)
+
+        Tk는 B1/B2-Motion 이벤트를 화면 갱신보다 훨씬 자주 보내므로,
+        마지막 포인터 위치만 남겨 두었다가 root.after로 주기마다 한 번 처리함
+
+        Args:
+            root (tk.Tk): after 예약에 사용할 루트 창
+            handler (callable): 실제 처리 함수, handler(event)
+            rate (float): 초당 최대 처리 횟수 (목표 프레임 속도)
+        """
+        self.root = root
+        self.handler = handler
+        self.rate = rate
+        self._latest = None
+        self._after_id = None
+        self._last_run = 0.0
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate):
+        self._rate = max(float(rate), 1.0)
+        self.interval = 1.0 / self._rate
+
+    def submit(self, event):
+        """
+        이동 이벤트 등록
+
+        직전 처리 후 한 주기가 지났으면 바로 처리하고,
+        아니면 다음 주기에 마지막 이벤트 하나만 처리하도록 예약
+        """
+        self._latest = event
+        if self._after_id is not None:
+            return
+
+        remaining = self.interval - (time.perf_counter() - self._last_run)
+        if remaining <= 0:
+            self._run()
+        else:
+            self._after_id = self.root.after(max(int(remaining * 1000), 1), self._run)
+
+    def flush(self):
+        """대기 중인 이벤트를 바로 처리 (버튼을 놓을 때 호출)"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._run()
+
+    def cancel(self):
+        """대기 중인 이벤트 버리기"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._latest = None
+
+    def _run(self):
+        self._after_id = None
+        event, self._latest = self._latest, None
+        if event is None:
+            return
+        self._last_run = time.perf_counter()
+        self.handler(event)
@@ -0,0 +1,212 @@
+import os
+import queue
+import threading
+import itertools
+from collections import deque
+import numpy as np
+from video_source import parse_frame_path
+
+
+def label_path_for(image_path):
+    """
+    이미지와 같은 위치의 YOLO 라벨(.txt) 경로
+
+    동영상 프레임은 프레임을 추출했을 때의 이름 규칙을 따름 (video.mp4의 12번 프레임 -> video_000012.txt)
+    """
+    frame = parse_frame_path(image_path)
+    if frame is not None:
+        video_path, frame_index = frame
+        return f"{os.path.splitext(video_path)[0]}_{frame_index:06d}.txt"
+    return os.path.splitext(image_path)[0] + '.txt'
+
+
+def parse_yolo_label(txt_path):
+    """
+    YOLO 라벨 파일을 배열로 읽기
+
+    Args:
+        txt_path (str): 라벨 파일 경로 (<class> <x_center> <y_center> <width> <height>)
+
+    Returns:
+        tuple: (class_ids (N,) int32, yolo_boxes (N, 4) float32)
+    """
+    with open(txt_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    rows = [parts for parts in (line.split() for line in text.splitlines()) if parts]
+    values = None
+    # 대부분의 파일은 모든 줄이 5개 값이므로 한 번에 변환
+    # (전체 값 개수만 보면 4개/6개 줄이 섞인 파일이 엉뚱한 bbox로 나뉘므로 줄마다 확인)
+    if all(len(parts) == 5 for parts in rows):
+        try:
+            values = np.array(rows, dtype=np.float32).reshape(-1, 5)
+        except ValueError:
+            values = None
+    if values is None:
+        # 형식이 어긋난 줄이 있으면 올바른 줄만 읽음
+        valid_rows = []
+        for parts in rows:
+            if len(parts) == 5:
+                try:
+                    valid_rows.append([float(part) for part in parts])
+                except ValueError:
+                    continue
+        values = np.array(valid_rows, dtype=np.float32).reshape(-1, 5)
+
+    return values[:, 0].astype(np.int32), values[:, 1:]
+
+
+class LabelIndex:
+    def __init__(self, image_cache, max_workers=4):
+        """
+        이미지 폴더의 YOLO 라벨을 백그라운드에서 한꺼번에 읽는 인덱서
+
+        폴더당 한 번만 목록을 읽어 라벨이 있는 이미지만 작업 큐에 넣고,
+        현재 이미지는 우선순위를 높여 먼저 처리함.
+        읽은 라벨과 이미지 헤더(크기)는 파일 수정 시간별로 기억해서 다시 열 때 재사용함
+
+        Args:
+            image_cache (ImageCache): 이미지 헤더(크기) 조회용 캐시
+            max_workers (int): 라벨을 읽을 작업 스레드 수
+        """
+        self.image_cache = image_cache
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()  # 같은 우선순위는 넣은 순서대로
+        self._generation = 0
+        self._pending = set()   # 아직 처리되지 않은 이미지 경로
+        self._parsed = {}       # 라벨 경로 -> (mtime, class_ids, yolo_boxes)
+        self._ready = deque()   # (image_path, image_size, class_ids, yolo_boxes)
+        self._label_names = {}  # 폴더 -> 폴더 안의 .txt 파일 이름 집합 (목록마다 한 번만 읽음)
+        self._position = 0      # 다음에 추가될 이미지의 목록 내 위치
+        self._discovering = 0   # 라벨 파일을 확인 중인 추가 요청 수
+        self._lock = threading.Lock()
+        self._discover_lock = threading.Lock()
+
+        for index in range(max_workers):
+            worker = threading.Thread(target=self._worker, name=f"label-index-{index}", daemon=True)
+            worker.start()
+
+    def start(self, image_paths):
+        """
+        새 이미지 목록의 라벨 읽기 시작 (이전 목록의 남은 작업은 버림)
+
+        폴더 목록 확인도 작업 스레드에서 수행하므로 Tk 스레드를 막지 않음
+        """
+        with self._lock:
+            self._generation += 1
+            self._pending.clear()
+            self._ready.clear()
+            self._label_names = {}
+            self._position = 0
+        self.add(image_paths)
+
+    def add(self, image_paths):
+        """현재 목록 뒤에 이미지 추가 (폴더를 읽는 중 새로 찾은 이미지)"""
+        image_paths = list(image_paths)
+        if not image_paths:
+            return
+        with self._lock:
+            generation = self._generation
+            position = self._position
+            self._position += len(image_paths)
+            self._discovering += 1
+        threading.Thread(target=self._discover, args=(generation, position, image_paths),
+                         name="label-discover", daemon=True).start()
+
+    def prioritize(self, image_path):
+        """현재 이미지의 라벨을 가장 먼저 읽도록 요청"""
+        with self._lock:
+            if image_path in self._pending:
+                self._queue.put((0, next(self._order), self._generation, image_path))
+
+    def is_pending(self, image_path):
+        with self._lock:
+            return image_path in self._pending
+
+    def drain(self, limit=500):
+        """
+        (Tk 스레드) 읽기가 끝난 라벨을 최대 limit개 꺼냄
+
+        Returns:
+            list: [(image_path, image_size, class_ids, yolo_boxes), ...]
+        """
+        results = []
+        with self._lock:
+            while self._ready and len(results) < limit:
+                results.append(self._ready.popleft())
+        return results
+
+    def has_work(self):
+        with self._lock:
+            return bool(self._discovering or self._pending or self._ready)
+
+    def _discover(self, generation, start_position, image_paths):
+        try:
+            self._discover_labels(generation, start_position, image_paths)
+        finally:
+            with self._lock:
+                self._discovering -= 1
+
+    def _discover_labels(self, generation, start_position, image_paths):
+        """폴더별로 한 번만 목록을 읽어 라벨 파일이 있는 이미지만 큐에 넣음"""
+        jobs = []
+        with self._discover_lock:  # 같은 폴더를 여러 스레드가 동시에 읽지 않도록
+            with self._lock:
+                if generation != self._generation:
+                    return
+                label_names = self._label_names
+            for position, image_path in enumerate(image_paths, start_position):
+                directory = os.path.dirname(image_path)
+                if directory not in label_names:
+                    try:
+                        with os.scandir(directory or '.') as entries:
+                            label_names[directory] = {entry.name for entry in entries
+                                                      if entry.name.endswith('.txt')}
+                    except OSError as e:
+                        print(f"라벨 폴더 확인 중 오류 발생: {e}")
+                        label_names[directory] = set()
+                if os.path.basename(label_path_for(image_path)) in label_names[directory]:
+                    jobs.append((position, image_path))
+
+        with self._lock:
+            if generation != self._generation:
+                return
+            for position, image_path in jobs:
+                self._pending.add(image_path)
+                self._queue.put((position + 1, next(self._order), generation, image_path))
+
+    def _worker(self):
+        while True:
+            _, _, generation, image_path = self._queue.get()
+            with self._lock:
+                if generation != self._generation or image_path not in self._pending:
+                    continue
+            try:
+                result = self._load(image_path)
+            except Exception as e:
+                print(f"라벨 읽기 중 오류 발생 ({image_path}): {e}")
+                result = None
+
+            with self._lock:
+                if generation != self._generation or image_path not in self._pending:
+                    continue
+                self._pending.discard(image_path)
+                if result is not None:
+                    self._ready.append((image_path, *result))
+
+    def _load(self, image_path):
+        """라벨과 이미지 크기 읽기 (수정 시간이 같으면 이전 결과 재사용)"""
+        txt_path = label_path_for(image_path)
+        mtime = os.stat(txt_path).st_mtime_ns
+        with self._lock:
+            cached = self._parsed.get(txt_path)
+        if cached is not None and cached[0] == mtime:
+            class_ids, yolo_boxes = cached[1], cached[2]
+        else:
+            class_ids, yolo_boxes = parse_yolo_label(txt_path)
+            with self._lock:
+                self._parsed[txt_path] = (mtime, class_ids, yolo_boxes)
+
+        if len(class_ids) == 0:
+            return None
+        return self.image_cache.get_size(image_path), class_ids, yolo_boxes
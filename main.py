@@ -37,6 +37,9 @@ class ModernUIApp(ImageViewer):
         self.setup_bindings()
         self.setup_drag_drop()
 
+        # 종료 시 대기 중인 라벨 저장을 마치고 닫음
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def initialize_base_variables(self):
         """UI에 의존성이 없는 기본 변수들 초기화"""
         # directory 설정
@@ -49,31 +52,8 @@ class ModernUIApp(ImageViewer):
         self.mode = "view"
         self.mode_var = tk.StringVar(value="view")
 
-        # bbox 관련 변수
-        self.start_x = None
-        self.start_y = None
-        self.current_bbox = None
-        self.image_bboxes = {}
-        self.selected_bbox = None
-        self.selected_bbox_id = None
-        self.drag_start_x = None
-        self.drag_start_y = None
-        self.bbox_index = None
-        
-        # 리사이즈 관련
-        self.resize_handles = []
-        self.resizing = False
-        self.resize_handle = None
-        self.resize_corner = None
-
-        # YOLO 학습용 BBOX
-        self.yolo_bboxes = {}
-        
-        # 이미지 관련 변수
-        self.images = []
-        self.current_index = 0
-        self.current_image_tk = None
-        self.image_position = (0, 0)
+        # 편집/렌더링 상태 (ImageViewer와 공유)
+        self.initialize_state()
         
         # 이미지 확대/축소 관련 변수
         self.scale = 1.0
@@ -123,6 +103,9 @@ class ModernUIApp(ImageViewer):
         self.root.bind('<s>', self.select_mode)  
         self.root.bind('<d>', self.draw_mode)  
         self.root.bind('<a>', self.auto_detect)
+        self.root.bind('<w>', self.reset_window)  # 윈도우/레벨 초기화
+        self.root.bind('<r>', self.toggle_review_status)  # 검수 완료 표시 (프로젝트 DB)
+        self.root.bind('<g>', self.go_to_image)  # 번호로 이미지/프레임 이동
         self.root.bind('<c>', self.cycle_class) # 클래스 순환을 위한 바인딩 추가
         self.root.bind('<l>', self.create_navigation_thread)  # 'l' 키 바인딩 추가
             
@@ -131,6 +114,7 @@ class ModernUIApp(ImageViewer):
         self.canvas.bind('<ButtonPress-1>', self.on_mouse_down)
         self.canvas.bind('<B1-Motion>', self.on_mouse_drag)
         self.canvas.bind('<ButtonRelease-1>', self.on_mouse_up)
+        self.canvas.bind('<Motion>', self.on_pointer_move)
         self.canvas.bind('<MouseWheel>', self.on_mousewheel)
         self.canvas.bind('<Button-4>', self.on_mousewheel)
         self.canvas.bind('<Button-5>', self.on_mousewheel)
@@ -139,6 +123,11 @@ class ModernUIApp(ImageViewer):
         self.canvas.bind('<Button-2>', self.start_pan)
         self.canvas.bind('<B2-Motion>', self.pan)
         self.canvas.bind('<ButtonRelease-2>', self.end_pan)
+
+        # 윈도우/레벨 (16비트, DICOM)
+        self.canvas.bind('<Button-3>', self.start_window_drag)
+        self.canvas.bind('<B3-Motion>', self.window_drag)
+        self.canvas.bind('<ButtonRelease-3>', self.end_window_drag)
         
         # 클래스별 색상 설정
         self.class_colors = {
@@ -180,9 +169,25 @@ class ModernUIApp(ImageViewer):
                   command=self.load_images,
                   style='primary.Outline.TButton').pack(side=LEFT, padx=2)
         
+        ttk.Button(file_group, text="📁 Folder",
+                  command=self.load_folder,
+                  style='primary.Outline.TButton').pack(side=LEFT, padx=2)
+
+        ttk.Button(file_group, text="🎞️ Sample Video",
+                  command=self.sample_video_frames,
+                  style='primary.Outline.TButton').pack(side=LEFT, padx=2)
+
         ttk.Button(file_group, text="💾 Save", 
                   command=self.save_current_image_bboxes,
                   style='success.Outline.TButton').pack(side=LEFT, padx=2)
+
+        ttk.Button(file_group, text="🗄️ Project",
+                  command=self.open_project_db,
+                  style='primary.Outline.TButton').pack(side=LEFT, padx=2)
+
+        ttk.Button(file_group, text="📤 Export YOLO",
+                  command=self.export_project_yolo,
+                  style='success.Outline.TButton').pack(side=LEFT, padx=2)
         
         # 모델 그룹 추가
         model_group = ttk.LabelFrame(toolbar, text="Model", padding=5)
@@ -368,8 +373,8 @@ class ModernUIApp(ImageViewer):
         statusbar = ttk.Frame(self.main_container)
         statusbar.pack(fill=X, pady=(10, 0))
         
-        # self.status_label = ttk.Label(statusbar, text="Ready")
-        # self.status_label.pack(side=LEFT)
+        self.status_label = ttk.Label(statusbar, text="Ready")
+        self.status_label.pack(side=LEFT)
         
         # self.coords_label = ttk.Label(statusbar, text="Mouse: 0, 0")
         # self.coords_label.pack(side=RIGHT)
@@ -407,11 +412,15 @@ class ModernUIApp(ImageViewer):
         self.root.bind('<s>', self.select_mode)
         self.root.bind('<d>', self.draw_mode)
         self.root.bind('<a>', self.auto_detect)
+        self.root.bind('<w>', self.reset_window)  # 윈도우/레벨 초기화
+        self.root.bind('<r>', self.toggle_review_status)  # 검수 완료 표시 (프로젝트 DB)
+        self.root.bind('<g>', self.go_to_image)  # 번호로 이미지/프레임 이동
         
         # 마우스 이벤트
         self.canvas.bind('<ButtonPress-1>', self.on_mouse_down)
         self.canvas.bind('<B1-Motion>', self.on_mouse_drag)
         self.canvas.bind('<ButtonRelease-1>', self.on_mouse_up)
+        self.canvas.bind('<Motion>', self.on_pointer_move)
         self.canvas.bind('<MouseWheel>', self.on_mousewheel)
         # self.canvas.bind('<Motion>', self.update_mouse_position)
         
@@ -420,14 +429,15 @@ class ModernUIApp(ImageViewer):
         self.canvas.bind('<B2-Motion>', self.pan)
         self.canvas.bind('<ButtonRelease-2>', self.end_pan)
 
+        # 윈도우/레벨 (16비트, DICOM)
+        self.canvas.bind('<Button-3>', self.start_window_drag)
+        self.canvas.bind('<B3-Motion>', self.window_drag)
+        self.canvas.bind('<ButtonRelease-3>', self.end_window_drag)
+
     def update_mouse_position(self, event):
         """마우스 위치 업데이트"""
         self.coords_label.config(text=f"Mouse: {event.x}, {event.y}")
 
-    # def update_status(self, message):
-    #     """상태바 메시지 업데이트"""
-    #     self.status_label.config(text=message)
-
     def load_class_names(self):
 
         """classes.txt 파일에서 클래스 이름 로드"""
@@ -456,6 +466,8 @@ class ModernUIApp(ImageViewer):
             
             # UI 업데이트
             self.class_combo['values'] = self.class_names
+            if self.project_db is not None:
+                self.project_db.set_classes(self.class_names)
             
             # classes.txt 파일 업데이트
             try:
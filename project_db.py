@@ -0,0 +1,346 @@
+import os
+import time
+import sqlite3
+import threading
+from itertools import groupby
+import numpy as np
+from annotation_writer import format_yolo_lines
+from label_index import label_path_for, parse_yolo_label
+
+# 이미지 검수 상태
+STATUS_UNLABELED = "unlabeled"  # 아직 저장한 적 없음
+STATUS_LABELED = "labeled"      # 저장됨 (bbox가 0개여도 라벨링 완료)
+STATUS_REVIEWED = "reviewed"    # 검수 완료
+STATUS_REJECTED = "rejected"    # 검수에서 제외 (내보내지 않음)
+REVIEW_STATUSES = (STATUS_UNLABELED, STATUS_LABELED, STATUS_REVIEWED, STATUS_REJECTED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    width INTEGER,
+    height INTEGER,
+    status TEXT NOT NULL DEFAULT 'unlabeled',
+    box_count INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS images_status ON images(status);
+
+CREATE TABLE IF NOT EXISTS classes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS boxes (
+    image_id INTEGER NOT NULL REFERENCES images(id) ON DELETE CASCADE,
+    class_id INTEGER NOT NULL,
+    x_center REAL NOT NULL,
+    y_center REAL NOT NULL,
+    width REAL NOT NULL,
+    height REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS boxes_image ON boxes(image_id);
+CREATE INDEX IF NOT EXISTS boxes_class ON boxes(class_id, image_id);
+"""
+
+
+class ProjectDatabase:
+    def __init__(self, db_path):
+        """
+        이미지, bbox, 클래스, 검수 상태를 SQLite 파일 하나에 보관하는 프로젝트 DB
+
+        bbox는 YOLO 포맷(정규화된 x_center, y_center, width, height)으로 저장하고,
+        클래스/상태별 조회는 인덱스로 처리하므로 이미지별 .txt 파일을 열지 않음.
+        이미지 경로는 DB 파일 기준 상대 경로로 저장해서 프로젝트 폴더를 옮겨도 사용 가능
+
+        Args:
+            db_path (str): 프로젝트 DB 파일 경로 (없으면 생성)
+        """
+        self.db_path = db_path
+        self.root_dir = os.path.dirname(os.path.abspath(db_path))
+        self._conn = self._connect()
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL: 내보내기(읽기) 중에도 저장 가능, 커밋마다 fsync하지 않음
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _key(self, image_path):
+        """이미지 경로 -> DB에 저장하는 경로 (프로젝트 폴더 안이면 상대 경로)"""
+        image_path = os.path.abspath(image_path)
+        try:
+            relative = os.path.relpath(image_path, self.root_dir)
+        except ValueError:  # 다른 드라이브
+            return image_path
+        return image_path if relative.startswith(os.pardir) else relative
+
+    def _path(self, key):
+        return os.path.normpath(os.path.join(self.root_dir, key))
+
+    def add_images(self, image_paths):
+        """
+        이미지 등록 (이미 있는 이미지는 그대로 둠)
+
+        Returns:
+            int: 새로 등록된 이미지 수
+        """
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("INSERT OR IGNORE INTO images (path) VALUES (?)",
+                                   ((self._key(image_path),) for image_path in image_paths))
+            return self._conn.total_changes - before
+
+    def image_paths(self, status=None):
+        """등록 순서대로 이미지 경로 목록 (status를 주면 해당 검수 상태만)"""
+        with self._lock:
+            if status is None:
+                rows = self._conn.execute("SELECT path FROM images ORDER BY id")
+            else:
+                rows = self._conn.execute("SELECT path FROM images WHERE status = ? ORDER BY id", (status,))
+            return [self._path(key) for key, in rows]
+
+    def unlabeled_images(self):
+        return self.image_paths(STATUS_UNLABELED)
+
+    def images_with_class(self, class_id):
+        """class_id bbox가 하나 이상 있는 이미지 경로 목록"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM images WHERE id IN "
+                "(SELECT image_id FROM boxes WHERE class_id = ?) ORDER BY id", (int(class_id),))
+            return [self._path(key) for key, in rows]
+
+    def class_counts(self):
+        """
+        클래스별 통계
+
+        Returns:
+            dict: class_id -> (bbox 수, 이미지 수)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT class_id, COUNT(*), COUNT(DISTINCT image_id) FROM boxes GROUP BY class_id")
+            return {class_id: (box_count, image_count) for class_id, box_count, image_count in rows}
+
+    def status_counts(self):
+        """검수 상태별 이미지 수"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM images GROUP BY status")
+            return dict(rows.fetchall())
+
+    def get_classes(self):
+        with self._lock:
+            return [name for name, in self._conn.execute("SELECT name FROM classes ORDER BY id")]
+
+    def set_classes(self, class_names):
+        """클래스 목록 저장 (목록 순서가 class_id)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM classes")
+            self._conn.executemany("INSERT INTO classes (id, name) VALUES (?, ?)", enumerate(class_names))
+
+    def get_status(self, image_path):
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM images WHERE path = ?",
+                                     (self._key(image_path),)).fetchone()
+        return row[0] if row else STATUS_UNLABELED
+
+    def set_status(self, image_paths, status):
+        """이미지 검수 상태 변경"""
+        if status not in REVIEW_STATUSES:
+            raise ValueError(f"알 수 없는 검수 상태: {status}")
+        with self._lock, self._conn:
+            now = time.time()
+            self._conn.executemany(
+                "INSERT INTO images (path, status, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET status = excluded.status, updated_at = excluded.updated_at",
+                ((self._key(image_path), status, now) for image_path in image_paths))
+
+    def save_annotations(self, image_path, image_size, class_ids, yolo_boxes):
+        """
+        이미지 한 장의 bbox를 한 트랜잭션으로 교체 저장 (검수 상태는 labeled로 변경)
+
+        Args:
+            image_path (str): 이미지 경로
+            image_size (tuple): 원본 이미지 크기 (width, height)
+            class_ids (numpy.ndarray): (N,) 클래스 번호
+            yolo_boxes (numpy.ndarray): (N, 4) 정규화된 x_center, y_center, width, height
+        """
+        with self._lock, self._conn:
+            self._write_annotations(self._key(image_path), image_size, class_ids, yolo_boxes)
+
+    def _write_annotations(self, key, image_size, class_ids, yolo_boxes, only_unlabeled=False):
+        """bbox 교체 저장 (트랜잭션과 락 안에서 호출)"""
+        class_ids = np.asarray(class_ids).tolist()
+        yolo_boxes = np.asarray(yolo_boxes, dtype=np.float64).reshape(-1, 4).tolist()
+        width, height = image_size
+        conflict = "WHERE images.status = 'unlabeled'" if only_unlabeled else ""
+        cursor = self._conn.execute(
+            "INSERT INTO images (path, width, height, status, box_count, updated_at) "
+            "VALUES (?, ?, ?, 'labeled', ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET width = excluded.width, height = excluded.height, "
+            "status = excluded.status, box_count = excluded.box_count, "
+            f"updated_at = excluded.updated_at {conflict}",
+            (key, int(width), int(height), len(class_ids), time.time()))
+        if cursor.rowcount == 0:
+            return False  # 이미 라벨이 있는 이미지 (가져오기에서 덮어쓰지 않음)
+
+        image_id, = self._conn.execute("SELECT id FROM images WHERE path = ?", (key,)).fetchone()
+        self._conn.execute("DELETE FROM boxes WHERE image_id = ?", (image_id,))
+        self._conn.executemany(
+            "INSERT INTO boxes (image_id, class_id, x_center, y_center, width, height) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            ((image_id, class_id, *box) for class_id, box in zip(class_ids, yolo_boxes)))
+        return True
+
+    def load_annotations(self, image_path):
+        """
+        저장된 bbox 읽기
+
+        Returns:
+            tuple: (image_size, class_ids (N,) int32, yolo_boxes (N, 4) float32)
+                   한 번도 저장하지 않은 이미지면 None (크기를 모르면 image_size는 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, width, height FROM images WHERE path = ? AND status != 'unlabeled'",
+                (self._key(image_path),)).fetchone()
+            if row is None:
+                return None
+            image_id, width, height = row
+            rows = self._conn.execute(
+                "SELECT class_id, x_center, y_center, width, height FROM boxes WHERE image_id = ? ORDER BY rowid",
+                (image_id,)).fetchall()
+
+        values = np.array(rows, dtype=np.float32).reshape(-1, 5)
+        image_size = (width, height) if width is not None else None
+        return image_size, values[:, 0].astype(np.int32), values[:, 1:]
+
+    def import_yolo_labels(self, image_paths, image_cache, batch_size=1000):
+        """
+        기존 YOLO 라벨 파일을 DB로 가져오기 (이미 DB에 저장한 이미지는 덮어쓰지 않음)
+
+        폴더당 한 번만 목록을 읽고, batch_size장마다 한 번 커밋함
+
+        Args:
+            image_paths (list): 이미지 경로 목록
+            image_cache (ImageCache): 이미지 크기 조회용 (헤더만 읽음)
+
+        Returns:
+            int: 가져온 라벨 파일 수
+        """
+        imported = 0
+        label_names = {}  # 폴더 -> 폴더 안의 .txt 파일 이름 집합
+        pending = []
+
+        def commit():
+            nonlocal imported
+            with self._lock, self._conn:
+                for key, image_size, class_ids, yolo_boxes in pending:
+                    if self._write_annotations(key, image_size, class_ids, yolo_boxes, only_unlabeled=True):
+                        imported += 1
+            pending.clear()
+
+        for image_path in image_paths:
+            directory = os.path.dirname(image_path)
+            if directory not in label_names:
+                try:
+                    with os.scandir(directory or '.') as entries:
+                        label_names[directory] = {entry.name for entry in entries if entry.name.endswith('.txt')}
+                except OSError as e:
+                    print(f"라벨 폴더 확인 중 오류 발생: {e}")
+                    label_names[directory] = set()
+
+            txt_path = label_path_for(image_path)
+            if os.path.basename(txt_path) not in label_names[directory]:
+                continue
+            try:
+                class_ids, yolo_boxes = parse_yolo_label(txt_path)
+                pending.append((self._key(image_path), image_cache.get_size(image_path), class_ids, yolo_boxes))
+            except Exception as e:
+                print(f"라벨 가져오기 중 오류 발생 ({txt_path}): {e}")
+            if len(pending) >= batch_size:
+                commit()
+
+        commit()
+        return imported
+
+    def _export_path(self, key):
+        """
+        DB 경로 -> 내보내기 폴더 안의 상대 경로
+
+        프로젝트 폴더 밖의 이미지는 파일 이름만 쓰면 폴더가 다른 같은 이름끼리 덮어쓰므로
+        드라이브와 절대 경로를 external/ 아래 하위 폴더로 옮겨서 겹치지 않게 함
+        """
+        if not os.path.isabs(key):
+            return key
+        drive, path = os.path.splitdrive(key)
+        parts = ["external"]
+        if drive:
+            # 'C:' -> 'C', UNC 경로(//server/share)는 server, share 폴더로
+            parts.extend(part.rstrip(":") for part in drive.replace("\\", "/").split("/") if part)
+        parts.append(path.lstrip("\\/"))
+        return os.path.join(*parts)
+
+    def export_yolo(self, output_dir=None, statuses=(STATUS_LABELED, STATUS_REVIEWED), batch_size=10000):
+        """
+        YOLO 라벨(.txt) 일괄 내보내기
+
+        별도 읽기 연결에서 batch_size행씩 읽으며 이미지별로 바로 쓰므로
+        전체 bbox를 메모리에 올리지 않음
+
+        Args:
+            output_dir (str): 라벨과 classes.txt를 저장할 폴더
+                              (None이면 라벨만 이미지 옆에 저장하고 classes.txt는 쓰지 않음)
+                              프로젝트 폴더 안의 이미지는 하위 폴더 구조를 유지하고,
+                              밖의 이미지는 external/ 아래에 절대 경로 구조를 그대로 만듦
+            statuses (tuple): 내보낼 검수 상태
+
+        Returns:
+            int: 저장한 라벨 파일 수
+        """
+        conn = self._connect()
+        try:
+            placeholders = ", ".join("?" * len(statuses))
+            cursor = conn.execute(
+                "SELECT i.path, b.class_id, b.x_center, b.y_center, b.width, b.height "
+                "FROM images i LEFT JOIN boxes b ON b.image_id = i.id "
+                f"WHERE i.status IN ({placeholders}) ORDER BY i.id, b.rowid", tuple(statuses))
+
+            def rows():
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        return
+                    yield from batch
+
+            written = 0
+            for key, image_rows in groupby(rows(), key=lambda row: row[0]):
+                boxes = [row[1:] for row in image_rows if row[1] is not None]
+                if output_dir is None:
+                    txt_path = label_path_for(self._path(key))
+                else:
+                    txt_path = label_path_for(os.path.join(output_dir, self._export_path(key)))
+                    os.makedirs(os.path.dirname(txt_path), exist_ok=True)
+
+                class_ids = [box[0] for box in boxes]
+                yolo_boxes = np.array([box[1:] for box in boxes], dtype=np.float64).reshape(-1, 4)
+                with open(txt_path, 'w', encoding='utf-8') as f:
+                    f.write(format_yolo_lines(class_ids, yolo_boxes))
+                written += 1
+
+            class_names = [name for name, in conn.execute("SELECT name FROM classes ORDER BY id")]
+            if class_names and output_dir is not None:
+                with open(os.path.join(output_dir, "classes.txt"), 'w', encoding='utf-8') as f:
+                    f.writelines(f"{name}\n" for name in class_names)
+            return written
+        finally:
+            conn.close()
@@ -0,0 +1,150 @@
+import time
+import threading
+import numpy as np
+from PIL import Image
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+# 빠른 보간 (확대/축소, 패닝 중 미리보기)
+_FAST_FILTERS = (Image.Resampling.NEAREST, Image.Resampling.BILINEAR)
+
+# OpenCV로 처리할 수 있는 PIL 모드 (16비트 그레이스케일 포함)
+_ARRAY_MODES = ('L', 'RGB', 'RGBA', 'I;16')
+
+
+class PILResampler:
+    """PIL.Image.resize 기반 리샘플링"""
+    name = "pil"
+
+    def uses_arrays(self, mode):
+        """NumPy 배열로 처리하는 모드인지 여부"""
+        return False
+
+    def resize(self, image, size, resample=Image.Resampling.LANCZOS, array=None):
+        return image.resize(size, resample)
+
+    def resize_region(self, image, source_box, size, resample=Image.Resampling.LANCZOS, array=None):
+        return image.resize(size, resample, box=source_box)
+
+
+class OpenCVResampler:
+    """
+    cv2.resize 기반 리샘플링 (NumPy 배열에서 바로 처리)
+
+    축소는 INTER_AREA, 미리보기는 INTER_LINEAR, 고화질 확대는 INTER_CUBIC을 사용하며,
+    OpenCV가 다루지 못하는 모드는 PIL로 처리
+    """
+    name = "opencv"
+
+    def __init__(self):
+        self._fallback = PILResampler()
+
+    def uses_arrays(self, mode):
+        """NumPy 배열로 처리하는 모드인지 여부"""
+        return mode in _ARRAY_MODES
+
+    def _interpolation(self, resample, downscale):
+        if resample == Image.Resampling.NEAREST:
+            return cv2.INTER_NEAREST
+        if resample in _FAST_FILTERS:
+            return cv2.INTER_LINEAR
+        return cv2.INTER_AREA if downscale else cv2.INTER_CUBIC
+
+    def _to_array(self, image, array):
+        if array is not None:
+            return array
+        return np.asarray(image)
+
+    def resize(self, image, size, resample=Image.Resampling.LANCZOS, array=None):
+        if image.mode not in _ARRAY_MODES:
+            return self._fallback.resize(image, size, resample)
+
+        pixels = self._to_array(image, array)
+        downscale = size[0] < image.width or size[1] < image.height
+        resized = cv2.resize(pixels, tuple(size), interpolation=self._interpolation(resample, downscale))
+        return Image.fromarray(resized)
+
+    def resize_region(self, image, source_box, size, resample=Image.Resampling.LANCZOS, array=None):
+        if image.mode not in _ARRAY_MODES:
+            return self._fallback.resize_region(image, source_box, size, resample)
+
+        pixels = self._to_array(image, array)
+        left, top, right, bottom = source_box
+        scale_x = size[0] / (right - left)
+        scale_y = size[1] / (bottom - top)
+
+        if scale_x < 1 and scale_y < 1 and resample not in _FAST_FILTERS:
+            # 고화질 축소는 정수 영역으로 잘라 INTER_AREA 사용 (오차는 화면 1픽셀 미만)
+            crop = pixels[int(top):int(np.ceil(bottom)), int(left):int(np.ceil(right))]
+            resized = cv2.resize(crop, tuple(size), interpolation=cv2.INTER_AREA)
+        else:
+            # 소수 좌표 영역을 그대로 맞추기 위해 어파인 변환으로 필요한 부분만 보간
+            # (PIL과 같이 픽셀 중심 기준으로 매핑)
+            matrix = np.array([[scale_x, 0, (0.5 - left) * scale_x - 0.5],
+                               [0, scale_y, (0.5 - top) * scale_y - 0.5]], dtype=np.float64)
+            interpolation = cv2.INTER_NEAREST if resample == Image.Resampling.NEAREST else (
+                cv2.INTER_LINEAR if resample in _FAST_FILTERS else cv2.INTER_CUBIC)
+            resized = cv2.warpAffine(pixels, matrix, tuple(size), flags=interpolation,
+                                     borderMode=cv2.BORDER_REPLICATE)
+        return Image.fromarray(resized)
+
+
+def _benchmark(resampler, image, array, repeat=3):
+    """화면 표시와 비슷한 축소(고화질, 미리보기) 시간 측정"""
+    target = (image.width * 5 // 8, image.height * 5 // 8)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resampler.resize(image, target, Image.Resampling.LANCZOS, array=array)
+        resampler.resize(image, target, Image.Resampling.BILINEAR, array=array)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def select_resampler(sample_size=(1280, 720)):
+    """
+    이 컴퓨터에서 가장 빠른 리샘플링 백엔드 선택
+
+    임의의 RGB 이미지를 화면 크기 정도로 축소하는 시간을 백엔드별로 측정함
+    (NumPy 변환 비용은 캐시에서 배열을 재사용하므로 제외)
+
+    Args:
+        sample_size (tuple): 측정에 사용할 이미지 크기 (width, height)
+
+    Returns:
+        PILResampler | OpenCVResampler: 선택된 백엔드
+    """
+    candidates = [PILResampler()]
+    if cv2 is not None:
+        candidates.append(OpenCVResampler())
+    if len(candidates) == 1:
+        return candidates[0]
+
+    rng = np.random.default_rng(0)
+    array = rng.integers(0, 256, (sample_size[1], sample_size[0], 3), dtype=np.uint8)
+    image = Image.fromarray(array, 'RGB')
+
+    timings = {}
+    for resampler in candidates:
+        try:
+            timings[resampler] = _benchmark(resampler, image, array)
+        except Exception as e:
+            print(f"리샘플링 백엔드 측정 중 오류 발생 ({resampler.name}): {e}")
+    return min(timings, key=timings.get) if timings else candidates[0]
+
+
+_shared_resampler = None
+_shared_resampler_lock = threading.Lock()
+
+
+def get_resampler():
+    """프로세스 전역에서 공유하는 리샘플링 백엔드 반환 (처음 호출 시 측정해서 선택)"""
+    global _shared_resampler
+    with _shared_resampler_lock:
+        if _shared_resampler is None:
+            _shared_resampler = select_resampler()
+        return _shared_resampler
@@ -1,5 +1,5 @@
 import os
-from PIL import Image
+from image_cache import get_image_cache
 import json
 from pathlib import Path
 
@@ -87,9 +87,8 @@ class YOLOBBoxSaver:
             image_position (tuple): 이미지 위치 (x, y)
         """
         try:
-            # 이미지 크기 가져오기
-            with Image.open(image_path) as img:
-                image_size = img.size
+            # 이미지 크기 가져오기 (헤더/매니페스트에서 읽고 디코딩하지 않음)
+            image_size = get_image_cache().get_size(image_path)
 
             # 저장할 파일 경로
             txt_path = Path(image_path).with_suffix('.txt')
@@ -0,0 +1,120 @@
+import math
+
+
+class GridIndex:
+    def __init__(self, cell_size):
+        """
+        이미지 좌표 기반 균일 격자 공간 인덱스 (bbox 클릭 판정용)
+
+        bbox가 걸치는 격자 칸마다 bbox id를 등록해 두고,
+        점/사각형 질의 시 해당 칸의 bbox만 검사함
+
+        Args:
+            cell_size (float): 격자 한 칸의 크기 (원본 이미지 픽셀 단위)
+        """
+        self.cell_size = max(float(cell_size), 1.0)
+        self._cells = {}   # (col, row) -> set(bbox id)
+        self._boxes = {}   # bbox id -> (x1, y1, x2, y2)
+
+    @classmethod
+    def for_image(cls, orig_size, cells_per_side=32):
+        """이미지 크기에 맞는 격자 크기로 인덱스 생성"""
+        return cls(max(orig_size) / cells_per_side)
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def __contains__(self, key):
+        return key in self._boxes
+
+    def _normalize(self, box):
+        x1, y1, x2, y2 = box
+        return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+
+    def _cell_range(self, box):
+        x1, y1, x2, y2 = box
+        col1 = math.floor(x1 / self.cell_size)
+        row1 = math.floor(y1 / self.cell_size)
+        col2 = math.floor(x2 / self.cell_size)
+        row2 = math.floor(y2 / self.cell_size)
+        for col in range(col1, col2 + 1):
+            for row in range(row1, row2 + 1):
+                yield (col, row)
+
+    def insert(self, key, box):
+        """bbox 등록 (같은 id가 있으면 위치 갱신)"""
+        if key in self._boxes:
+            self.remove(key)
+        box = self._normalize(box)
+        self._boxes[key] = box
+        for cell in self._cell_range(box):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def update(self, key, box):
+        """이동/크기 조절된 bbox 위치 갱신 (걸치는 칸이 같으면 칸은 그대로 둠)"""
+        old_box = self._boxes.get(key)
+        box = self._normalize(box)
+        if old_box is not None and set(self._cell_range(old_box)) == set(self._cell_range(box)):
+            self._boxes[key] = box
+            return
+        self.insert(key, box)
+
+    def remove(self, key):
+        """bbox 삭제"""
+        box = self._boxes.pop(key, None)
+        if box is None:
+            return
+        for cell in self._cell_range(box):
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+
+    def clear(self):
+        self._cells.clear()
+        self._boxes.clear()
+
+    def _area(self, key):
+        x1, y1, x2, y2 = self._boxes[key]
+        return (x2 - x1) * (y2 - y1)
+
+    def query_point(self, x, y):
+        """
+        점을 포함하는 bbox id 목록 반환 (면적이 작은 bbox부터)
+
+        Args:
+            x (float), y (float): 원본 이미지 좌표
+
+        Returns:
+            list: bbox id 목록
+        """
+        cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        hits = [key for key in self._cells.get(cell, ())
+                if self._boxes[key][0] <= x <= self._boxes[key][2]
+                and self._boxes[key][1] <= y <= self._boxes[key][3]]
+        hits.sort(key=self._area)
+        return hits
+
+    def query_rect(self, box):
+        """
+        사각형과 겹치는 bbox id 목록 반환 (면적이 작은 bbox부터)
+
+        Args:
+            box (tuple): 원본 이미지 좌표의 (x1, y1, x2, y2)
+
+        Returns:
+            list: bbox id 목록
+        """
+        qx1, qy1, qx2, qy2 = self._normalize(box)
+        candidates = set()
+        for cell in self._cell_range((qx1, qy1, qx2, qy2)):
+            candidates.update(self._cells.get(cell, ()))
+
+        hits = []
+        for key in candidates:
+            x1, y1, x2, y2 = self._boxes[key]
+            if x1 <= qx2 and qx1 <= x2 and y1 <= qy2 and qy1 <= y2:
+                hits.append(key)
+        hits.sort(key=self._area)
+        return hits
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from annotation_store import AnnotationStore
+
+
+def test_add_get_and_grow_past_capacity():
+    store = AnnotationStore((100, 50), capacity=2)
+    for key in range(5):
+        store.add(key, key % 2, (key, key, key + 10, key + 5))
+    assert len(store) == 5
+    assert store.get(3) == (1, 3.0, 3.0, 13.0, 8.0)
+    assert store.keys() == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        store.add(3, 0, (0, 0, 1, 1))
+
+
+def test_remove_moves_last_row_and_keeps_lookup_consistent():
+    store = AnnotationStore((100, 100))
+    store.add_many([10, 11, 12], [0, 1, 2], [[0, 0, 1, 1], [1, 1, 2, 2], [2, 2, 3, 3]])
+    store.remove(10)
+    store.remove(99)  # 없는 id는 무시
+    assert store.keys() == [12, 11]
+    assert store.get(12) == (2, 2.0, 2.0, 3.0, 3.0)
+    assert store.row(12) == 0
+    assert 10 not in store
+
+
+def test_yolo_round_trip():
+    store = AnnotationStore((200, 100))
+    yolo = np.array([[0.5, 0.5, 0.2, 0.4], [0.25, 0.75, 0.1, 0.1]], dtype=np.float32)
+    store.add_yolo([1, 2], [3, 4], yolo)
+    np.testing.assert_allclose(store.pixel_boxes[0], [80, 30, 120, 70])
+    np.testing.assert_allclose(store.yolo_boxes(), yolo, atol=1e-6)
+    assert store.class_ids.tolist() == [3, 4]
+
+
+def test_clip_filter_and_scale():
+    store = AnnotationStore((100, 100))
+    store.add_many([1, 2, 3], [0, 0, 1], [[-10, -5, 50, 120], [10, 10, 20, 20], [30, 30, 40, 40]])
+    store.clip()
+    assert store.get(1) == (0, 0.0, 0.0, 50.0, 100.0)
+
+    removed = store.filter(store.class_ids == 0)
+    assert removed == [3]
+    assert store.keys() == [1, 2]
+    assert store.row(2) == 1
+
+    store.scale(2, 0.5)
+    assert store.image_size == (200, 50)
+    assert store.get(2) == (0, 20.0, 5.0, 40.0, 10.0)
+
+
+def test_clear():
+    store = AnnotationStore((10, 10))
+    store.add(1, 0, (0, 0, 1, 1))
+    store.clear()
+    assert len(store) == 0
+    assert list(store.items()) == []
@@ -0,0 +1,71 @@
+import threading
+import numpy as np
+import pytest
+import annotation_writer
+from annotation_writer import AnnotationWriter, format_yolo_lines
+from label_index import parse_yolo_label
+
+
+def test_format_yolo_lines():
+    text = format_yolo_lines(np.array([0, 2]), np.array([[0.5, 0.5, 0.25, 0.125], [0.1, 0.2, 0.3, 0.4]]))
+    assert text == "0 0.500000 0.500000 0.250000 0.125000\n2 0.100000 0.200000 0.300000 0.400000\n"
+    assert format_yolo_lines(np.zeros(0), np.zeros((0, 4))) == ""
+
+
+def test_repeated_saves_of_one_file_are_coalesced(tmp_path, monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    written = []
+    real_write = annotation_writer.write_atomic
+
+    def blocking_write(path, text):
+        written.append((path, text))
+        if len(written) == 1:
+            started.set()
+            release.wait(5)  # 첫 저장 중에 요청이 쌓이도록
+        real_write(path, text)
+
+    monkeypatch.setattr(annotation_writer, "write_atomic", blocking_write)
+    first = str(tmp_path / "a.txt")
+    second = str(tmp_path / "b.txt")
+    boxes = np.array([[0.5, 0.5, 0.1, 0.1]])
+
+    writer = AnnotationWriter()
+    writer.submit(first, [0], boxes)
+    assert started.wait(5)
+    for class_id in (1, 2, 3):
+        writer.submit(first, [class_id], boxes)
+    writer.submit(second, [4], boxes)
+    assert writer.pending_count() == 3  # 저장 중 1개 + 대기 2개
+    release.set()
+    assert writer.close(timeout=5)
+
+    assert [path for path, _ in written] == [first, first, second]
+    assert parse_yolo_label(first)[0].tolist() == [3]
+    assert parse_yolo_label(second)[0].tolist() == [4]
+    assert [path for path, error in writer.poll_results()] == [first, first, second]
+
+
+def test_submit_saves_a_snapshot(tmp_path):
+    class_ids = np.array([1])
+    boxes = np.array([[0.5, 0.5, 0.2, 0.2]])
+    txt_path = str(tmp_path / "a.txt")
+    writer = AnnotationWriter()
+    writer.submit(txt_path, class_ids, boxes)
+    class_ids[0] = 9  # 요청 뒤 편집은 이번 저장에 반영되지 않음
+    assert writer.close(timeout=5)
+    assert parse_yolo_label(txt_path)[0].tolist() == [1]
+
+
+def test_failed_save_is_reported(tmp_path):
+    writer = AnnotationWriter()
+    missing = str(tmp_path / "missing" / "a.txt")
+    writer.submit(missing, [0], np.array([[0.5, 0.5, 0.1, 0.1]]))
+    assert writer.flush(timeout=5)
+    [(path, error)] = writer.poll_results()
+    assert path == missing
+    assert isinstance(error, OSError)
+
+    writer.close(timeout=5)
+    with pytest.raises(RuntimeError):
+        writer.submit(missing, [0], np.zeros((1, 4)))
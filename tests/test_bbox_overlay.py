@@ -0,0 +1,24 @@
+import numpy as np
+from bbox_overlay import visible_box_mask, render_box_overlay
+
+
+def test_visible_box_mask_handles_flipped_and_offscreen_boxes():
+    boxes = np.array([
+        [10, 10, 20, 20],      # 안쪽
+        [20, 20, 10, 10],      # 뒤집힌 좌표
+        [-50, -50, -10, -10],  # 왼쪽 위 바깥
+        [90, 90, 150, 150],    # 걸침
+        [200, 0, 300, 50],     # 오른쪽 바깥
+    ])
+    assert visible_box_mask(boxes, (100, 100)).tolist() == [True, True, False, True, False]
+
+
+def test_render_box_overlay_draws_outlines_on_transparent_image():
+    overlay = render_box_overlay([[10, 10, 30, 20], [-1000, 50, 5000, 60]],
+                                 ["#FF0000", "#00FF00"], (100, 80))
+    pixels = np.asarray(overlay)
+    assert overlay.mode == "RGBA"
+    assert overlay.size == (100, 80)
+    assert tuple(pixels[10, 15]) == (255, 0, 0, 255)  # 윗변
+    assert pixels[15, 20, 3] == 0                    # 안쪽은 투명
+    assert tuple(pixels[50, 40]) == (0, 255, 0, 255)  # 캔버스 밖으로 벗어난 bbox도 보이는 부분은 그림
@@ -0,0 +1,65 @@
+import os
+import time
+import windowing
+from directory_scanner import IMAGE_EXTENSIONS, PathList, DirectoryScanner
+
+
+def scan_all(scanner, directories, timeout=5.0):
+    scanner.start(directories)
+    paths = []
+    deadline = time.monotonic() + timeout
+    while scanner.has_work() and time.monotonic() < deadline:
+        paths.extend(scanner.drain())
+        time.sleep(0.01)
+    paths.extend(scanner.drain())
+    return paths
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'wb').close()
+    return path
+
+
+def test_dicom_listed_only_when_reader_is_available():
+    assert ('.dcm' in IMAGE_EXTENSIONS) == (windowing.pydicom is not None)
+
+
+def test_path_list_round_trips_paths():
+    paths = ["/data/a/1.jpg", "/data/a/2.jpg", "/data/b/3.png", "relative.png", "/data/한글/사진.jpg"]
+    path_list = PathList(paths)
+    path_list.append("/data/b/4.png")
+    assert len(path_list) == 6
+    assert list(path_list) == paths + ["/data/b/4.png"]
+    assert path_list[-1] == "/data/b/4.png"
+    assert path_list[1:3] == paths[1:3]
+
+
+def test_scanner_lists_images_in_name_order_and_skips_hidden_folders(tmp_path):
+    root = str(tmp_path)
+    expected = [touch(os.path.join(root, name)) for name in ("a.jpg", "b.PNG")]
+    expected += [touch(os.path.join(root, "sub", name)) for name in ("c.jpg", "d.bmp")]
+    touch(os.path.join(root, "notes.txt"))
+    touch(os.path.join(root, ".bbox_cache", "cached.png"))
+
+    assert scan_all(DirectoryScanner(), [root]) == expected
+    # 큰 폴더를 나눠 내보낼 때는 조각마다 정렬하지만 빠지는 파일은 없음
+    assert sorted(scan_all(DirectoryScanner(chunk_size=1), [root])) == expected
+
+
+def test_scanner_non_recursive(tmp_path):
+    root = str(tmp_path)
+    top = touch(os.path.join(root, "a.jpg"))
+    touch(os.path.join(root, "sub", "b.jpg"))
+    assert scan_all(DirectoryScanner(recursive=False), [root]) == [top]
+
+
+def test_restart_discards_previous_scan(tmp_path):
+    first = str(tmp_path / "first")
+    second = str(tmp_path / "second")
+    touch(os.path.join(first, "a.jpg"))
+    expected = touch(os.path.join(second, "b.jpg"))
+
+    scanner = DirectoryScanner()
+    scanner.start([first])
+    assert scan_all(scanner, [second]) == [expected]
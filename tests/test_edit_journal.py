@@ -0,0 +1,84 @@
+import os
+from edit_journal import EditJournal
+
+
+def crash_and_recover(journal_dir):
+    """저널을 닫지 않은 채 (비정상 종료) 새 인스턴스로 복구"""
+    journal = EditJournal(journal_dir)
+    assert journal.has_unsaved()
+    return journal.recover()
+
+
+def test_recover_replays_edits_after_crash(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    journal = EditJournal(journal_dir)
+    journal.start()
+    journal.record_image("a.png", (100, 50), [(1, (0, 10, 10, 20, 20))])
+    journal.record_add("a.png", (100, 50), 2, 1, (30, 30, 40, 40))
+    journal.record_update("a.png", 1, (11, 11, 21, 21))
+    journal.record_class("a.png", 2, 3)
+    journal.record_add("b.png", (80, 80), 5, 0, (1, 1, 2, 2))
+    journal.record_remove("b.png", 5)
+    journal.record_add("c.png", (80, 80), 6, 0, (1, 1, 2, 2))
+    journal.record_saved("c.png")
+
+    recovered = crash_and_recover(journal_dir)
+    assert recovered == {
+        "a.png": ((100, 50), [[0, 11.0, 11.0, 21.0, 21.0], [3, 30.0, 30.0, 40.0, 40.0]]),
+        "b.png": ((80, 80), []),  # 모두 지운 이미지도 빈 상태로 복구
+    }
+
+
+def test_checkpoint_and_journal_give_same_state(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    journal = EditJournal(journal_dir, checkpoint_interval=7)
+    journal.start()
+    for key in range(20):
+        journal.record_add("a.png", (100, 100), key, key % 3, (key, key, key + 1, key + 1))
+    for key in range(0, 20, 2):
+        journal.record_remove("a.png", key)
+
+    [(image_size, boxes)] = crash_and_recover(journal_dir).values()
+    assert image_size == (100, 100)
+    assert [box[1] for box in boxes] == [float(key) for key in range(1, 20, 2)]
+
+
+def test_partially_written_last_line_is_ignored(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    journal = EditJournal(journal_dir)
+    journal.start()
+    journal.record_add("a.png", (10, 10), 1, 0, (1, 1, 2, 2))
+    with open(journal.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"op":"add","image":"a.png","si')
+
+    assert crash_and_recover(journal_dir) == {"a.png": ((10, 10), [[0, 1.0, 1.0, 2.0, 2.0]])}
+
+
+def test_start_restores_initial_state_and_clear_keeps_image(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    journal = EditJournal(journal_dir)
+    journal.start({"a.png": ((10, 10), {7: (1, 1, 1, 5, 5)})})
+    assert journal.is_tracking("a.png")
+    journal.record_clear("a.png")
+    assert crash_and_recover(journal_dir) == {"a.png": ((10, 10), [])}
+
+
+def test_close_removes_files_when_everything_is_saved(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    journal = EditJournal(journal_dir)
+    journal.start()
+    journal.record_add("a.png", (10, 10), 1, 0, (1, 1, 2, 2))
+    journal.record_saved("a.png")
+    journal.close()
+    assert not os.path.exists(journal.journal_path)
+    assert not os.path.exists(journal.checkpoint_path)
+    assert not EditJournal(journal_dir).has_unsaved()
+
+
+def test_close_keeps_unsaved_edits_for_next_run(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    journal = EditJournal(journal_dir)
+    journal.start()
+    journal.record_add("a.png", (10, 10), 1, 0, (1, 1, 2, 2))
+    journal.close()
+    assert EditJournal(journal_dir).recover() == {"a.png": ((10, 10), [[0, 1.0, 1.0, 2.0, 2.0]])}
@@ -0,0 +1,71 @@
+import os
+import cv2
+import numpy as np
+import pytest
+from frame_sampler import FrameSampler, frame_signature, scene_distance
+from video_source import parse_frame_path
+
+SCENE_COLORS = [(200, 30, 30), (30, 200, 30), (30, 30, 200)]
+
+
+def write_scenes(path, scene_length=20, size=(64, 48), fps=10):
+    """장면마다 색이 다른 동영상 (0, 20, 40번 프레임에서 장면이 바뀜)"""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    if not writer.isOpened():
+        pytest.skip("mp4v 인코더를 사용할 수 없음")
+    for color in SCENE_COLORS:
+        for _ in range(scene_length):
+            writer.write(np.full((size[1], size[0], 3), color, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def frame_indices(paths):
+    return [parse_frame_path(path)[1] for path in paths]
+
+
+def test_scene_distance():
+    red = frame_signature(np.full((48, 64, 3), SCENE_COLORS[0], dtype=np.uint8))
+    blue = frame_signature(np.full((48, 64, 3), SCENE_COLORS[2], dtype=np.uint8))
+    assert scene_distance(red, red) == pytest.approx(0.0, abs=1e-6)
+    assert scene_distance(red, blue) > 0.5
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        FrameSampler(mode='random')
+
+
+def test_every_n(tmp_path):
+    video_path = write_scenes(str(tmp_path / "clip.mp4"))
+    assert frame_indices(FrameSampler(mode='every_n', every_n=15).sample(video_path)) == [0, 15, 30, 45]
+
+
+def test_interval(tmp_path):
+    video_path = write_scenes(str(tmp_path / "clip.mp4"))
+    # 10fps, 2초 간격 -> 20프레임마다
+    assert frame_indices(FrameSampler(mode='interval', interval=2.0).sample(video_path)) == [0, 20, 40]
+
+
+def test_scene_changes(tmp_path):
+    video_path = write_scenes(str(tmp_path / "clip.mp4"))
+    assert frame_indices(FrameSampler(mode='scene').sample(video_path)) == [0, 20, 40]
+
+
+def test_scene_max_gap(tmp_path):
+    video_path = write_scenes(str(tmp_path / "clip.mp4"))
+    sampler = FrameSampler(mode='scene', max_gap=12)
+    assert frame_indices(sampler.sample(video_path)) == [0, 12, 20, 32, 40, 52]
+
+
+def test_output_dir(tmp_path):
+    video_path = write_scenes(str(tmp_path / "clip.mp4"))
+    output_dir = tmp_path / "frames"
+    progress = []
+    paths = FrameSampler(mode='scene').sample(
+        video_path, output_dir=str(output_dir), progress=lambda done, total: progress.append((done, total)))
+
+    assert [os.path.basename(path) for path in paths] == [
+        "clip_000000.jpg", "clip_000020.jpg", "clip_000040.jpg"]
+    assert all(os.path.exists(path) for path in paths)
+    assert progress[-1] == (60, 60)
@@ -0,0 +1,155 @@
+import os
+import threading
+from PIL import Image
+from image_cache import ImageCache, estimate_image_bytes
+
+
+def save_image(path, size=(64, 48), color=(255, 0, 0), mode="RGB"):
+    Image.new(mode, size, color).save(path)
+    return str(path)
+
+
+def test_repeated_get_reuses_decoded_entry(tmp_path):
+    image_path = save_image(tmp_path / "a.png")
+    cache = ImageCache()
+    entry = cache.get(image_path)
+    assert cache.get(image_path) is entry
+    assert entry.size == (64, 48)
+
+
+def test_modified_file_is_decoded_again(tmp_path):
+    image_path = save_image(tmp_path / "a.png")
+    cache = ImageCache()
+    old_entry = cache.get(image_path)
+
+    save_image(image_path, color=(0, 255, 0))
+    stat = os.stat(image_path)
+    os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    new_entry = cache.get(image_path)
+
+    assert new_entry is not old_entry
+    assert new_entry.image.getpixel((0, 0)) == (0, 255, 0)
+    assert old_entry.key not in cache._entries  # 이전 버전은 제거됨
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    paths = [save_image(tmp_path / f"{index}.png") for index in range(3)]
+    one_image = 64 * 48 * 3
+    cache = ImageCache(max_bytes=2 * one_image)
+
+    first = cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])  # 0번을 최근 사용으로
+    cache.get(paths[2])
+
+    assert cache.get(paths[0]) is first
+    assert cache._make_key(paths[1]) not in cache._entries
+    assert cache._current_bytes <= 2 * one_image
+
+
+def test_scaled_variants_are_cached(tmp_path):
+    image_path = save_image(tmp_path / "a.png", size=(400, 300))
+    cache = ImageCache()
+    scaled = cache.get_scaled(image_path, (200, 150))
+    assert scaled.size == (200, 150)
+    assert cache.get_scaled(image_path, (200, 150)) is scaled
+    # 원본 크기를 요청하면 원본 이미지를 그대로 반환
+    assert cache.get_scaled(image_path, (400, 300)) is cache.get(image_path).image
+
+
+def cached_bytes(cache):
+    return sum(entry.nbytes for entry in cache._entries.values())
+
+
+def test_variant_of_evicted_entry_is_not_counted(tmp_path):
+    image_path = save_image(tmp_path / "a.png", size=(400, 300))
+    cache = ImageCache()
+    resize = cache.resampler.resize
+
+    def resize_while_evicted(*args, **kwargs):
+        # 크기 조정 도중 다른 스레드가 항목을 제거한 상황
+        cache.invalidate(image_path)
+        return resize(*args, **kwargs)
+
+    cache.resampler.resize = resize_while_evicted
+    assert cache.get_scaled(image_path, (200, 150)).size == (200, 150)
+    assert cache._entries == {}
+    assert cache._current_bytes == 0
+
+
+def test_concurrent_scaling_and_eviction_keep_byte_count(tmp_path):
+    paths = [save_image(tmp_path / f"{index}.png", size=(200, 150)) for index in range(4)]
+    cache = ImageCache(max_bytes=2 * 200 * 150 * 3)
+    errors = []
+
+    def scale(offset):
+        try:
+            for step in range(60):
+                image_path = paths[(step + offset) % len(paths)]
+                cache.get_scaled(image_path, (100 + step % 7, 75))
+                if step % 5 == 0:
+                    cache.invalidate(paths[(step + offset + 1) % len(paths)])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=scale, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert cache._current_bytes == cached_bytes(cache)
+
+
+def test_header_is_read_without_decoding(tmp_path):
+    image_path = save_image(tmp_path / "a.png", size=(123, 45), color=0, mode="L")
+    cache = ImageCache()
+    assert cache.get_header(image_path) == ((123, 45), "L")
+    assert cache.get_size(image_path) == (123, 45)
+    assert not cache._entries
+
+
+def test_region_crops_source_box(tmp_path):
+    image = Image.new("RGB", (100, 100), (0, 0, 0))
+    image.paste((255, 255, 255), (50, 0, 100, 100))
+    image_path = str(tmp_path / "half.png")
+    image.save(image_path)
+
+    region = ImageCache().get_region(image_path, (60, 10, 90, 40), (30, 30), Image.Resampling.NEAREST)
+    assert region.size == (30, 30)
+    assert region.getextrema() == ((255, 255), (255, 255), (255, 255))
+
+
+def test_estimate_image_bytes():
+    assert estimate_image_bytes(Image.new("RGB", (10, 10))) == 300
+    assert estimate_image_bytes(Image.new("I;16", (10, 10))) == 200
+
+
+def test_small_display_decodes_jpeg_at_reduced_scale(tmp_path):
+    image_path = str(tmp_path / "photo.jpg")
+    Image.new("RGB", (1600, 1200), (0, 128, 255)).save(image_path, quality=90)
+    cache = ImageCache()
+
+    scaled = cache.get_scaled(image_path, (200, 150))
+    assert scaled.size == (200, 150)
+    # 1/8 배율로 디코딩한 항목만 생기고 원본 해상도 항목은 만들지 않음
+    assert cache._make_key(image_path, 8) in cache._entries
+    assert cache._make_key(image_path) not in cache._entries
+    assert cache.get(image_path, 8).orig_size == (1600, 1200)
+
+
+def test_jpeg_draft_factor_never_drops_below_target(tmp_path):
+    image_path = str(tmp_path / "photo.jpg")
+    Image.new("RGB", (1600, 1200)).save(image_path)
+    cache = ImageCache()
+    assert cache._draft_factor(image_path, (500, 300)) == 2
+    assert cache._draft_factor(image_path, (900, 700)) == 1
+    # 원본이 이미 캐시되어 있으면 다시 디코딩하지 않고 원본을 사용
+    cache.get(image_path)
+    assert cache._draft_factor(image_path, (200, 150)) == 1
+
+
+def test_draft_factor_is_one_for_non_jpeg(tmp_path):
+    image_path = save_image(tmp_path / "a.png", size=(1600, 1200))
+    assert ImageCache()._draft_factor(image_path, (200, 150)) == 1
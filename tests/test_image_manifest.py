@@ -0,0 +1,97 @@
+import os
+import time
+from PIL import Image
+import image_manifest
+from image_manifest import ImageManifest
+
+
+def save_image(path, size=(32, 16), color=(1, 2, 3)):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Image.new("RGB", size, color).save(path)
+    return path
+
+
+def bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_refresh_records_headers_and_reopen_skips_files(tmp_path, monkeypatch):
+    paths = [save_image(str(tmp_path / f"{index}.png"), size=(10 + index, 20)) for index in range(5)]
+    manifest = ImageManifest(str(tmp_path), flush_size=2)
+    manifest.refresh(paths, chunk_size=2)
+    assert wait_for(lambda: all(manifest.lookup(path) is not None for path in paths))
+    manifest.close()
+
+    def fail(image_path):
+        raise AssertionError("바뀌지 않은 파일의 헤더를 다시 읽음")
+
+    monkeypatch.setattr(image_manifest, "read_header", fail)
+    reopened = ImageManifest(str(tmp_path))
+    try:
+        assert reopened.read_header(paths[3]) == ((13, 20), "RGB")
+        assert reopened.changed_paths(paths) == []
+    finally:
+        reopened.close()
+
+
+def test_modified_file_is_read_again(tmp_path):
+    path = save_image(str(tmp_path / "a.png"))
+    manifest = ImageManifest(str(tmp_path))
+    try:
+        assert manifest.read_header(path) == ((32, 16), "RGB")
+        save_image(path, size=(64, 64))
+        bump_mtime(path)
+        assert manifest.lookup(path) is None
+        assert manifest.is_changed(path)
+        assert manifest.read_header(path) == ((64, 64), "RGB")
+    finally:
+        manifest.close()
+
+
+def test_touched_file_with_same_content_is_unchanged(tmp_path):
+    path = save_image(str(tmp_path / "a.png"))
+    manifest = ImageManifest(str(tmp_path), hash_contents=True)
+    try:
+        manifest.read_header(path)
+        bump_mtime(path)
+        assert not manifest.is_changed(path)
+        assert manifest.lookup(path) == ((32, 16), "RGB")  # 새 수정 시간으로 갱신됨
+
+        save_image(path, color=(9, 9, 9))
+        bump_mtime(path)
+        assert manifest.is_changed(path)
+    finally:
+        manifest.close()
+
+
+def test_files_outside_dataset_are_not_recorded(tmp_path):
+    outside = save_image(str(tmp_path / "other" / "a.png"))
+    manifest = ImageManifest(str(tmp_path / "dataset"))
+    try:
+        assert manifest.read_header(outside) == ((32, 16), "RGB")
+        assert manifest.lookup(outside) is None
+        assert manifest.is_changed(outside)
+    finally:
+        manifest.close()
+
+
+def test_files_in_cache_folders_are_not_recorded(tmp_path):
+    level = save_image(str(tmp_path / "sub" / ".bbox_cache" / "pyramid" / "a_1.png"))
+    manifest = ImageManifest(str(tmp_path))
+    try:
+        assert manifest.read_header(level) == ((32, 16), "RGB")
+        assert manifest.lookup(level) is None
+        manifest.flush()
+        assert manifest._conn.execute("SELECT COUNT(*) FROM entries").fetchone() == (0,)
+    finally:
+        manifest.close()
+    assert image_manifest.is_cache_path(level)
+    assert not image_manifest.is_cache_path(str(tmp_path / "sub" / "a.png"))
@@ -0,0 +1,58 @@
+import threading
+from image_prefetch import ImagePrefetcher
+
+
+def run_with_timeout(target, timeout=5.0):
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def test_prefetch_already_finished_work_does_not_deadlock():
+    prefetcher = ImagePrefetcher(max_workers=2)
+
+    def navigate():
+        for index in range(300):
+            prefetcher.prefetch([f"{index}.png", f"{index + 1}.png"], lambda path: None)
+
+    try:
+        assert run_with_timeout(navigate)
+    finally:
+        prefetcher.shutdown()
+
+
+def test_replacing_pending_set_cancels_stale_work():
+    prefetcher = ImagePrefetcher(max_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+    prepared = []
+    ready = {}
+    done = threading.Event()
+
+    def prepare(path):
+        if path == "blocker.png":
+            started.set()
+            release.wait(5)
+        prepared.append(path)
+        return path.upper()
+
+    def on_ready(path, result):
+        ready[path] = result
+        if path == "next.png":
+            done.set()
+
+    try:
+        prefetcher.prefetch(["blocker.png", "a.png", "b.png"], prepare, on_ready)
+        assert started.wait(5)
+        # 작업 스레드가 막혀 있는 동안 목록을 바꾸면 시작 전 작업(a, b)은 취소됨
+        assert run_with_timeout(lambda: prefetcher.prefetch(["blocker.png", "next.png"], prepare, on_ready))
+        release.set()
+        assert done.wait(5)
+    finally:
+        release.set()
+        prefetcher.shutdown()
+
+    assert prepared == ["blocker.png", "next.png"]
+    assert ready["next.png"] == "NEXT.PNG"
+
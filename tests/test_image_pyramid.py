@@ -0,0 +1,117 @@
+import threading
+import time
+import numpy as np
+from PIL import Image
+import image_pyramid
+from image_pyramid import PyramidCache
+from tile_source import TileSource
+
+
+def wait_for_level(pyramid, image_path, orig_size, scale_factor, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        level_path = pyramid.get_level(image_path, orig_size, scale_factor)
+        if level_path is not None:
+            return level_path
+        time.sleep(0.02)
+    raise AssertionError("피라미드 레벨이 만들어지지 않았습니다.")
+
+
+def test_shared_pyramid_cache_is_created_once_across_threads(monkeypatch):
+    monkeypatch.setattr(image_pyramid, "_shared_pyramid_cache", None)
+    created = []
+    original_init = PyramidCache.__init__
+
+    def slow_init(self, *args, **kwargs):
+        created.append(self)
+        time.sleep(0.05)  # 생성 중에 다른 스레드가 끼어들 수 있도록
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(PyramidCache, "__init__", slow_init)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(image_pyramid.get_pyramid_cache()))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is results[0] for result in results)
+    results[0].shutdown()
+
+
+def test_level_selection_after_build(tmp_path):
+    image_path = str(tmp_path / "large.png")
+    Image.new("RGB", (2048, 1024), (10, 20, 30)).save(image_path)
+    pyramid = PyramidCache(min_size=2048, min_level_size=256)
+    try:
+        assert not pyramid.needs_pyramid((2047, 1024))
+        assert pyramid.get_level(image_path, (2048, 1024), 1.0) is None
+
+        # 빌드가 끝나면 배율 0.25에는 1/4 레벨을 사용
+        deadline = time.monotonic() + 10
+        level_path = None
+        while level_path is None and time.monotonic() < deadline:
+            level_path = pyramid.get_level(image_path, (2048, 1024), 0.25)
+            time.sleep(0.02)
+        assert level_path is not None
+        with Image.open(level_path) as level:
+            assert level.size == (512, 256)
+        # 원하는 배율보다 해상도가 낮은 레벨은 고르지 않음
+        with Image.open(pyramid.get_level(image_path, (2048, 1024), 0.3)) as level:
+            assert level.size == (1024, 512)
+        assert pyramid.get_level(image_path, (2048, 1024), 0.6) is None
+    finally:
+        pyramid.shutdown()
+
+
+def test_build_does_not_fill_the_shared_image_cache(tmp_path):
+    image_path = str(tmp_path / "photo.jpg")
+    Image.new("RGB", (2049, 1025), (200, 100, 50)).save(image_path, quality=95)
+    pyramid = PyramidCache(min_size=2048, min_level_size=256)
+    try:
+        with Image.open(wait_for_level(pyramid, image_path, (2049, 1025), 0.125)) as level:
+            assert level.size == (257, 129)
+        with Image.open(pyramid.get_level(image_path, (2049, 1025), 0.5)) as level:
+            # JPEG는 디코더에서 1/2로 읽어도 reduce(2)와 같은 크기
+            assert level.size == (1025, 513)
+        assert pyramid.image_cache._make_key(image_path) not in pyramid.image_cache._entries
+    finally:
+        pyramid.shutdown()
+
+
+def test_first_level_is_streamed_from_existing_tiles(tmp_path):
+    pixels = np.random.default_rng(0).integers(0, 256, (300, 520, 3), dtype=np.uint8)
+    image_path = str(tmp_path / "tiled.png")
+    Image.fromarray(pixels).save(image_path)
+
+    pyramid = PyramidCache(min_size=512, min_level_size=128)
+    pyramid.tile_source = TileSource(min_pixels=1, tile_size=64)
+    try:
+        deadline = time.monotonic() + 10
+        while pyramid.tile_source.get(image_path, (520, 300)) is None:
+            assert time.monotonic() < deadline, "타일 저장소가 만들어지지 않았습니다."
+            time.sleep(0.02)
+
+        with Image.open(wait_for_level(pyramid, image_path, (520, 300), 0.5)) as level:
+            expected = Image.fromarray(pixels).reduce(2)
+            np.testing.assert_array_equal(np.asarray(level), np.asarray(expected))
+    finally:
+        pyramid.tile_source.shutdown()
+        pyramid.shutdown()
+
+
+def test_image_above_pil_pixel_limit(tmp_path):
+    size = (13400, 13400)  # PIL 기본 압축 폭탄 한도(약 1억 8천만 화소)보다 큼
+    image_path = str(tmp_path / "huge.png")
+    Image.new("L", size, 128).save(image_path, compress_level=1)
+
+    pyramid = PyramidCache()
+    try:
+        pyramid.request_build(image_path)
+        with Image.open(wait_for_level(pyramid, image_path, size, 1 / 16)) as level:
+            assert level.size == (838, 838)
+            assert level.getextrema() == (128, 128)
+    finally:
+        pyramid.shutdown()
@@ -0,0 +1,69 @@
+from input_scheduler import MotionScheduler
+
+
+class FakeRoot:
+    """root.after 예약을 기록만 하고 테스트에서 직접 실행"""
+
+    def __init__(self):
+        self.scheduled = {}
+        self._next_id = 0
+
+    def after(self, delay, callback):
+        self._next_id += 1
+        self.scheduled[self._next_id] = callback
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+    def run_pending(self):
+        scheduled, self.scheduled = self.scheduled, {}
+        for callback in scheduled.values():
+            callback()
+
+
+def test_first_event_runs_immediately_and_rest_are_coalesced():
+    root = FakeRoot()
+    handled = []
+    scheduler = MotionScheduler(root, handled.append, rate=10)
+
+    scheduler.submit("e1")
+    assert handled == ["e1"]
+
+    for event in ("e2", "e3", "e4"):
+        scheduler.submit(event)
+    assert handled == ["e1"]
+    assert len(root.scheduled) == 1  # 예약은 한 번만
+
+    root.run_pending()
+    assert handled == ["e1", "e4"]
+
+
+def test_flush_runs_latest_event_now():
+    root = FakeRoot()
+    handled = []
+    scheduler = MotionScheduler(root, handled.append, rate=10)
+    scheduler.submit("e1")
+    scheduler.submit("e2")
+    scheduler.flush()
+    assert handled == ["e1", "e2"]
+    assert not root.scheduled
+    scheduler.flush()  # 대기 중인 이벤트가 없으면 아무것도 하지 않음
+    assert handled == ["e1", "e2"]
+
+
+def test_cancel_drops_pending_event():
+    root = FakeRoot()
+    handled = []
+    scheduler = MotionScheduler(root, handled.append, rate=10)
+    scheduler.submit("e1")
+    scheduler.submit("e2")
+    scheduler.cancel()
+    root.run_pending()
+    assert handled == ["e1"]
+
+
+def test_rate_has_lower_bound():
+    scheduler = MotionScheduler(FakeRoot(), lambda event: None, rate=0)
+    assert scheduler.rate == 1.0
+    assert scheduler.interval == 1.0
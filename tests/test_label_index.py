@@ -0,0 +1,74 @@
+import time
+import numpy as np
+from label_index import LabelIndex, label_path_for, parse_yolo_label
+
+
+class FakeImageCache:
+    def get_size(self, image_path):
+        return (640, 480)
+
+
+def write_label(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_parse_well_formed_file(tmp_path):
+    txt_path = write_label(tmp_path / "a.txt", "0 0.5 0.5 0.2 0.4\n3 0.1 0.2 0.3 0.4\n")
+    class_ids, yolo_boxes = parse_yolo_label(txt_path)
+    assert class_ids.tolist() == [0, 3]
+    assert class_ids.dtype == np.int32
+    np.testing.assert_allclose(yolo_boxes, [[0.5, 0.5, 0.2, 0.4], [0.1, 0.2, 0.3, 0.4]])
+
+
+def test_parse_ignores_blank_lines_and_trailing_whitespace(tmp_path):
+    txt_path = write_label(tmp_path / "a.txt", "\n1 0.5 0.5 0.2 0.4   \n\n  \n")
+    class_ids, yolo_boxes = parse_yolo_label(txt_path)
+    assert class_ids.tolist() == [1]
+    assert yolo_boxes.shape == (1, 4)
+
+
+def test_parse_does_not_regroup_lines_with_wrong_token_counts(tmp_path):
+    # 4개 + 6개 = 10개로 5의 배수지만 두 줄 모두 잘못된 줄
+    txt_path = write_label(tmp_path / "a.txt",
+                           "0 0.1 0.2 0.3\n1 0.4 0.5 0.6 0.7 0.8\n2 0.5 0.5 0.2 0.2\n")
+    class_ids, yolo_boxes = parse_yolo_label(txt_path)
+    assert class_ids.tolist() == [2]
+    np.testing.assert_allclose(yolo_boxes, [[0.5, 0.5, 0.2, 0.2]])
+
+
+def test_parse_skips_non_numeric_lines(tmp_path):
+    txt_path = write_label(tmp_path / "a.txt", "0 0.5 0.5 0.2 0.4\nperson 0.5 0.5 0.2 0.4\n")
+    class_ids, _ = parse_yolo_label(txt_path)
+    assert class_ids.tolist() == [0]
+
+
+def test_parse_empty_file(tmp_path):
+    class_ids, yolo_boxes = parse_yolo_label(write_label(tmp_path / "a.txt", ""))
+    assert class_ids.shape == (0,)
+    assert yolo_boxes.shape == (0, 4)
+
+
+def test_label_path_for_images_and_video_frames():
+    assert label_path_for("/data/cat.jpg") == "/data/cat.txt"
+    assert label_path_for("/data/clip.mp4#000012") == "/data/clip_000012.txt"
+
+
+def test_label_index_reads_only_images_with_labels(tmp_path):
+    image_paths = [str(tmp_path / f"{name}.jpg") for name in ("a", "b", "c")]
+    write_label(tmp_path / "a.txt", "0 0.5 0.5 0.2 0.4\n")
+    write_label(tmp_path / "c.txt", "")  # bbox가 없는 라벨은 결과에 포함되지 않음
+
+    label_index = LabelIndex(FakeImageCache(), max_workers=2)
+    label_index.start(image_paths)
+    results = []
+    deadline = time.monotonic() + 5
+    while label_index.has_work() and time.monotonic() < deadline:
+        results.extend(label_index.drain())
+        time.sleep(0.01)
+    results.extend(label_index.drain())
+
+    assert [result[0] for result in results] == [image_paths[0]]
+    image_path, image_size, class_ids, yolo_boxes = results[0]
+    assert image_size == (640, 480)
+    assert class_ids.tolist() == [0]
@@ -0,0 +1,143 @@
+import os
+import numpy as np
+import pytest
+from project_db import (ProjectDatabase, STATUS_LABELED, STATUS_REVIEWED, STATUS_REJECTED,
+                        STATUS_UNLABELED)
+from label_index import parse_yolo_label
+
+
+class FakeImageCache:
+    def get_size(self, image_path):
+        return (640, 480)
+
+
+@pytest.fixture
+def project(tmp_path):
+    project_db = ProjectDatabase(str(tmp_path / "project.db"))
+    yield project_db
+    project_db.close()
+
+
+def image_path(tmp_path, name):
+    return str(tmp_path / "images" / name)
+
+
+def test_save_and_load_annotations(tmp_path, project):
+    path = image_path(tmp_path, "a.jpg")
+    project.add_images([path])
+    assert project.load_annotations(path) is None  # 아직 저장하지 않음
+
+    project.save_annotations(path, (640, 480), np.array([1, 2]),
+                             np.array([[0.5, 0.5, 0.1, 0.2], [0.2, 0.3, 0.4, 0.5]]))
+    image_size, class_ids, yolo_boxes = project.load_annotations(path)
+    assert image_size == (640, 480)
+    assert class_ids.tolist() == [1, 2]
+    np.testing.assert_allclose(yolo_boxes, [[0.5, 0.5, 0.1, 0.2], [0.2, 0.3, 0.4, 0.5]], atol=1e-6)
+    assert project.get_status(path) == STATUS_LABELED
+
+    # 다시 저장하면 bbox를 교체함
+    project.save_annotations(path, (640, 480), np.array([], dtype=np.int32), np.zeros((0, 4)))
+    assert len(project.load_annotations(path)[1]) == 0
+
+
+def test_paths_are_stored_relative_to_project(tmp_path, project):
+    path = image_path(tmp_path, "a.jpg")
+    project.add_images([path])
+    assert project._key(path) == os.path.join("images", "a.jpg")
+    assert project.image_paths() == [path]
+
+
+def test_queries_by_class_and_status(tmp_path, project):
+    paths = [image_path(tmp_path, f"{index}.jpg") for index in range(4)]
+    assert project.add_images(paths) == 4
+    assert project.add_images(paths[:2]) == 0
+    project.save_annotations(paths[0], (10, 10), [0, 0, 1], np.full((3, 4), 0.5))
+    project.save_annotations(paths[1], (10, 10), [1], np.full((1, 4), 0.5))
+    project.set_status([paths[1]], STATUS_REVIEWED)
+
+    assert project.images_with_class(1) == paths[:2]
+    assert project.class_counts() == {0: (2, 1), 1: (2, 2)}
+    assert project.unlabeled_images() == paths[2:]
+    assert project.status_counts() == {STATUS_LABELED: 1, STATUS_REVIEWED: 1, STATUS_UNLABELED: 2}
+    with pytest.raises(ValueError):
+        project.set_status(paths, "done")
+
+
+def test_import_does_not_overwrite_saved_labels(tmp_path, project):
+    os.makedirs(tmp_path / "images")
+    saved, imported, missing = (image_path(tmp_path, name) for name in ("saved.jpg", "new.jpg", "none.jpg"))
+    for path, class_id in ((saved, 7), (imported, 3)):
+        with open(os.path.splitext(path)[0] + ".txt", 'w', encoding='utf-8') as f:
+            f.write(f"{class_id} 0.5 0.5 0.1 0.1\n")
+    project.save_annotations(saved, (640, 480), [1], np.full((1, 4), 0.5))
+
+    assert project.import_yolo_labels([saved, imported, missing], FakeImageCache()) == 1
+    assert project.load_annotations(saved)[1].tolist() == [1]
+    assert project.load_annotations(imported)[1].tolist() == [3]
+    assert project.load_annotations(missing) is None
+
+
+def test_export_writes_labels_and_classes(tmp_path, project):
+    paths = [image_path(tmp_path, name) for name in ("a.jpg", "b.jpg", "c.jpg", "d.jpg")]
+    project.add_images(paths)
+    project.set_classes(["cat", "dog"])
+    project.save_annotations(paths[0], (10, 10), [1, 0], np.array([[0.5, 0.5, 0.2, 0.2], [0.1, 0.1, 0.1, 0.1]]))
+    project.save_annotations(paths[1], (10, 10), [], np.zeros((0, 4)))  # bbox 없이 라벨링 완료
+    project.save_annotations(paths[2], (10, 10), [0], np.full((1, 4), 0.5))
+    project.set_status([paths[2]], STATUS_REJECTED)
+
+    output_dir = str(tmp_path / "export")
+    assert project.export_yolo(output_dir, batch_size=1) == 2
+    class_ids, yolo_boxes = parse_yolo_label(os.path.join(output_dir, "images", "a.txt"))
+    assert class_ids.tolist() == [1, 0]
+    np.testing.assert_allclose(yolo_boxes[0], [0.5, 0.5, 0.2, 0.2])
+    assert open(os.path.join(output_dir, "images", "b.txt"), encoding='utf-8').read() == ""
+    assert not os.path.exists(os.path.join(output_dir, "images", "c.txt"))
+    assert not os.path.exists(os.path.join(output_dir, "images", "d.txt"))
+    assert open(os.path.join(output_dir, "classes.txt"), encoding='utf-8').read() == "cat\ndog\n"
+
+
+def test_export_keeps_same_named_images_outside_project_apart(tmp_path):
+    os.makedirs(tmp_path / "project")
+    project = ProjectDatabase(str(tmp_path / "project" / "project.db"))
+    try:
+        first, second = (str(tmp_path / folder / "img.jpg") for folder in ("day", "night"))
+        project.save_annotations(first, (10, 10), [1], np.full((1, 4), 0.5))
+        project.save_annotations(second, (10, 10), [2], np.full((1, 4), 0.5))
+
+        output_dir = str(tmp_path / "export")
+        assert project.export_yolo(output_dir) == 2
+        for path, class_id in ((first, 1), (second, 2)):
+            drive, absolute = os.path.splitdrive(os.path.splitext(path)[0] + ".txt")
+            txt_path = os.path.join(output_dir, "external", drive.rstrip(":"), absolute.lstrip(os.sep))
+            assert parse_yolo_label(txt_path)[0].tolist() == [class_id]
+    finally:
+        project.close()
+
+
+def test_export_next_to_images_leaves_project_folder_alone(tmp_path, project):
+    os.makedirs(tmp_path / "images")
+    path = image_path(tmp_path, "a.jpg")
+    project.set_classes(["cat"])
+    project.save_annotations(path, (10, 10), [0], np.full((1, 4), 0.5))
+
+    assert project.export_yolo() == 1
+    assert parse_yolo_label(os.path.splitext(path)[0] + ".txt")[0].tolist() == [0]
+    assert not os.path.exists(tmp_path / "classes.txt")
+
+
+def test_project_can_be_reopened(tmp_path):
+    db_path = str(tmp_path / "project.db")
+    path = image_path(tmp_path, "a.jpg")
+    project = ProjectDatabase(db_path)
+    project.set_classes(["cat"])
+    project.save_annotations(path, (10, 10), [0], np.full((1, 4), 0.5))
+    project.close()
+
+    reopened = ProjectDatabase(db_path)
+    try:
+        assert reopened.get_classes() == ["cat"]
+        assert reopened.image_paths() == [path]
+        assert reopened.load_annotations(path)[1].tolist() == [0]
+    finally:
+        reopened.close()
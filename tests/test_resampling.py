@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from PIL import Image
+from resampling import PILResampler, OpenCVResampler, select_resampler, cv2
+
+needs_cv2 = pytest.mark.skipif(cv2 is None, reason="OpenCV가 설치되어 있지 않음")
+
+
+def gradient_image(mode="RGB", size=(160, 120)):
+    x = np.linspace(0, 1, size[0])[None, :]
+    y = np.linspace(0, 1, size[1])[:, None]
+    if mode == "I;16":
+        return Image.fromarray(((x * y) * 65535).astype(np.uint16))  # uint16 -> I;16
+    base = ((x + y) / 2 * 255).astype(np.uint8)
+    return Image.fromarray(np.dstack([base, base[::-1], base[:, ::-1]]), "RGB")
+
+
+@needs_cv2
+@pytest.mark.parametrize("resample", [Image.Resampling.BILINEAR, Image.Resampling.LANCZOS])
+@pytest.mark.parametrize("source_box, size", [
+    ((20.5, 10.25, 100.5, 70.25), (160, 120)),  # 확대 (소수 좌표)
+    ((0, 0, 160, 120), (80, 60)),               # 축소
+])
+def test_opencv_region_matches_pil(resample, source_box, size):
+    image = gradient_image()
+    expected = np.asarray(PILResampler().resize_region(image, source_box, size, resample), dtype=np.int16)
+    result = np.asarray(OpenCVResampler().resize_region(image, source_box, size, resample), dtype=np.int16)
+    assert result.shape == expected.shape
+    assert np.abs(result - expected).mean() < 2.0
+
+
+@needs_cv2
+def test_opencv_keeps_16_bit_depth():
+    image = gradient_image("I;16")
+    resized = OpenCVResampler().resize(image, (80, 60))
+    assert resized.mode == "I;16"
+    assert resized.size == (80, 60)
+    assert np.asarray(resized).max() > 255
+
+
+@needs_cv2
+def test_opencv_falls_back_to_pil_for_other_modes():
+    image = gradient_image().convert("P")
+    resampler = OpenCVResampler()
+    assert not resampler.uses_arrays("P")
+    assert resampler.resize(image, (40, 30)).size == (40, 30)
+
+
+def test_select_resampler_returns_a_backend():
+    resampler = select_resampler(sample_size=(64, 48))
+    assert resampler.name in ("pil", "opencv")
@@ -0,0 +1,59 @@
+import random
+from spatial_index import GridIndex
+
+
+def brute_force_point(boxes, x, y):
+    return {key for key, (x1, y1, x2, y2) in boxes.items() if x1 <= x <= x2 and y1 <= y <= y2}
+
+
+def test_point_query_returns_smallest_box_first():
+    index = GridIndex(10)
+    index.insert("large", (0, 0, 100, 100))
+    index.insert("small", (40, 40, 60, 60))
+    assert index.query_point(50, 50) == ["small", "large"]
+    assert index.query_point(5, 5) == ["large"]
+    assert index.query_point(150, 150) == []
+
+
+def test_boxes_are_normalized():
+    index = GridIndex(10)
+    index.insert(1, (60, 60, 40, 40))
+    assert index.query_point(50, 50) == [1]
+
+
+def test_update_and_remove():
+    index = GridIndex(10)
+    index.insert(1, (0, 0, 5, 5))
+    index.update(1, (2, 2, 4, 4))  # 같은 칸 안에서 이동
+    assert index.query_point(1, 1) == []
+    index.update(1, (200, 200, 210, 210))  # 다른 칸으로 이동
+    assert index.query_point(3, 3) == []
+    assert index.query_point(205, 205) == [1]
+
+    index.remove(1)
+    assert len(index) == 0
+    assert index.query_point(205, 205) == []
+    assert not index._cells
+
+
+def test_queries_match_brute_force():
+    rng = random.Random(0)
+    index = GridIndex.for_image((1000, 800))
+    boxes = {}
+    for key in range(300):
+        x, y = rng.uniform(0, 950), rng.uniform(0, 750)
+        box = (x, y, x + rng.uniform(1, 50), y + rng.uniform(1, 50))
+        boxes[key] = box
+        index.insert(key, box)
+    for key in range(0, 300, 3):
+        index.remove(key)
+        del boxes[key]
+
+    for _ in range(200):
+        x, y = rng.uniform(0, 1000), rng.uniform(0, 800)
+        assert set(index.query_point(x, y)) == brute_force_point(boxes, x, y)
+
+    query = (100, 100, 400, 300)
+    expected = {key for key, (x1, y1, x2, y2) in boxes.items()
+                if x1 <= 400 and 100 <= x2 and y1 <= 300 and 100 <= y2}
+    assert set(index.query_rect(query)) == expected
@@ -0,0 +1,92 @@
+import threading
+import time
+import numpy as np
+from PIL import Image
+import tile_source as tile_source_module
+from image_cache import ImageCache
+from tile_source import TileSource
+
+
+def wait_for_tiles(tile_source, image_path, orig_size, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        tiled = tile_source.get(image_path, orig_size)
+        if tiled is not None:
+            return tiled
+        time.sleep(0.02)
+    raise AssertionError("타일 저장소가 만들어지지 않았습니다.")
+
+
+def test_ordinary_photos_are_not_tiled():
+    tile_source = TileSource()
+    try:
+        assert not tile_source.needs_tiles((6000, 4000))   # 24MP 사진
+        assert not tile_source.needs_tiles((11648, 8736))  # 100MP 사진
+        assert tile_source.needs_tiles((20000, 20000))
+    finally:
+        tile_source.shutdown()
+
+
+def test_tiles_match_original_pixels(tmp_path):
+    pixels = np.random.default_rng(0).integers(0, 256, (200, 300, 3), dtype=np.uint8)
+    image_path = str(tmp_path / "big.png")
+    Image.fromarray(pixels).save(image_path)
+
+    tile_source = TileSource(min_pixels=1, tile_size=64)
+    try:
+        tiled = wait_for_tiles(tile_source, image_path, (300, 200))
+        assert tiled.size == (300, 200)
+        assert tiled.tile_range((70, 10, 130, 70)) == (1, 0, 2, 1)
+        np.testing.assert_array_equal(np.asarray(tiled.read_tile(1, 0)), pixels[0:64, 64:128])
+        # 가장자리 타일은 이미지 크기에 맞게 잘림
+        assert tiled.read_tile(4, 3).size == (300 - 256, 200 - 192)
+
+        region = tile_source.get_region(tiled, (70, 10, 130, 70), (60, 60), Image.Resampling.NEAREST)
+        np.testing.assert_array_equal(np.asarray(region), pixels[10:70, 70:130])
+    finally:
+        tile_source.shutdown()
+
+
+def test_image_above_pil_pixel_limit_is_tiled(tmp_path):
+    # PIL 기본 압축 폭탄 한도(약 1억 8천만 화소)와 타일 기준을 모두 넘는 이미지
+    size = (16400, 16400)
+    image = Image.new("L", size, 0)
+    image.paste(255, (8200, 0) + size)
+    image_path = str(tmp_path / "huge.png")
+    image.save(image_path, compress_level=1)
+    del image
+
+    assert ImageCache().get_size(image_path) == size
+    tile_source = TileSource()
+    try:
+        tiled = wait_for_tiles(tile_source, image_path, size, timeout=60.0)
+        region = tile_source.get_region(tiled, (8100, 100, 8300, 300), (20, 20), Image.Resampling.NEAREST)
+        pixels = np.asarray(region)
+        assert pixels[:, :10].max() == 0
+        assert pixels[:, 10:].min() == 255
+    finally:
+        tile_source.shutdown()
+
+
+def test_shared_tile_source_is_created_once_across_threads(monkeypatch):
+    monkeypatch.setattr(tile_source_module, "_shared_tile_source", None)
+    created = []
+    original_init = TileSource.__init__
+
+    def slow_init(self, *args, **kwargs):
+        created.append(self)
+        time.sleep(0.05)  # 생성 중에 다른 스레드가 끼어들 수 있도록
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(TileSource, "__init__", slow_init)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(tile_source_module.get_tile_source()))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is results[0] for result in results)
+    results[0].shutdown()
@@ -0,0 +1,151 @@
+import threading
+import time
+import cv2
+import numpy as np
+import pytest
+from video_source import (FrameIndex, VideoSource, frame_path, is_video, parse_frame_path,
+                          source_file)
+
+
+def write_video(path, frame_count=40, size=(64, 48)):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 10, size)
+    if not writer.isOpened():
+        pytest.skip("mp4v 인코더를 사용할 수 없음")
+    for index in range(frame_count):
+        frame = np.full((size[1], size[0], 3), index * 6 % 256, dtype=np.uint8)
+        cv2.putText(frame, str(index), (5, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def decode_all(path):
+    capture = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    capture.release()
+    return frames
+
+
+def wait_for_index(source, video_path, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        index = source.get_index(video_path)
+        if index is not None:
+            return index
+        time.sleep(0.02)
+    raise AssertionError("프레임 인덱스가 만들어지지 않았습니다.")
+
+
+def test_frame_path_helpers():
+    path = frame_path("/data/clip.mp4", 12)
+    assert path == "/data/clip.mp4#000012"
+    assert parse_frame_path(path) == ("/data/clip.mp4", 12)
+    assert parse_frame_path("/data/image#1.png") is None
+    assert parse_frame_path("/data/clip.mp4") is None
+    assert source_file(path) == "/data/clip.mp4"
+    assert is_video("/data/CLIP.MP4")
+    assert not is_video(path)
+
+
+def test_keyframe_before():
+    index = FrameIndex(100, 25.0, (64, 48), np.array([0, 30, 60]), np.zeros(100))
+    assert index.keyframe_before(0) == 0
+    assert index.keyframe_before(45) == 30
+    assert index.keyframe_before(60) == 60
+    assert index.keyframe_before(99) == 60
+
+
+def test_index_is_built_and_saved_next_to_video(tmp_path):
+    video_path = write_video(str(tmp_path / "clip.mp4"))
+    source = VideoSource()
+    try:
+        index = wait_for_index(source, video_path)
+        assert index.frame_count == 40
+        assert index.size == (64, 48)
+        assert index.keyframes[0] == 0
+
+        reloaded = FrameIndex.load(source._index_path(video_path))
+        assert reloaded.frame_count == 40
+        np.testing.assert_array_equal(reloaded.keyframes, index.keyframes)
+        assert len(source.frame_paths(video_path)) == 40
+    finally:
+        source.shutdown()
+
+
+def test_frame_paths_come_from_the_index_only(tmp_path):
+    video_path = write_video(str(tmp_path / "clip.mp4"))
+    source = VideoSource()
+    try:
+        # 인덱스가 없으면 컨테이너의 프레임 수로 추측하지 않고 None을 반환
+        assert source.frame_paths(video_path) is None
+        wait_for_index(source, video_path)
+        assert source.frame_paths(video_path) == [frame_path(video_path, index) for index in range(40)]
+    finally:
+        source.shutdown()
+
+
+def test_broken_video_is_not_indexed_again(tmp_path):
+    video_path = str(tmp_path / "broken.mp4")
+    with open(video_path, "wb") as f:
+        f.write(b"not a video")
+    source = VideoSource()
+    try:
+        assert source.frame_paths(video_path) is None
+        deadline = time.monotonic() + 10
+        while not source.index_failed(video_path) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert source.index_failed(video_path)
+        assert source.frame_paths(video_path) is None
+        assert not source._pending
+    finally:
+        source.shutdown()
+
+
+def test_random_access_matches_sequential_decode(tmp_path):
+    video_path = write_video(str(tmp_path / "clip.mp4"))
+    expected = decode_all(video_path)
+    source = VideoSource(max_forward=4, backfill=2, max_bytes=64 * 48 * 3 * 8)
+    try:
+        wait_for_index(source, video_path)
+        for frame_index in (0, 1, 2, 30, 29, 5, 39, 20, 21, 0):
+            frame = np.asarray(source.read_frame(video_path, frame_index))
+            np.testing.assert_array_equal(frame, expected[frame_index], err_msg=f"frame {frame_index}")
+        with pytest.raises(IOError):
+            source.read_frame(video_path, 40)
+        # 읽기 실패 후에도 계속 읽을 수 있음
+        np.testing.assert_array_equal(np.asarray(source.read_frame(video_path, 10)), expected[10])
+    finally:
+        source.shutdown()
+
+
+def test_threads_sharing_more_videos_than_open_readers(tmp_path):
+    video_paths = [write_video(str(tmp_path / f"clip{index}.mp4"), frame_count=20) for index in range(3)]
+    expected = {video_path: decode_all(video_path) for video_path in video_paths}
+    # 동영상 하나만 열어 두고 프레임 캐시도 거의 없애서 매번 리더를 바꿔 가며 디코딩하게 함
+    source = VideoSource(max_open=1, max_bytes=1, backfill=2)
+    errors = []
+
+    def read_frames(offset):
+        rng = np.random.default_rng(offset)
+        try:
+            for step in range(60):
+                video_path = video_paths[(step + offset) % len(video_paths)]
+                frame_index = int(rng.integers(0, 20))
+                frame = np.asarray(source.read_frame(video_path, frame_index))
+                np.testing.assert_array_equal(frame, expected[video_path][frame_index])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read_frames, args=(offset,), daemon=True) for offset in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    assert not any(thread.is_alive() for thread in threads), "교착 상태"
+    source.shutdown()
+    assert not errors, errors[0]
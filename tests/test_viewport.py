@@ -0,0 +1,43 @@
+import numpy as np
+from viewport import Viewport
+
+
+def test_base_scale_fits_image_inside_screen():
+    viewport = Viewport((2000, 1000), (800, 600))
+    assert viewport.base_scale == 0.4
+    assert viewport.display_size == (800, 400)
+
+    viewport.set_zoom(2.0)
+    assert viewport.scale_factor == 0.8
+    assert viewport.display_size == (1600, 800)
+
+
+def test_canvas_and_image_coordinates_round_trip():
+    viewport = Viewport((2000, 1000), (800, 600), zoom=1.5, image_position=(30, -20))
+    boxes = np.array([[0, 0, 2000, 1000], [100.5, 200.25, 300, 400]])
+    np.testing.assert_allclose(viewport.canvas_to_image(viewport.image_to_canvas(boxes)), boxes)
+    np.testing.assert_allclose(viewport.image_to_canvas([10, 10]), [30 + 10 * 0.6, -20 + 10 * 0.6])
+
+
+def test_clip_to_image_limits_each_axis():
+    viewport = Viewport((200, 100), (200, 100))
+    np.testing.assert_array_equal(viewport.clip_to_image([-5, 50, 250, 150]), [0, 50, 200, 100])
+
+
+def test_screen_change_updates_scale():
+    viewport = Viewport((1000, 1000), (500, 500))
+    viewport.update_screen((250, 400))
+    assert viewport.scale_factor == 0.25
+
+
+def test_visible_region_when_zoomed_in():
+    viewport = Viewport((1000, 1000), (500, 500), zoom=4.0, image_position=(-500, -1000))
+    source_box, canvas_position, display_size = viewport.visible_region((500, 500))
+    assert canvas_position == (0, 0)
+    assert display_size == (500, 500)
+    np.testing.assert_allclose(source_box, (250, 500, 500, 750))
+
+
+def test_visible_region_none_when_image_is_off_canvas():
+    viewport = Viewport((100, 100), (100, 100), image_position=(500, 500))
+    assert viewport.visible_region((100, 100)) is None
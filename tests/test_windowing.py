@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from PIL import Image
+import windowing
+from windowing import WindowLUTCache, default_window, load_image, read_header
+
+
+def save_16_bit(path, pixels):
+    Image.fromarray(pixels.astype(np.uint16)).save(path)
+    return str(path)
+
+
+def test_16_bit_png_keeps_full_depth(tmp_path):
+    pixels = np.arange(0, 60000, 600, dtype=np.uint16).reshape(10, 10)
+    image_path = save_16_bit(tmp_path / "depth.png", pixels)
+
+    assert read_header(image_path) == ((10, 10), "I;16")
+    image = load_image(image_path)
+    assert image.mode == "I;16"
+    np.testing.assert_array_equal(np.asarray(image), pixels)
+
+
+def test_lut_maps_window_to_8_bit_range():
+    lut = WindowLUTCache().get(1000, 200)
+    assert lut[899] == 0
+    assert lut[1000] == 127
+    assert lut[1100] == 255
+    assert lut[60000] == 255
+    assert not lut.flags.writeable
+
+
+def test_lut_cache_reuses_and_evicts():
+    cache = WindowLUTCache(max_entries=2)
+    first = cache.get(100, 50)
+    assert cache.get(100.001, 50) is first  # 소수점 둘째 자리까지 같은 설정
+    cache.get(200, 50)
+    cache.get(300, 50)
+    assert cache.get(100, 50) is not first
+
+
+def test_apply_returns_8_bit_image():
+    image = Image.fromarray(np.array([[0, 500, 1000]], dtype=np.uint16))
+    windowed = WindowLUTCache().apply(image, 500, 1000)
+    assert windowed.mode == "L"
+    assert np.asarray(windowed).tolist() == [[0, 127, 255]]
+
+
+def test_default_window_uses_value_range():
+    image = Image.fromarray(np.linspace(1000, 2000, 10000).reshape(100, 100).astype(np.uint16))
+    center, width = default_window(image)
+    assert 1490 < center < 1510
+    assert 950 < width < 1000
+
+    image.info["window"] = (40.0, 400.0)
+    assert default_window(image) == (40.0, 400.0)
+
+
+@pytest.mark.skipif(windowing.pydicom is not None, reason="pydicom이 설치된 환경")
+def test_dicom_without_pydicom_raises_import_error(tmp_path):
+    dicom_path = tmp_path / "scan.dcm"
+    dicom_path.write_bytes(b"")
+    with pytest.raises(ImportError):
+        read_header(str(dicom_path))
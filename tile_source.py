@@ -0,0 +1,279 @@
+import os
+import glob
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PIL import Image
+from resampling import get_resampler
+from windowing import load_image
+from image_cache import estimate_image_bytes
+from video_source import parse_frame_path
+
+try:
+    import tifffile
+except ImportError:
+    tifffile = None
+
+
+# 타일 저장소에 그대로 넣을 수 있는 PIL 모드 -> (채널 수, dtype)
+_STORE_MODES = {'L': (1, np.uint8), 'RGB': (3, np.uint8), 'RGBA': (4, np.uint8), 'I;16': (1, np.uint16)}
+_CHANNEL_MODES = {1: 'L', 3: 'RGB', 4: 'RGBA'}
+
+
+class TiledImage:
+    def __init__(self, store_path, tile_size):
+        """
+        메모리 매핑된 원본 픽셀 배열 (필요한 타일만 디스크에서 읽음)
+
+        Args:
+            store_path (str): .npy 타일 저장소 경로
+            tile_size (int): 타일 한 변의 크기 (픽셀)
+        """
+        self.store_path = store_path
+        self.tile_size = tile_size
+        self.pixels = np.load(store_path, mmap_mode='r')
+        self.height, self.width = self.pixels.shape[:2]
+        channels = 1 if self.pixels.ndim == 2 else self.pixels.shape[2]
+        self.mode = 'I;16' if self.pixels.dtype == np.uint16 else _CHANNEL_MODES[channels]
+
+    @property
+    def size(self):
+        return (self.width, self.height)
+
+    def tile_range(self, source_box):
+        """원본 좌표 영역에 걸치는 타일 (col1, row1, col2, row2) 범위 (끝 포함)"""
+        left, top, right, bottom = source_box
+        col1 = max(int(left) // self.tile_size, 0)
+        row1 = max(int(top) // self.tile_size, 0)
+        col2 = min((int(np.ceil(right)) - 1) // self.tile_size, (self.width - 1) // self.tile_size)
+        row2 = min((int(np.ceil(bottom)) - 1) // self.tile_size, (self.height - 1) // self.tile_size)
+        return col1, row1, col2, row2
+
+    def read_tile(self, col, row):
+        """타일 하나를 읽어 PIL 이미지로 반환"""
+        x, y = col * self.tile_size, row * self.tile_size
+        tile = np.ascontiguousarray(self.pixels[y:y + self.tile_size, x:x + self.tile_size])
+        return Image.fromarray(tile)
+
+    def read_rows(self, top, bottom):
+        """전체 너비의 가로 띠 하나를 읽어 PIL 이미지로 반환 (피라미드를 나눠서 만들 때 사용)"""
+        rows = np.ascontiguousarray(self.pixels[top:bottom])
+        return Image.fromarray(rows)
+
+
+class TileSource:
+    def __init__(self, cache_dir_name=".bbox_cache", min_pixels=16384 * 16384, tile_size=512,
+                 max_bytes=256 * 1024 * 1024, max_workers=1):
+        """
+        초대형 이미지용 타일 소스
+
+        처음 열 때 원본을 데이터셋 옆 캐시 폴더에 메모리 매핑 가능한 픽셀 배열(.npy)로
+        한 번 풀어 두고, 이후에는 화면에 보이는 타일만 읽어서 합성함
+        (tifffile이 설치되어 있으면 TIFF는 타일/스트립 단위로 바로 풀어서 저장)
+
+        저장소는 압축하지 않은 원본 픽셀이므로 디스크를 width x height x 채널 수 바이트만큼 사용함
+        (예: 20000x20000 RGB 약 1.2GB). TIFF가 아닌 형식은 변환할 때 전체를 한 번 디코딩하므로
+        일반 사진(수천만 화소)은 피라미드만 사용하고 min_pixels 이상인 이미지만 타일로 저장함
+
+        Args:
+            cache_dir_name (str): 이미지 폴더 안에 만들 캐시 폴더 이름
+            min_pixels (int): 타일 소스를 사용할 이미지의 최소 화소 수 (기본값: 약 2억 7천만 화소)
+            tile_size (int): 타일 한 변의 크기 (픽셀)
+            max_bytes (int): 디코딩된 타일 캐시의 최대 메모리 (기본값: 256MB)
+            max_workers (int): 백그라운드 변환 스레드 수
+        """
+        self.cache_dir_name = cache_dir_name
+        self.min_pixels = min_pixels
+        self.tile_size = tile_size
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending = {}          # store_path -> Future
+        self._opened = {}           # store_path -> TiledImage
+        self._tiles = OrderedDict()  # (store_path, col, row) -> PIL.Image
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.resampler = get_resampler()
+
+    def _store_path(self, image_path):
+        """이미지 경로와 수정 시간으로 타일 저장소 경로 생성"""
+        image_dir, image_name = os.path.split(os.path.abspath(image_path))
+        mtime_ns = os.stat(image_path).st_mtime_ns
+        return os.path.join(image_dir, self.cache_dir_name, "tiles", f"{image_name}.{mtime_ns}.npy")
+
+    def needs_tiles(self, orig_size):
+        return orig_size[0] * orig_size[1] >= self.min_pixels
+
+    def get(self, image_path, orig_size, build=True):
+        """
+        타일 소스 반환
+
+        저장소가 아직 없으면 백그라운드 변환을 요청하고 None을 반환
+
+        Args:
+            image_path (str): 원본 이미지 경로
+            orig_size (tuple): 원본 이미지 크기 (width, height)
+            build (bool): 저장소가 없을 때 변환을 요청할지 여부
+
+        Returns:
+            TiledImage: 타일 소스 (사용할 수 없으면 None)
+        """
+        if not self.needs_tiles(orig_size) or parse_frame_path(image_path) is not None:
+            return None
+
+        store_path = self._store_path(image_path)
+        with self._lock:
+            tiled = self._opened.get(store_path)
+            if tiled is not None:
+                return tiled
+
+        if not os.path.exists(store_path):
+            if build:
+                self._request_build(image_path, store_path)
+            return None
+
+        tiled = TiledImage(store_path, self.tile_size)
+        with self._lock:
+            return self._opened.setdefault(store_path, tiled)
+
+    def get_region(self, tiled, source_box, size, resample=Image.Resampling.LANCZOS):
+        """
+        보이는 영역에 걸치는 타일만 합성해서 크기 조정
+
+        Args:
+            tiled (TiledImage): 타일 소스
+            source_box (tuple): 원본 이미지 좌표의 (left, top, right, bottom)
+            size (tuple): 목표 크기 (width, height)
+            resample: PIL 리샘플링 필터
+
+        Returns:
+            PIL.Image: 잘라서 크기 조정된 이미지
+        """
+        col1, row1, col2, row2 = tiled.tile_range(source_box)
+        tile_size = tiled.tile_size
+        origin_x, origin_y = col1 * tile_size, row1 * tile_size
+        mosaic_width = min((col2 + 1) * tile_size, tiled.width) - origin_x
+        mosaic_height = min((row2 + 1) * tile_size, tiled.height) - origin_y
+
+        mosaic = Image.new(tiled.mode, (mosaic_width, mosaic_height))
+        for row in range(row1, row2 + 1):
+            for col in range(col1, col2 + 1):
+                tile = self._get_tile(tiled, col, row)
+                mosaic.paste(tile, (col * tile_size - origin_x, row * tile_size - origin_y))
+
+        left, top, right, bottom = source_box
+        box = (left - origin_x, top - origin_y, right - origin_x, bottom - origin_y)
+        return self.resampler.resize_region(mosaic, box, size, resample)
+
+    def _get_tile(self, tiled, col, row):
+        key = (tiled.store_path, col, row)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                return tile
+
+        tile = tiled.read_tile(col, row)
+
+        with self._lock:
+            if key not in self._tiles:
+                self._tiles[key] = tile
+                self._current_bytes += self._tile_bytes(tile)
+                # 메모리 한도를 넘으면 가장 오래 사용하지 않은 타일부터 제거
+                while self._current_bytes > self.max_bytes and len(self._tiles) > 1:
+                    _, old_tile = self._tiles.popitem(last=False)
+                    self._current_bytes -= self._tile_bytes(old_tile)
+        return tile
+
+    def _tile_bytes(self, tile):
+        return estimate_image_bytes(tile)
+
+    def _request_build(self, image_path, store_path):
+        with self._lock:
+            if store_path in self._pending:
+                return
+            future = self._executor.submit(self._build, image_path, store_path)
+            self._pending[store_path] = future
+        future.add_done_callback(lambda f: self._finish_build(store_path, f))
+
+    def _finish_build(self, store_path, future):
+        with self._lock:
+            self._pending.pop(store_path, None)
+        error = future.exception()
+        if error is not None:
+            print(f"타일 저장소 생성 중 오류 발생: {error}")
+
+    def _build(self, image_path, store_path):
+        """원본을 메모리 매핑 가능한 픽셀 배열로 한 번 풀어서 저장"""
+        os.makedirs(os.path.dirname(store_path), exist_ok=True)
+        self._remove_stale(image_path, store_path)
+
+        # 임시 파일에 쓴 뒤 이름을 바꿔 읽는 쪽에서 덜 쓰인 파일을 보지 않도록 함
+        temp_path = store_path + ".tmp.npy"
+        if not self._build_from_tiff(image_path, temp_path):
+            self._build_from_pil(image_path, temp_path)
+        os.replace(temp_path, store_path)
+
+    def _build_from_tiff(self, image_path, temp_path):
+        """tifffile로 TIFF를 타일/스트립 단위로 풀어서 바로 저장 (지원하지 않으면 False)"""
+        if tifffile is None or not image_path.lower().endswith(('.tif', '.tiff')):
+            return False
+
+        with tifffile.TiffFile(image_path) as tif:
+            series = tif.series[0]
+            shape = series.shape
+            channels = 1 if len(shape) == 2 else shape[-1]
+            if series.dtype == np.uint16:
+                # 16비트는 그레이스케일만 지원 (창/레벨은 표시할 때 적용)
+                if len(shape) != 2:
+                    return False
+            elif series.dtype != np.uint8 or len(shape) not in (2, 3) or channels not in _CHANNEL_MODES:
+                return False
+            pixels = np.lib.format.open_memmap(temp_path, mode='w+', dtype=series.dtype, shape=shape)
+            series.asarray(out=pixels)
+            pixels.flush()
+            del pixels
+        return True
+
+    def _build_from_pil(self, image_path, temp_path):
+        image = load_image(image_path)
+        if image.mode not in _STORE_MODES:
+            image = image.convert("RGB")
+        width, height = image.size
+        channels, dtype = _STORE_MODES[image.mode]
+        shape = (height, width) if channels == 1 else (height, width, channels)
+        pixels = np.lib.format.open_memmap(temp_path, mode='w+', dtype=dtype, shape=shape)
+
+        # 한 번에 타일 한 줄씩 복사해 변환 중 추가 메모리 사용을 줄임
+        for top in range(0, height, self.tile_size):
+            bottom = min(top + self.tile_size, height)
+            pixels[top:bottom] = np.asarray(image.crop((0, top, width, bottom)))
+        pixels.flush()
+        del pixels
+
+    def _remove_stale(self, image_path, store_path):
+        """수정 시간이 달라진 이전 타일 저장소 삭제"""
+        image_name = os.path.basename(image_path)
+        pattern = os.path.join(os.path.dirname(store_path), glob.escape(image_name) + ".*.npy")
+        for stale_path in glob.glob(pattern):
+            if stale_path == store_path or stale_path.endswith(".tmp.npy"):
+                continue
+            with self._lock:
+                self._opened.pop(stale_path, None)
+            os.remove(stale_path)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_tile_source = None
+_shared_tile_source_lock = threading.Lock()
+
+
+def get_tile_source():
+    """프로세스 전역에서 공유하는 TileSource 반환 (작업 스레드에서도 호출됨)"""
+    global _shared_tile_source
+    with _shared_tile_source_lock:
+        if _shared_tile_source is None:
+            _shared_tile_source = TileSource()
+        return _shared_tile_source
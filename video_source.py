@@ -0,0 +1,372 @@
+import os
+import glob
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import cv2
+from PIL import Image
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.m4v', '.mpg', '.mpeg')
+
+# 동영상 프레임 경로: "<동영상 경로>#<프레임 번호>" (이미지 경로와 같은 방식으로 목록/캐시/저널에서 사용)
+FRAME_SEPARATOR = '#'
+
+
+def is_video(path):
+    return path.lower().endswith(VIDEO_EXTENSIONS)
+
+
+def frame_path(video_path, frame_index):
+    """동영상의 프레임을 가리키는 경로 생성"""
+    return f"{video_path}{FRAME_SEPARATOR}{frame_index:06d}"
+
+
+def parse_frame_path(path):
+    """
+    프레임 경로 해석
+
+    Returns:
+        tuple: (동영상 경로, 프레임 번호), 프레임 경로가 아니면 None
+    """
+    video_path, separator, index = path.rpartition(FRAME_SEPARATOR)
+    if not separator or not index.isdigit() or not is_video(video_path):
+        return None
+    return video_path, int(index)
+
+
+def source_file(path):
+    """경로에 해당하는 실제 파일 (프레임이면 동영상 파일)"""
+    frame = parse_frame_path(path)
+    return frame[0] if frame is not None else path
+
+
+class FrameIndex:
+    def __init__(self, frame_count, fps, size, keyframes, timestamps):
+        """
+        동영상 프레임 인덱스 (프레임 수, 키프레임 위치, 프레임별 시간)
+
+        Args:
+            frame_count (int): 실제 프레임 수
+            fps (float): 초당 프레임 수
+            size (tuple): 프레임 크기 (width, height)
+            keyframes (numpy.ndarray): 키프레임 번호 (오름차순)
+            timestamps (numpy.ndarray): 프레임별 표시 시간 (ms)
+        """
+        self.frame_count = frame_count
+        self.fps = fps
+        self.size = size
+        self.keyframes = keyframes
+        self.timestamps = timestamps
+
+    def keyframe_before(self, frame_index):
+        """frame_index 이하의 가장 가까운 키프레임 번호"""
+        position = np.searchsorted(self.keyframes, frame_index, side='right') - 1
+        return int(self.keyframes[position]) if position >= 0 else 0
+
+    @classmethod
+    def build(cls, video_path):
+        """
+        동영상을 한 번 훑어 인덱스 생성
+
+        디코딩하지 않고 압축된 패킷만 읽으므로 (CAP_PROP_FORMAT=-1) 재생보다 훨씬 빠름
+        """
+        capture = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_FORMAT, -1])
+        if not capture.isOpened():
+            raise IOError(f"동영상을 열 수 없습니다: {video_path}")
+        try:
+            fps = capture.get(cv2.CAP_PROP_FPS)
+            size = (int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            keyframes = []
+            timestamps = []
+            while capture.grab():
+                if capture.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                    keyframes.append(len(timestamps))
+                timestamps.append(capture.get(cv2.CAP_PROP_POS_MSEC))
+        finally:
+            capture.release()
+        return cls(len(timestamps), fps, size,
+                   np.array(keyframes or [0], dtype=np.int64), np.array(timestamps, dtype=np.float64))
+
+    @classmethod
+    def load(cls, index_path):
+        with np.load(index_path) as data:
+            width, height = data['size'].tolist()
+            return cls(int(data['frame_count']), float(data['fps']), (width, height),
+                       data['keyframes'], data['timestamps'])
+
+    def save(self, index_path):
+        """임시 파일에 쓴 뒤 이름을 바꿔서 저장"""
+        temp_path = index_path + ".tmp.npz"
+        np.savez(temp_path, frame_count=self.frame_count, fps=self.fps, size=np.array(self.size),
+                 keyframes=self.keyframes, timestamps=self.timestamps)
+        os.replace(temp_path, index_path)
+
+
+class VideoSource:
+    def __init__(self, cache_dir_name=".bbox_cache", max_bytes=256 * 1024 * 1024,
+                 max_forward=48, backfill=16, max_open=4):
+        """
+        동영상 프레임을 이미지처럼 읽는 소스 (프레임을 디스크에 미리 풀지 않음)
+
+        키프레임 인덱스를 동영상 옆 캐시 폴더에 한 번 만들어 두고,
+        프레임을 요청하면 가까운 키프레임부터 디코딩함.
+        앞쪽으로 가까운 프레임은 탐색 없이 이어서 디코딩하고,
+        탐색할 때는 목표 직전 프레임들도 캐시에 넣어 되감기(이전 프레임)를 빠르게 함
+
+        Args:
+            cache_dir_name (str): 동영상 옆에 만들 캐시 폴더 이름
+            max_bytes (int): 디코딩한 프레임 캐시의 최대 메모리
+            max_forward (int): 탐색 대신 이어서 디코딩할 최대 프레임 수
+            backfill (int): 탐색 후 목표 직전에 함께 캐시할 프레임 수
+            max_open (int): 동시에 열어 둘 동영상 수
+        """
+        self.cache_dir_name = cache_dir_name
+        self.max_bytes = max_bytes
+        self.max_forward = max_forward
+        self.backfill = backfill
+        self.max_open = max_open
+        self._frames = OrderedDict()  # (동영상 경로, 프레임 번호) -> PIL.Image (RGB)
+        self._current_bytes = 0
+        self._readers = OrderedDict()  # 동영상 경로 -> [VideoCapture, 다음 프레임 번호, 락]
+        self._indexes = {}             # 동영상 경로 -> FrameIndex
+        self._pending = set()          # 인덱스를 만드는 중인 동영상
+        self._failed = set()           # 인덱스를 만들지 못한 동영상 (다시 시도하지 않음)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="video-index")
+
+    def _index_path(self, video_path):
+        """동영상 경로와 수정 시간으로 인덱스 파일 경로 생성"""
+        video_dir, video_name = os.path.split(os.path.abspath(video_path))
+        mtime_ns = os.stat(video_path).st_mtime_ns
+        return os.path.join(video_dir, self.cache_dir_name, "video", f"{video_name}.{mtime_ns}.npz")
+
+    def get_index(self, video_path):
+        """
+        프레임 인덱스 반환
+
+        디스크에 있으면 읽고, 없으면 백그라운드 생성을 요청하고 None을 반환
+        """
+        with self._lock:
+            index = self._indexes.get(video_path)
+        if index is not None:
+            return index
+
+        index_path = self._index_path(video_path)
+        if os.path.exists(index_path):
+            try:
+                index = FrameIndex.load(index_path)
+            except Exception as e:
+                print(f"프레임 인덱스 읽기 중 오류 발생: {e}")
+            else:
+                with self._lock:
+                    self._indexes[video_path] = index
+                return index
+
+        with self._lock:
+            if video_path not in self._pending and video_path not in self._failed:
+                self._pending.add(video_path)
+                self._executor.submit(self._build_index, video_path, index_path)
+        return None
+
+    def _build_index(self, video_path, index_path):
+        try:
+            index = FrameIndex.build(video_path)
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            self._remove_stale(video_path, index_path)
+            index.save(index_path)
+            with self._lock:
+                self._indexes[video_path] = index
+        except Exception as e:
+            print(f"프레임 인덱스 생성 중 오류 발생: {e}")
+            with self._lock:
+                self._failed.add(video_path)
+        finally:
+            with self._lock:
+                self._pending.discard(video_path)
+
+    def index_failed(self, video_path):
+        """인덱스를 만들지 못한 동영상인지 (열 수 없거나 손상된 파일)"""
+        with self._lock:
+            return video_path in self._failed
+
+    def _remove_stale(self, video_path, index_path):
+        """수정 시간이 달라진 이전 인덱스 삭제"""
+        video_name = os.path.basename(video_path)
+        pattern = os.path.join(os.path.dirname(index_path), glob.escape(video_name) + ".*.npz")
+        for stale_path in glob.glob(pattern):
+            if stale_path != index_path:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+
+    def get_info(self, video_path):
+        """
+        동영상 정보
+
+        Returns:
+            tuple: (프레임 수, fps, (width, height)) - 인덱스가 아직 없으면 컨테이너에 기록된 값
+        """
+        index = self.get_index(video_path)
+        if index is not None:
+            return index.frame_count, index.fps, index.size
+
+        while True:
+            reader = self._get_reader(video_path)
+            with reader[2]:
+                capture = reader[0]
+                if capture is None:  # 그 사이 다른 스레드가 닫은 동영상이면 다시 엶
+                    continue
+                return (int(capture.get(cv2.CAP_PROP_FRAME_COUNT)), capture.get(cv2.CAP_PROP_FPS),
+                        (int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))))
+
+    def get_size(self, video_path):
+        return self.get_info(video_path)[2]
+
+    def frame_paths(self, video_path):
+        """
+        동영상의 모든 프레임 경로 목록
+
+        컨테이너에 기록된 프레임 수(CAP_PROP_FRAME_COUNT)는 가변 프레임레이트 등에서
+        실제보다 클 수 있으므로 인덱스의 프레임 수만 사용함
+
+        Returns:
+            list: 프레임 경로 목록 (인덱스가 아직 없으면 백그라운드 생성을 요청하고 None)
+        """
+        index = self.get_index(video_path)
+        if index is None:
+            return None
+        return [frame_path(video_path, frame_index) for frame_index in range(index.frame_count)]
+
+    def _get_reader(self, video_path):
+        """
+        동영상 리더 [capture, 다음 프레임 위치, 잠금] 반환
+
+        닫힌 리더는 capture가 None이므로 잠금을 잡은 뒤 확인하고 다시 요청해야 함
+        """
+        with self._lock:
+            reader = self._readers.get(video_path)
+            if reader is not None:
+                self._readers.move_to_end(video_path)
+                return reader
+
+            capture = cv2.VideoCapture(video_path)
+            if not capture.isOpened():
+                raise IOError(f"동영상을 열 수 없습니다: {video_path}")
+            reader = [capture, 0, threading.Lock()]
+            self._readers[video_path] = reader
+
+            evicted = []
+            while len(self._readers) > self.max_open:
+                evicted.append(self._readers.popitem(last=False)[1])
+
+        # 오래 사용하지 않은 동영상은 전역 잠금을 놓은 뒤 닫음 (두 잠금을 함께 잡지 않음)
+        for old_reader in evicted:
+            self._close_reader(old_reader)
+        return reader
+
+    def _close_reader(self, reader):
+        with reader[2]:
+            if reader[0] is not None:
+                reader[0].release()
+                reader[0] = None
+
+    def read_frame(self, video_path, frame_index):
+        """
+        프레임 하나를 RGB PIL 이미지로 반환
+
+        Args:
+            video_path (str): 동영상 경로
+            frame_index (int): 프레임 번호 (0부터)
+        """
+        key = (video_path, frame_index)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                return frame
+
+        index = self.get_index(video_path)
+        while True:
+            reader = self._get_reader(video_path)
+            with reader[2]:
+                if reader[0] is None:  # 그 사이 다른 스레드가 닫은 동영상이면 다시 엶
+                    continue
+                frame, decoded = self._decode(reader, video_path, frame_index, index)
+                break
+
+        # 캐시 저장은 리더 잠금을 놓은 뒤에 함 (_get_reader와 잠금 순서가 엇갈리지 않도록)
+        for position, decoded_frame in decoded:
+            self._store(video_path, position, decoded_frame)
+        self._store(video_path, frame_index, frame)
+        return frame
+
+    def _decode(self, reader, video_path, frame_index, index):
+        """
+        (리더 잠금 안에서) 목표 프레임까지 디코딩
+
+        Returns:
+            tuple: (목표 프레임, 함께 디코딩한 바로 앞 프레임들의 [(프레임 번호, 이미지), ...])
+        """
+        capture, position, _ = reader
+        decoded = []
+        keyframe = index.keyframe_before(frame_index) if index is not None else frame_index
+        # 앞쪽의 가까운 프레임이거나 사이에 키프레임이 없으면 탐색하지 않고 이어서 디코딩
+        if not (position <= frame_index and (frame_index - position <= self.max_forward
+                                             or keyframe <= position)):
+            position = keyframe if index is not None else frame_index
+            capture.set(cv2.CAP_PROP_POS_FRAMES, position)
+
+        frame = None
+        while position <= frame_index:
+            if position >= frame_index - self.backfill:
+                ok, pixels = capture.read()
+                if ok:
+                    frame = Image.fromarray(cv2.cvtColor(pixels, cv2.COLOR_BGR2RGB))
+                    if position < frame_index:
+                        decoded.append((position, frame))
+            else:
+                ok = capture.grab()
+            if not ok:
+                reader[1] = 0
+                capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                raise IOError(f"프레임을 읽을 수 없습니다: {frame_path(video_path, frame_index)}")
+            position += 1
+        reader[1] = position
+        return frame, decoded
+
+    def _store(self, video_path, frame_index, frame):
+        width, height = frame.size
+        with self._lock:
+            key = (video_path, frame_index)
+            if key in self._frames:
+                return
+            self._frames[key] = frame
+            self._current_bytes += width * height * 3
+            # 가장 최근 프레임 하나는 한도를 넘더라도 유지
+            while self._current_bytes > self.max_bytes and len(self._frames) > 1:
+                _, old_frame = self._frames.popitem(last=False)
+                self._current_bytes -= old_frame.size[0] * old_frame.size[1] * 3
+
+    def shutdown(self):
+        """인덱스 생성을 멈추고 열린 동영상 닫기 (프로그램 종료 시 호출)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            readers = list(self._readers.values())
+            self._readers.clear()
+        for reader in readers:
+            self._close_reader(reader)
+
+
+_shared_source = None
+_shared_source_lock = threading.Lock()
+
+
+def get_video_source():
+    """프로세스 전역에서 공유하는 VideoSource 반환"""
+    global _shared_source
+    with _shared_source_lock:
+        if _shared_source is None:
+            _shared_source = VideoSource()
+        return _shared_source
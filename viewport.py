@@ -0,0 +1,118 @@
+import math
+import numpy as np
+
+
+class Viewport:
+    def __init__(self, orig_size, screen_size, zoom=1.0, image_position=(0, 0)):
+        """
+        이미지 한 장의 화면 배치 정보 (원본 크기, 기본 스케일, 확대 배율, 위치)
+
+        캔버스 좌표 <-> 원본 이미지 좌표 변환을 담당하며,
+        창 크기 변경/확대/패닝 시에만 갱신됨
+
+        Args:
+            orig_size (tuple): 원본 이미지 크기 (width, height)
+            screen_size (tuple): 이미지를 표시할 영역 크기 (width, height)
+            zoom (float): 확대/축소 배율
+            image_position (tuple): 캔버스 상의 이미지 좌상단 위치 (x, y)
+        """
+        self.orig_width, self.orig_height = orig_size
+        self.screen_width, self.screen_height = screen_size
+        self.zoom = zoom
+        self.image_position = image_position
+        self._update_scale()
+
+    @property
+    def orig_size(self):
+        return (self.orig_width, self.orig_height)
+
+    @property
+    def display_size(self):
+        """확대/축소가 적용된 이미지의 화면 크기 (width, height)"""
+        return (int(self.orig_width * self.scale_factor),
+                int(self.orig_height * self.scale_factor))
+
+    def _update_scale(self):
+        # 이미지 비율 유지하며 화면에 맞추는 기본 스케일
+        scale_x = self.screen_width / self.orig_width
+        scale_y = self.screen_height / self.orig_height
+        self.base_scale = min(scale_x, scale_y)
+        self.scale_factor = self.base_scale * self.zoom
+        self._offset = np.array(self.image_position, dtype=np.float64)
+
+    def update_screen(self, screen_size):
+        """창 크기 변경 시 호출"""
+        if tuple(screen_size) != (self.screen_width, self.screen_height):
+            self.screen_width, self.screen_height = screen_size
+            self._update_scale()
+
+    def set_zoom(self, zoom):
+        """확대/축소 시 호출"""
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self._update_scale()
+
+    def set_position(self, image_position):
+        """패닝 시 호출"""
+        self.image_position = tuple(image_position)
+        self._offset = np.array(self.image_position, dtype=np.float64)
+
+    def _tiled_offset(self, points):
+        # (x, y, x, y, ...) 순서의 마지막 축에 맞게 오프셋 반복
+        return np.resize(self._offset, points.shape[-1])
+
+    def canvas_to_image(self, points):
+        """
+        캔버스 좌표를 원본 이미지 좌표로 일괄 변환
+
+        Args:
+            points (array-like): 마지막 축이 (x, y, ...) 순서인 좌표 배열
+                                 예) (N, 2) 점 배열, (N, 4) x1y1x2y2 박스 배열
+
+        Returns:
+            numpy.ndarray: 원본 이미지 좌표
+        """
+        points = np.asarray(points, dtype=np.float64)
+        return (points - self._tiled_offset(points)) / self.scale_factor
+
+    def image_to_canvas(self, points):
+        """원본 이미지 좌표를 캔버스 좌표로 일괄 변환"""
+        points = np.asarray(points, dtype=np.float64)
+        return points * self.scale_factor + self._tiled_offset(points)
+
+    def clip_to_image(self, points):
+        """원본 이미지 좌표를 이미지 경계 안으로 제한"""
+        points = np.asarray(points, dtype=np.float64)
+        limits = np.resize(np.array([self.orig_width, self.orig_height], dtype=np.float64),
+                           points.shape[-1])
+        return np.clip(points, 0, limits)
+
+    def visible_region(self, canvas_size):
+        """
+        캔버스에 실제로 보이는 이미지 영역 계산 (확대 시 잘라서 그리기 위함)
+
+        Args:
+            canvas_size (tuple): 캔버스 크기 (width, height)
+
+        Returns:
+            tuple: (source_box, canvas_position, display_size)
+                   source_box: 원본 이미지 좌표의 (left, top, right, bottom)
+                   canvas_position: 잘라낸 이미지를 그릴 캔버스 위치 (x, y)
+                   display_size: 잘라낸 이미지의 화면 크기 (width, height)
+                   보이는 영역이 없으면 None
+        """
+        canvas_width, canvas_height = canvas_size
+        display_width, display_height = self.display_size
+        x, y = self.image_position
+
+        # 이미지와 캔버스가 겹치는 영역 (캔버스 좌표, 정수 픽셀 단위)
+        left = max(0, math.floor(x))
+        top = max(0, math.floor(y))
+        right = min(canvas_width, math.ceil(x + display_width))
+        bottom = min(canvas_height, math.ceil(y + display_height))
+        if right <= left or bottom <= top:
+            return None
+
+        source_box = tuple(self.clip_to_image(
+            self.canvas_to_image([left, top, right, bottom])).tolist())
+        return source_box, (left, top), (right - left, bottom - top)
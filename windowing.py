@@ -0,0 +1,214 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from PIL import Image
+
+try:
+    import pydicom
+except ImportError:
+    pydicom = None
+
+
+# 로컬 데이터셋만 여는 도구이므로 PIL의 압축 폭탄 검사(약 1억 8천만 화소 이상이면 오류)를 끔.
+# 이미지는 모두 이 모듈에서 열고, 초대형 이미지는 타일 소스/피라미드로 나눠 읽음
+Image.MAX_IMAGE_PIXELS = None
+
+# 윈도우/레벨을 적용해야 하는 고비트 모드
+HIGH_DEPTH_MODES = ('I;16', 'I;16B', 'I;16L', 'I')
+
+DICOM_EXTENSIONS = ('.dcm', '.dicom')
+
+# 부호 있는 16비트 값을 LUT 인덱스(0~65535)로 옮기기 위한 오프셋
+_SIGNED_OFFSET = 32768
+
+
+def is_dicom(image_path):
+    return image_path.lower().endswith(DICOM_EXTENSIONS)
+
+
+def to_uint16_image(image):
+    """
+    고비트 PIL 이미지를 'I;16' (부호 없는 16비트) 이미지로 변환
+
+    'I' 모드(32비트 정수)는 0~65535 범위로 잘라서 변환함
+    """
+    if image.mode == 'I;16':
+        return image
+    pixels = np.asarray(image)
+    pixels = np.clip(pixels, 0, 65535).astype(np.uint16)
+    return Image.fromarray(pixels)  # uint16 -> 'I;16'
+
+
+def load_image(image_path, draft_size=None):
+    """
+    이미지 파일을 디코딩하고 파일 핸들을 닫음
+
+    16비트 그레이스케일은 8비트로 줄이지 않고 'I;16'으로 유지하며,
+    DICOM은 pydicom이 설치된 경우에만 읽을 수 있음
+
+    Args:
+        image_path (str): 이미지 파일 경로
+        draft_size (tuple): JPEG를 디코더에서 1/2, 1/4, 1/8로 줄여 읽을 때의 최소 크기
+                            (None이면 원본 크기로 디코딩)
+
+    Returns:
+        PIL.Image: 디코딩된 이미지
+    """
+    if is_dicom(image_path):
+        return load_dicom(image_path)
+
+    with Image.open(image_path) as image:
+        if draft_size is not None and image.format == 'JPEG':
+            # draft_size 이상을 유지하는 가장 작은 DCT 배율로 디코딩
+            image.draft(image.mode, draft_size)
+        image.load()
+        if image.mode in HIGH_DEPTH_MODES:
+            return to_uint16_image(image)
+        return image
+
+
+def read_header(image_path):
+    """
+    픽셀을 디코딩하지 않고 (크기, 모드)만 읽기
+
+    Returns:
+        tuple: ((width, height), mode) - 16비트/DICOM은 디코딩 후 모드인 'I;16'
+    """
+    if is_dicom(image_path):
+        if pydicom is None:
+            raise ImportError("DICOM 파일을 열려면 pydicom을 설치해야 합니다.")
+        dataset = pydicom.dcmread(image_path, stop_before_pixels=True)
+        return (int(dataset.Columns), int(dataset.Rows)), 'I;16'
+
+    with Image.open(image_path) as image:
+        mode = 'I;16' if image.mode in HIGH_DEPTH_MODES else image.mode
+        return image.size, mode
+
+
+def load_dicom(image_path):
+    """
+    DICOM 파일을 'I;16' 이미지로 디코딩
+
+    저장된 기본 윈도우(WindowCenter/WindowWidth)는 저장 값 단위로 변환해서
+    image.info['window']에 (center, width)로 넣어 둠
+    """
+    if pydicom is None:
+        raise ImportError("DICOM 파일을 열려면 pydicom을 설치해야 합니다.")
+
+    dataset = pydicom.dcmread(image_path)
+    pixels = dataset.pixel_array
+    if pixels.ndim != 2:
+        raise ValueError(f"지원하지 않는 DICOM 형식입니다 (shape: {pixels.shape})")
+
+    offset = 0
+    if pixels.dtype.kind == 'i':
+        offset = _SIGNED_OFFSET
+        pixels = pixels.astype(np.int32) + offset
+    pixels = np.clip(pixels, 0, 65535).astype(np.uint16)
+
+    # MONOCHROME1은 값이 클수록 어둡게 표시
+    if getattr(dataset, 'PhotometricInterpretation', '') == 'MONOCHROME1':
+        pixels = 65535 - pixels
+
+    image = Image.fromarray(pixels)  # uint16 -> 'I;16'
+    window = _dicom_window(dataset, offset)
+    if window is not None:
+        image.info['window'] = window
+    return image
+
+
+def _dicom_window(dataset, offset):
+    """DICOM 윈도우 태그를 저장 값(LUT 인덱스) 단위로 변환"""
+    center = getattr(dataset, 'WindowCenter', None)
+    width = getattr(dataset, 'WindowWidth', None)
+    if center is None or width is None:
+        return None
+
+    # 여러 값이 들어 있으면 첫 번째 사용
+    if isinstance(center, pydicom.multival.MultiValue):
+        center = center[0]
+    if isinstance(width, pydicom.multival.MultiValue):
+        width = width[0]
+
+    slope = float(getattr(dataset, 'RescaleSlope', 1) or 1)
+    intercept = float(getattr(dataset, 'RescaleIntercept', 0) or 0)
+    raw_center = (float(center) - intercept) / slope + offset
+    raw_width = float(width) / abs(slope)
+    return (raw_center, raw_width)
+
+
+def default_window(image, sample_size=512):
+    """
+    기본 윈도우/레벨 (center, width)
+
+    DICOM 기본값이 있으면 사용하고, 없으면 축소한 샘플의 1~99% 값 범위로 정함
+
+    Args:
+        image (PIL.Image): 'I;16' 이미지
+        sample_size (int): 값 범위 계산에 사용할 샘플 간격 기준 크기
+    """
+    if 'window' in image.info:
+        return image.info['window']
+
+    pixels = np.asarray(image)
+    step = max(1, max(pixels.shape) // sample_size)
+    low, high = np.percentile(pixels[::step, ::step], (1, 99))
+    if high <= low:
+        low, high = float(pixels.min()), float(pixels.max()) + 1
+    return (float(low + high) / 2, float(high - low))
+
+
+class WindowLUTCache:
+    def __init__(self, max_entries=16):
+        """
+        윈도우 설정별 65536칸 LUT 캐시 (16비트 값 -> 8비트 밝기)
+
+        Args:
+            max_entries (int): 보관할 LUT 최대 개수
+        """
+        self.max_entries = max_entries
+        self._luts = OrderedDict()  # (center, width) -> numpy.ndarray
+        self._lock = threading.Lock()
+
+    def get(self, center, width):
+        """윈도우 설정에 맞는 LUT 반환 (없으면 NumPy로 한 번에 계산)"""
+        key = (round(float(center), 2), round(max(float(width), 1.0), 2))
+        with self._lock:
+            lut = self._luts.get(key)
+            if lut is not None:
+                self._luts.move_to_end(key)
+                return lut
+
+        center, width = key
+        values = np.arange(65536, dtype=np.float32)
+        lut = np.clip((values - (center - width / 2)) * (255.0 / width), 0, 255).astype(np.uint8)
+        lut.flags.writeable = False
+
+        with self._lock:
+            self._luts[key] = lut
+            while len(self._luts) > self.max_entries:
+                self._luts.popitem(last=False)
+        return lut
+
+    def apply(self, image, center, width):
+        """
+        'I;16' 이미지에 윈도우/레벨 적용
+
+        Returns:
+            PIL.Image: 8비트 그레이스케일('L') 이미지
+        """
+        lut = self.get(center, width)
+        return Image.fromarray(lut[np.asarray(image)], 'L')
+
+
+_shared_lut_cache = None
+_shared_lut_cache_lock = threading.Lock()
+
+
+def get_window_lut_cache():
+    """프로세스 전역에서 공유하는 WindowLUTCache 반환"""
+    global _shared_lut_cache
+    with _shared_lut_cache_lock:
+        if _shared_lut_cache is None:
+            _shared_lut_cache = WindowLUTCache()
+        return _shared_lut_cache